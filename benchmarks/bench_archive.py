@@ -0,0 +1,73 @@
+"""
+본문 아카이브 벤치마크
+
+합성 패치 노트 샘플 하나(benchmarks/data/onstove_patch_notes.html, 스토브 에디터
+마크업 형태)를 텍스트로 바꾼 뒤 앞에 회차 문구만 붙여 10,000건 저장하고, 디스크
+크기(원문 대비), 다시 열 때 색인 복원 시간, 무작위 조회(레코드 하나만 압축 해제)
+지연 시간을 측정한다.
+
+레코드는 하나씩 따로 압축하므로 압축률은 이 샘플 본문 하나의 압축률이다. 샘플은
+같은 형식의 항목이 반복되는 패치 노트라 압축이 잘 되는 편이며, 실제 본문은 길이와
+내용이 제각각이라 압축률이 더 낮을 수 있다. 모든 레코드의 크기가 같고 세그먼트가
+페이지 캐시에 올라온 상태에서 잰 조회 지연이므로 참고용 수치로만 본다.
+
+실행: python benchmarks/bench_archive.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.storage.archive import ContentArchive
+from src.storage.records import ArticleRecord
+from src.utils.html_text import html_to_text
+
+SIZE = 10_000
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "onstove_patch_notes.html")
+
+
+def main():
+    with open(DATA, encoding="utf-8") as f:
+        body = html_to_text(f.read())
+
+    records = [
+        ArticleRecord(
+            id=str(i), title=f"{i}차 업데이트 패치 노트", url=f"https://page.onstove.com/l9/global/view/{i}",
+            published_ts=1_715_731_200 - i * 3600, game="lordnine", category="update",
+            content=f"{i}차 업데이트 안내\n{body}",
+        )
+        for i in range(SIZE)
+    ]
+    raw_bytes = sum(len(record.content.encode("utf-8")) for record in records)
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = ContentArchive(directory)
+        started = time.perf_counter()
+        for record in records:
+            archive.put(record)
+        elapsed = time.perf_counter() - started
+        size = archive.size_bytes()
+        archive.close()
+
+        print(f"저장 {SIZE:,}건: {elapsed:.2f}초 ({SIZE / elapsed:,.0f}건/초)")
+        print(f"원문 {raw_bytes / 1e6:.1f}MB -> 아카이브 {size / 1e6:.1f}MB "
+              f"({raw_bytes / size:.1f}배 압축, 합성 샘플 {len(body):,}자 반복 기준)")
+
+        started = time.perf_counter()
+        archive = ContentArchive(directory)
+        print(f"다시 열기(색인 복원): {(time.perf_counter() - started) * 1000:.1f}ms")
+
+        urls = [record.url for record in random.Random(1).sample(records, 1000)]
+        seconds = min(timeit.repeat(lambda: [archive.get(url) for url in urls], number=1, repeat=5))
+        print(f"무작위 조회: {seconds / len(urls) * 1e6:.1f}µs/건 (페이지 캐시에 올라온 상태)")
+        archive.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+중복 게시글 탐지 벤치마크
+
+이력 크기(1,000 / 10,000 / 100,000건)별로 DuplicateIndex.add() 한 건의 지연
+시간을 지문 계산(제목+요약)과 구간 색인 조회로 나눠 측정한다. 구간 색인 덕분에
+이력이 커져도 조회 시간은 거의 일정해야 한다.
+
+실행: python benchmarks/bench_dedup.py
+"""
+
+import os
+import random
+import sys
+import timeit
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.storage.dedup import DuplicateIndex, _features, simhash
+from src.storage.records import ArticleRecord
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def make_records(size: int, rng: random.Random):
+    vocabulary = ["".join(chr(rng.randrange(0xAC00, 0xD7A4)) for _ in range(2)) for _ in range(5000)]
+    return [
+        ArticleRecord(
+            id=str(i), title=" ".join(rng.choices(vocabulary, k=6)), url=f"https://example.com/{i}",
+            published_ts=1_715_731_200 - i * 600, game="lordnine", category="announcement",
+            summary=" ".join(rng.choices(vocabulary, k=30)),
+        )
+        for i in range(size)
+    ]
+
+
+def main():
+    rng = random.Random(7)
+    print(f"{'이력':>10}{'지문 계산 (µs)':>16}{'색인 조회 (µs)':>16}{'add 전체 (µs)':>16}")
+    for size in SIZES:
+        index = DuplicateIndex()
+        index.add_many(make_records(size, rng))
+        probes = make_records(1000, rng)
+        fingerprints = [simhash(_features(record)) for record in probes]
+
+        fingerprint_us = min(timeit.repeat(
+            lambda: [simhash(_features(record)) for record in probes], number=1, repeat=5)) / len(probes) * 1e6
+        lookup_us = min(timeit.repeat(
+            lambda: [index._find("lordnine", fp, 1_715_731_200, "") for fp in fingerprints],
+            number=1, repeat=5)) / len(probes) * 1e6
+        add_us = min(timeit.repeat(
+            lambda: [index.add(record) for record in probes], number=1, repeat=1)) / len(probes) * 1e6
+        print(f"{size:>10,}{fingerprint_us:>16.1f}{lookup_us:>16.2f}{add_us:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
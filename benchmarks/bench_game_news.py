@@ -0,0 +1,93 @@
+"""
+GameNews 생성 비용 벤치마크
+
+BaseScraper.create_game_news()의 검증 모드(pydantic 전체 검증)와
+신뢰 모드(GameNews.from_trusted)의 게시글 1건당 생성 비용을 비교한다.
+
+실행: python benchmarks/bench_game_news.py
+"""
+
+import os
+import sys
+import timeit
+import warnings
+from datetime import datetime
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+warnings.simplefilter("ignore")
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.scrapers.lordnine import LordnineScraper
+
+
+def make_items(count: int = 24):
+    """OnStove 목록 한 페이지 분량의 게시글 데이터"""
+    return [
+        {
+            "id": str(10000000 + i),
+            "title": f"[공지] {i}월 정기 점검 안내 (연장)",
+            "url": f"https://page.onstove.com/l9/global/view/{10000000 + i}",
+            "published_at": datetime(2024, 5, 12, 10, 0),
+            "category": NewsType.ANNOUNCEMENT,
+            "summary": "안녕하세요. 로드나인입니다. 정기 점검이 진행될 예정입니다. " * 3,
+            "is_important": True,
+            "tags": ["공지", "점검"],
+            "view_count": 1234,
+        }
+        for i in range(count)
+    ]
+
+
+def bench(trusted: bool, items, number: int) -> float:
+    """게시글 1건당 평균 생성 시간 (마이크로초)"""
+    scraper = LordnineScraper()
+    scraper.trusted_ingest = trusted
+
+    def run():
+        for item in items:
+            scraper.create_game_news(**item)
+
+    total = min(timeit.repeat(run, number=number, repeat=5))
+    return total / (number * len(items)) * 1e6
+
+
+def bench_model_only(items, number: int):
+    """텍스트 정제를 제외한 모델 생성 비용 (검증, 신뢰) 마이크로초/건"""
+    fields = [dict(item, game=GameType.LORDNINE) for item in items]
+
+    def validated():
+        for item in fields:
+            GameNews(**item)
+
+    def trusted():
+        for item in fields:
+            GameNews.from_trusted(**item)
+
+    return tuple(
+        min(timeit.repeat(run, number=number, repeat=5)) / (number * len(items)) * 1e6
+        for run in (validated, trusted)
+    )
+
+
+def main():
+    items = make_items()
+    number = 2000
+
+    validated = bench(False, items, number)
+    trusted = bench(True, items, number)
+    model_validated, model_trusted = bench_model_only(items, number)
+
+    print("create_game_news (텍스트 정제 포함)")
+    print(f"  검증 모드: {validated:8.2f} us/건")
+    print(f"  신뢰 모드: {trusted:8.2f} us/건")
+    print(f"  개선 배율: {validated / trusted:8.2f}x")
+    print("GameNews 생성만")
+    print(f"  검증 모드: {model_validated:8.2f} us/건")
+    print(f"  신뢰 모드: {model_trusted:8.2f} us/건")
+    print(f"  개선 배율: {model_validated / model_trusted:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
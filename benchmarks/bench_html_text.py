@@ -0,0 +1,72 @@
+"""
+HTML 본문 -> 텍스트 변환 벤치마크
+
+기존 상세 조회 경로(BeautifulSoup html.parser + get_text + clean_text)와
+lxml 기반 html_to_text()의 변환 시간을 본문 크기별로 비교한다.
+
+기본 입력은 benchmarks/data/onstove_patch_notes.html (스토브 에디터 마크업 형태의
+패치 노트 샘플)을 1/10/30배로 이어 붙인 것이다. 실제 상세 API 응답에서 저장한
+본문(HTML 파일 또는 {"value": {"content": ...}} JSON)을 인자로 넘길 수 있다.
+
+실행: python benchmarks/bench_html_text.py [본문 파일 ...]
+"""
+
+import json
+import os
+import sys
+import timeit
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from src.utils.helpers import clean_text
+from src.utils.html_text import html_to_text
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "onstove_patch_notes.html")
+
+
+def load_body(path: str) -> str:
+    """저장된 본문 읽기 (HTML 또는 상세 API JSON)"""
+    with open(path, encoding="utf-8") as f:
+        raw = f.read()
+    if path.endswith(".json"):
+        data = json.loads(raw)
+        return data.get("value", data).get("content", "")
+    return raw
+
+
+def bs4_path(html: str) -> str:
+    """기존 경로: BeautifulSoup 파싱 후 clean_text"""
+    soup = BeautifulSoup(html, "html.parser")
+    return clean_text(soup.get_text(separator=" ", strip=True))
+
+
+def bench(func, html: str) -> float:
+    """1회 변환 평균 시간 (밀리초)"""
+    number = max(1, int(200_000 / len(html)))
+    return min(timeit.repeat(lambda: func(html), number=number, repeat=5)) / number * 1000
+
+
+def main():
+    if len(sys.argv) > 1:
+        bodies = [(os.path.basename(path), load_body(path)) for path in sys.argv[1:]]
+    else:
+        sample = load_body(SAMPLE_PATH)
+        bodies = [(f"샘플 x{n}", sample * n) for n in (1, 10, 30)]
+
+    print(f"{'본문':<24}{'크기(KB)':>10}{'bs4(ms)':>12}{'lxml(ms)':>12}{'배율':>8}")
+    for name, html in bodies:
+        size_kb = len(html.encode("utf-8")) / 1024
+        old = bench(bs4_path, html)
+        new = bench(html_to_text, html)
+        print(f"{name:<24}{size_kb:>10.1f}{old:>12.2f}{new:>12.2f}{old / new:>7.1f}x")
+
+    text = html_to_text(bodies[0][1])
+    print(f"\n변환 결과 미리보기 ({bodies[0][0]}):")
+    print("\n".join(text.splitlines()[:8]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+텍스트 정규화 처리량 벤치마크
+
+기존 clean_text(태그 정규식 + 공백 정규식)와 sanitize_html(태그 정규식 + 엔티티
+replace 반복 + 공백 정규식) 구현을 normalize_text()와 비교한다. 입력 종류별로
+초당 처리 건수와 MB/s를 출력한다.
+
+실행: python benchmarks/bench_normalize_text.py
+"""
+
+import os
+import re
+import sys
+import timeit
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.text import normalize_text
+
+HTML_ENTITIES = {
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&#39;': "'",
+    '&nbsp;': ' ',
+}
+
+
+def old_clean_text(text: str) -> str:
+    """기존 helpers.clean_text"""
+    if not text:
+        return ""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def old_sanitize_html(text: str) -> str:
+    """기존 validators.sanitize_html"""
+    if not text:
+        return ""
+    text = re.sub(r'<[^>]+>', '', text)
+    for entity, char in HTML_ENTITIES.items():
+        text = text.replace(entity, char)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+INPUTS = {
+    "제목 (마크업 없음)": [f"[공지] {i}월 {i % 28 + 1}일(수) 정기 점검 안내 (연장)" for i in range(1000)],
+    "요약 (엔티티 포함)": [
+        f"안녕하세요,&nbsp;로드나인입니다.&nbsp; {i}차 업데이트 &amp; 점검 안내 &lt;필독&gt;  " * 3
+        for i in range(1000)
+    ],
+    "본문 조각 (태그+엔티티)": [
+        f"<p><span style=\"font-size: 15px;\">{i}. 스킬 &lt;천둥의 일격&gt; 재사용 대기시간이"
+        f"&nbsp;2초 감소합니다.</span></p><p><br></p>" * 5
+        for i in range(1000)
+    ],
+}
+
+
+def throughput(func, items) -> tuple:
+    """(초당 처리 건수, MB/s)"""
+    size = sum(len(item.encode("utf-8")) for item in items)
+    seconds = min(timeit.repeat(lambda: [func(item) for item in items], number=5, repeat=5)) / 5
+    return len(items) / seconds, size / seconds / 1_000_000
+
+
+def main():
+    print(f"{'입력':<22}{'구현':<18}{'건/초':>14}{'MB/s':>10}")
+    for name, items in INPUTS.items():
+        for label, func in (
+            ("clean_text (기존)", old_clean_text),
+            ("sanitize_html (기존)", old_sanitize_html),
+            ("normalize_text", normalize_text),
+        ):
+            per_second, mb_per_second = throughput(func, items)
+            print(f"{name:<22}{label:<18}{per_second:>14,.0f}{mb_per_second:>10.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
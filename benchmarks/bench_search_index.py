@@ -0,0 +1,85 @@
+"""
+전문 검색 인덱스 벤치마크
+
+합성 게시글 10,000건(제목/요약/본문)을 색인하는 시간과, 검색어 종류별
+검색 지연 시간(ms)을 측정한다. 비교용으로 전체 목록을 순회하며 부분
+문자열을 찾는 방식(클라이언트 측 스캔)도 함께 측정한다.
+
+실행: python benchmarks/bench_search_index.py
+"""
+
+import os
+import random
+import sys
+import time
+import timeit
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.storage.records import ArticleRecord
+from src.storage.search_index import SearchIndex
+
+SIZE = 10_000
+GAMES = ("lordnine", "epic_seven", "lost_ark")
+CATEGORIES = ("announcement", "event", "update")
+# 검색 대상 단어 (본문의 약 5%)
+WORDS = (
+    "정기", "점검", "연장", "안내", "이벤트", "보상", "지급", "업데이트", "패치", "노트",
+    "신규", "캐릭터", "출시", "시즌", "종료", "오류", "수정", "사전", "예약", "PvP",
+    "레이드", "던전", "아이템", "강화", "확률", "공개", "서버", "통합", "쿠폰", "출석",
+)
+QUERIES = ("보상", "점검 연장", "보상 | 점검 연장", "업데이트 패치 노트", "pvp 시즌")
+
+
+def make_records(size: int):
+    rng = random.Random(42)
+    # 자주 나오는 게시판 단어(WORDS)와 무작위 2~3음절 단어를 섞은 어휘
+    filler = ["".join(chr(rng.randrange(0xAC00, 0xD7A4)) for _ in range(rng.randint(2, 3))) for _ in range(3000)]
+    words = lambda k: " ".join(rng.choice(WORDS) if rng.random() < 0.05 else rng.choice(filler) for _ in range(k))
+    base = 1_715_731_200
+    records = []
+    for i in range(size):
+        title = words(5)
+        summary = words(12)
+        content = "\n".join(words(15) + "합니다." for _ in range(20))
+        records.append(ArticleRecord(
+            id=str(i), title=title, url=f"https://example.com/{i}", published_ts=base - i * 60,
+            game=GAMES[i % 3], category=CATEGORIES[i % 3], summary=summary, content=content,
+        ))
+    return records
+
+
+def scan(records, query: str, limit: int = 10):
+    """클라이언트 측 스캔 (모든 단어를 포함하는 글을 찾아 최신순으로)"""
+    terms = query.lower().split()
+    hits = [
+        record for record in records
+        if all(term in f"{record.title} {record.summary} {record.content}".lower() for term in terms)
+    ]
+    hits.sort(key=lambda record: record.published_ts, reverse=True)
+    return hits[:limit]
+
+
+def main():
+    records = make_records(SIZE)
+    index = SearchIndex()
+
+    started = time.perf_counter()
+    index.add(records)
+    print(f"색인 {SIZE:,}건: {time.perf_counter() - started:.2f}초")
+
+    started = time.perf_counter()
+    index.add(records)
+    print(f"변경 없는 재색인: {(time.perf_counter() - started) * 1000:.1f}ms\n")
+
+    print(f"{'검색어':<24}{'FTS5 (ms)':>12}{'필터 game (ms)':>16}{'스캔 (ms)':>12}")
+    for query in QUERIES:
+        fts = min(timeit.repeat(lambda: index.search(query), number=10, repeat=5)) / 10 * 1000
+        filtered = min(timeit.repeat(lambda: index.search(query, game="lost_ark"), number=10, repeat=5)) / 10 * 1000
+        scanned = min(timeit.repeat(lambda: scan(records, query.replace("|", "")), number=3, repeat=3)) / 3 * 1000
+        print(f"{query:<24}{fts:>12.2f}{filtered:>16.2f}{scanned:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
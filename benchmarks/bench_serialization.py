@@ -0,0 +1,92 @@
+"""
+게시글 목록 직렬화 벤치마크
+
+기존 방식(항목별 딕셔너리 생성 + json.dumps, 항목별 model_dump + json.dumps)을
+TypeAdapter 일괄 직렬화, 필드 선택 일괄 직렬화, 캐시 레코드 직접 직렬화와
+1,000건/10,000건 목록에서 비교한다. 들여쓰기/compact 출력을 각각 측정한다.
+
+실행: python benchmarks/bench_serialization.py
+"""
+
+import json
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.storage.records import ArticleRecord
+from src.utils.serialization import news_list_to_json, news_views_to_json, records_to_json
+
+SIZES = (1_000, 10_000)
+
+
+def make_news_list(size: int):
+    base = datetime(2024, 5, 12, tzinfo=timezone.utc)
+    return [
+        GameNews(
+            id=str(i),
+            title=f"[공지] {i}차 정기 점검 안내 (연장)",
+            url=f"https://page.onstove.com/l9/global/view/{i}",
+            published_at=base - timedelta(minutes=i),
+            game=GameType.LORDNINE,
+            category=NewsType.ANNOUNCEMENT,
+            summary="안녕하세요, 로드나인입니다. 정기 점검 일정을 안내드립니다.",
+            tags=["공지", "점검"],
+            view_count=i * 7,
+        )
+        for i in range(size)
+    ]
+
+
+def old_handler_json(news_list, indent):
+    """기존 핸들러: 항목별 딕셔너리 + json.dumps"""
+    formatted = []
+    for news in news_list:
+        formatted.append({
+            "id": news.id,
+            "title": news.title,
+            "url": str(news.url),
+            "published_date": news.published_at.isoformat() if news.published_at else None,
+            "summary": news.summary,
+            "tags": news.tags,
+            "view_count": news.view_count,
+        })
+    return json.dumps(formatted, ensure_ascii=False, indent=indent)
+
+
+def old_model_dump_json(news_list, indent):
+    """기존 validators: 항목별 model_dump + json.dumps"""
+    serialized = [news.model_dump(mode="json") for news in news_list]
+    return json.dumps(serialized, ensure_ascii=False, indent=indent)
+
+
+def measure(func) -> float:
+    """1회 실행 시간 (ms)"""
+    return min(timeit.repeat(func, number=3, repeat=5)) / 3 * 1000
+
+
+def main():
+    for size in SIZES:
+        news_list = make_news_list(size)
+        records = [ArticleRecord.from_game_news(news) for news in news_list]
+        print(f"[{size:,}건]")
+        print(f"{'방식':<34}{'indent=2 (ms)':>14}{'compact (ms)':>14}")
+        for label, func in (
+            ("핸들러 딕셔너리 + json.dumps (기존)", lambda c: old_handler_json(news_list, None if c else 2)),
+            ("model_dump + json.dumps (기존)", lambda c: old_model_dump_json(news_list, None if c else 2)),
+            ("news_views_to_json", lambda c: news_views_to_json(news_list, compact=c)),
+            ("news_list_to_json (TypeAdapter)", lambda c: news_list_to_json(news_list, compact=c)),
+            ("records_to_json", lambda c: records_to_json(records, compact=c)),
+        ):
+            indented = measure(lambda: func(False))
+            compact = measure(lambda: func(True))
+            print(f"{label:<34}{indented:>14.2f}{compact:>14.2f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
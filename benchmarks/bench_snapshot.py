@@ -0,0 +1,71 @@
+"""
+캐시 스냅샷 벤치마크
+
+게임 5개 x 카테고리 3개 목록(각 20건)과 본문이 든 상세 300건을 캐시에 넣고 스냅샷
+저장 시간/파일 크기와, 재시작 시 읽어서 캐시에 복원하는 시간을 측정한다.
+
+상세 본문은 합성 패치 노트 샘플 하나(benchmarks/data/onstove_patch_notes.html)에 회차
+문구만 붙여 반복한 것이다. 스냅샷 전체를 gzip 스트림 하나로 압축하므로 같은 본문의
+반복은 거의 공짜로 압축되어, 파일 크기는 본문이 제각각인 실제 캐시보다 훨씬 작게
+나온다. 시간 측정도 참고용 수치로만 본다.
+
+실행: python benchmarks/bench_snapshot.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.storage.cache import TTLCache
+from src.storage.records import ArticleRecord
+from src.storage.snapshot import collect_entries, read_snapshot, restore_entries, write_snapshot
+from src.utils.html_text import html_to_text
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "onstove_patch_notes.html")
+GAMES = ["lordnine", "epic_seven", "lost_ark", "game_4", "game_5"]
+CATEGORIES = ["announcement", "event", "update"]
+
+
+def main():
+    with open(DATA, encoding="utf-8") as f:
+        body = html_to_text(f.read())
+
+    caches = {"lists": TTLCache(300), "details": TTLCache(300)}
+    for game in GAMES:
+        for category in CATEGORIES:
+            records = tuple(
+                ArticleRecord(
+                    id=str(i), title=f"{i}번 게시글", url=f"https://example.com/{game}/{category}/{i}",
+                    published_ts=1_715_731_200 - i * 3600, game=game, category=category,
+                    summary="요약 " * 20, tags=("공지",),
+                )
+                for i in range(20)
+            )
+            caches["lists"].set((game, category), records)
+            for record in records:
+                detail = ArticleRecord.from_tuple(record.as_tuple())
+                detail.content = f"{record.id}번 안내\n{body}"
+                caches["details"].set((game, category, record.url), detail)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "snapshot.json.gz")
+
+        started = time.perf_counter()
+        count = write_snapshot(path, collect_entries(caches))
+        print(f"저장 {count}개 항목: {(time.perf_counter() - started) * 1000:.1f}ms, "
+              f"{os.path.getsize(path) / 1e3:.0f}KB (같은 합성 본문 반복 기준)")
+
+        started = time.perf_counter()
+        restored = restore_entries(
+            {"lists": TTLCache(300), "details": TTLCache(300)},
+            read_snapshot(path, max_age=86400)
+        )
+        print(f"복원 {restored}개 항목: {(time.perf_counter() - started) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
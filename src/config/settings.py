@@ -16,10 +16,66 @@ class Settings:
     # 캐싱 설정
     CACHE_TTL: int = int(os.getenv("CACHE_TTL", "300"))  # 5분
     ENABLE_CACHE: bool = os.getenv("ENABLE_CACHE", "true").lower() == "true"
+    # 목록/상세 캐시별 최대 항목 수 (넘으면 가장 오래 쓰이지 않은 항목부터 삭제)
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "2000"))
+    # 만료된 캐시 항목을 장애 시 응답용으로 보관할 시간 (초, 지나면 삭제)
+    CACHE_MAX_STALE: int = int(os.getenv("CACHE_MAX_STALE", "86400"))
+    
+    # 수집한 게시글 전문 검색 인덱스 (SQLite FTS5, 경로 미지정 시 메모리)
+    ENABLE_SEARCH_INDEX: bool = os.getenv("ENABLE_SEARCH_INDEX", "true").lower() == "true"
+    SEARCH_INDEX_PATH: str = os.getenv("SEARCH_INDEX_PATH", ":memory:")
+    
+    # 게시글 본문 아카이브 디렉터리 (미지정 시 사용 안 함)
+    ARCHIVE_DIR: str = os.getenv("ARCHIVE_DIR", "")
+    # 발행 후 이 일수가 지난 게시글은 아카이브에 있으면 네트워크 없이 상세 응답
+    ARCHIVE_AFTER_DAYS: int = int(os.getenv("ARCHIVE_AFTER_DAYS", "7"))
+    
+    # 목록/상세 캐시 스냅샷 파일 (미지정 시 사용 안 함, 재시작 시 캐시 복원)
+    SNAPSHOT_PATH: str = os.getenv("SNAPSHOT_PATH", "")
+    # 스냅샷 저장 주기 (초, 캐시가 바뀌지 않았으면 건너뜀)
+    SNAPSHOT_INTERVAL: int = int(os.getenv("SNAPSHOT_INTERVAL", "60"))
+    # 이보다 오래전에 저장된 항목은 복원하지 않음 (초, 만료되었어도 이 안이면 장애 시 응답용으로 복원)
+    SNAPSHOT_MAX_AGE: int = int(os.getenv("SNAPSHOT_MAX_AGE", "86400"))
+    
+    # 인기 급상승(조회수 증가량) 계산 구간 (시간)
+    TRENDING_WINDOW_HOURS: float = float(os.getenv("TRENDING_WINDOW_HOURS", "6"))
+    
+    # 시작 시 캐시 미리 채우기 (warm-up)
+    PREFETCH_ON_STARTUP: bool = os.getenv("PREFETCH_ON_STARTUP", "false").lower() == "true"
+    # 미리 채울 게임/카테고리 (쉼표 구분, 미지정 시 활성화된 전체 게임/카테고리)
+    PREFETCH_GAMES = [g.strip() for g in os.getenv("PREFETCH_GAMES", "").split(",") if g.strip()]
+    PREFETCH_CATEGORIES = [c.strip() for c in os.getenv("PREFETCH_CATEGORIES", "").split(",") if c.strip()]
+    # 목록별로 상세 정보까지 미리 가져올 상위 게시글 수 (0이면 목록만)
+    PREFETCH_DETAIL_TOP_N: int = int(os.getenv("PREFETCH_DETAIL_TOP_N", "0"))
     
     # 성능 설정
     MAX_CONCURRENT_REQUESTS: int = int(os.getenv("MAX_CONCURRENT_REQUESTS", "10"))
     REQUEST_TIMEOUT: int = int(os.getenv("REQUEST_TIMEOUT", "30"))
+    # 업스트림 장애 시 재시도 횟수와 간격 (decorrelated jitter, 초)
+    MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "2"))
+    RETRY_BASE_DELAY: float = float(os.getenv("RETRY_BASE_DELAY", "0.2"))
+    RETRY_MAX_DELAY: float = float(os.getenv("RETRY_MAX_DELAY", "5"))
+    # 엔드포인트별 서킷 브레이커: 연속 실패 횟수 기준 / 차단 후 시험 요청까지의 시간 (초)
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RESET_TIMEOUT: float = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+    # OnStove 목록 요청에 본문 포함 (content_yn). 켜면 목록의 본문으로 상세 캐시를 채워
+    # 최근 목록에 있던 게시글은 상세 API를 호출하지 않음. 끄면 목록 응답 크기가 줄어듦
+    LIST_INCLUDE_CONTENT: bool = os.getenv("LIST_INCLUDE_CONTENT", "true").lower() == "true"
+    # 상세 조회 헤지 요청: 첫 요청이 최근 응답 시간의 분위수 안에 끝나지 않으면 한 번 더 요청
+    ENABLE_HEDGING: bool = os.getenv("ENABLE_HEDGING", "false").lower() == "true"
+    HEDGE_PERCENTILE: float = float(os.getenv("HEDGE_PERCENTILE", "0.9"))
+    # 헤지로 늘어나는 요청 수의 상한 (전체 상세 요청 대비 비율)
+    HEDGE_BUDGET_RATIO: float = float(os.getenv("HEDGE_BUDGET_RATIO", "0.1"))
+    HEDGE_MIN_SAMPLES: int = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+    # 같은 호스트로 보내는 최대 동시 요청 수 (스크래퍼 전체 공유)
+    MAX_REQUESTS_PER_HOST: int = int(os.getenv("MAX_REQUESTS_PER_HOST", "4"))
+    # 게시판 여러 페이지 조회 시 한 번에 요청할 페이지 수 / 최대 페이지 수
+    PAGE_FETCH_CONCURRENCY: int = int(os.getenv("PAGE_FETCH_CONCURRENCY", "4"))
+    MAX_HISTORY_PAGES: int = int(os.getenv("MAX_HISTORY_PAGES", "20"))
+    # 스크래퍼가 정규화한 데이터는 pydantic 검증 없이 GameNews 생성
+    TRUSTED_INGEST: bool = os.getenv("TRUSTED_INGEST", "true").lower() == "true"
+    # 도구 호출 1회의 전체 마감 시간 (재시도, fallback, 브라우저 대기 포함)
+    TOOL_DEADLINE: float = float(os.getenv("TOOL_DEADLINE", "45"))
     
     # HTTP 클라이언트 설정
     USER_AGENT: str = os.getenv(
@@ -29,6 +85,12 @@ class Settings:
     
     # 게임별 설정
     SUPPORTED_GAMES = ["lordnine", "epic_seven", "lost_ark"]
+    # 서비스할 게임 (쉼표 구분, 미지정 시 전체)
+    ENABLED_GAMES = [
+        game.strip()
+        for game in os.getenv("ENABLED_GAMES", ",".join(SUPPORTED_GAMES)).split(",")
+        if game.strip()
+    ]
     
     # API 엔드포인트 설정
     LORDNINE_API_BASE = "https://api.onstove.com"
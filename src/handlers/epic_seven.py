@@ -2,12 +2,12 @@
 에픽세븐 게임 핸들러
 """
 
-import json
 from typing import Sequence
 from mcp import types
 
 from .base import BaseHandler
 from src.scrapers.epic_seven import EpicSevenScraper
+from src.utils.serialization import DETAIL_FIELDS, dumps, news_view, news_views_to_json
 
 
 class EpicSevenHandler(BaseHandler):
@@ -25,22 +25,9 @@ class EpicSevenHandler(BaseHandler):
             if not news_list:
                 return self._create_error_response("공지사항을 찾을 수 없습니다")
             
-            # 결과를 JSON 형태로 포맷팅
-            formatted_news = []
-            for news in news_list:
-                formatted_news.append({
-                    "id": news.id,
-                    "title": news.title,
-                    "url": str(news.url),
-                    "published_date": news.published_at.isoformat() if news.published_at else None,
-                    "summary": news.summary,
-                    "tags": news.tags,
-                    "view_count": news.view_count
-                })
-            
             return self._create_success_response(
                 f"에픽세븐 공지사항 {len(news_list)}개를 가져왔습니다.\n\n" +
-                json.dumps(formatted_news, ensure_ascii=False, indent=2)
+                news_views_to_json(news_list)
             )
             
         except Exception as e:
@@ -54,21 +41,9 @@ class EpicSevenHandler(BaseHandler):
             if not news_detail:
                 return self._create_error_response("공지사항 상세 정보를 찾을 수 없습니다")
             
-            formatted_detail = {
-                "id": news_detail.id,
-                "title": news_detail.title,
-                "url": str(news_detail.url),
-                "published_date": news_detail.published_at.isoformat() if news_detail.published_at else None,
-                "summary": news_detail.summary,
-                "content": news_detail.content,
-                "tags": news_detail.tags,
-                "view_count": news_detail.view_count,
-                "category": news_detail.category.value if news_detail.category else None
-            }
-            
             return self._create_success_response(
                 f"에픽세븐 공지사항 상세 정보:\n\n" +
-                json.dumps(formatted_detail, ensure_ascii=False, indent=2)
+                dumps(news_view(news_detail, DETAIL_FIELDS))
             )
             
         except Exception as e:
@@ -82,22 +57,9 @@ class EpicSevenHandler(BaseHandler):
             if not news_list:
                 return self._create_error_response("이벤트를 찾을 수 없습니다")
             
-            # 결과를 JSON 형태로 포맷팅
-            formatted_news = []
-            for news in news_list:
-                formatted_news.append({
-                    "id": news.id,
-                    "title": news.title,
-                    "url": str(news.url),
-                    "published_date": news.published_at.isoformat() if news.published_at else None,
-                    "summary": news.summary,
-                    "tags": news.tags,
-                    "view_count": news.view_count
-                })
-            
             return self._create_success_response(
                 f"에픽세븐 이벤트 {len(news_list)}개를 가져왔습니다.\n\n" +
-                json.dumps(formatted_news, ensure_ascii=False, indent=2)
+                news_views_to_json(news_list)
             )
             
         except Exception as e:
@@ -111,21 +73,9 @@ class EpicSevenHandler(BaseHandler):
             if not news_detail:
                 return self._create_error_response("이벤트 상세 정보를 찾을 수 없습니다")
             
-            formatted_detail = {
-                "id": news_detail.id,
-                "title": news_detail.title,
-                "url": str(news_detail.url),
-                "published_date": news_detail.published_at.isoformat() if news_detail.published_at else None,
-                "summary": news_detail.summary,
-                "content": news_detail.content,
-                "tags": news_detail.tags,
-                "view_count": news_detail.view_count,
-                "category": news_detail.category.value if news_detail.category else None
-            }
-            
             return self._create_success_response(
                 f"에픽세븐 이벤트 상세 정보:\n\n" +
-                json.dumps(formatted_detail, ensure_ascii=False, indent=2)
+                dumps(news_view(news_detail, DETAIL_FIELDS))
             )
             
         except Exception as e:
@@ -139,22 +89,9 @@ class EpicSevenHandler(BaseHandler):
             if not news_list:
                 return self._create_error_response("업데이트를 찾을 수 없습니다")
             
-            # 결과를 JSON 형태로 포맷팅
-            formatted_news = []
-            for news in news_list:
-                formatted_news.append({
-                    "id": news.id,
-                    "title": news.title,
-                    "url": str(news.url),
-                    "published_date": news.published_at.isoformat() if news.published_at else None,
-                    "summary": news.summary,
-                    "tags": news.tags,
-                    "view_count": news.view_count
-                })
-            
             return self._create_success_response(
                 f"에픽세븐 업데이트 {len(news_list)}개를 가져왔습니다.\n\n" +
-                json.dumps(formatted_news, ensure_ascii=False, indent=2)
+                news_views_to_json(news_list)
             )
             
         except Exception as e:
@@ -168,21 +105,9 @@ class EpicSevenHandler(BaseHandler):
             if not news_detail:
                 return self._create_error_response("업데이트 상세 정보를 찾을 수 없습니다")
             
-            formatted_detail = {
-                "id": news_detail.id,
-                "title": news_detail.title,
-                "url": str(news_detail.url),
-                "published_date": news_detail.published_at.isoformat() if news_detail.published_at else None,
-                "summary": news_detail.summary,
-                "content": news_detail.content,
-                "tags": news_detail.tags,
-                "view_count": news_detail.view_count,
-                "category": news_detail.category.value if news_detail.category else None
-            }
-            
             return self._create_success_response(
                 f"에픽세븐 업데이트 상세 정보:\n\n" +
-                json.dumps(formatted_detail, ensure_ascii=False, indent=2)
+                dumps(news_view(news_detail, DETAIL_FIELDS))
             )
             
         except Exception as e:
@@ -10,6 +10,8 @@ from .exceptions import (
     UnsupportedGameException,
     ApiException,
     TimeoutException,
+    DeadlineExceededException,
+    CircuitOpenException,
     RateLimitException,
     ContentNotFoundException,
     InvalidUrlException
@@ -30,6 +32,8 @@ __all__ = [
     "UnsupportedGameException",
     "ApiException",
     "TimeoutException",
+    "DeadlineExceededException",
+    "CircuitOpenException",
     "RateLimitException",
     "ContentNotFoundException",
     "InvalidUrlException",
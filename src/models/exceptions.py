@@ -51,6 +51,17 @@ class TimeoutException(NetworkException):
         super().__init__(message)
         self.timeout_seconds = timeout_seconds
 
+class DeadlineExceededException(TimeoutException):
+    """도구 호출 전체 마감 시간 초과 예외"""
+    pass
+
+class CircuitOpenException(NetworkException):
+    """업스트림 엔드포인트 차단(서킷 브레이커 open) 예외"""
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"업스트림 장애로 요청을 일시 중단했습니다: {endpoint} ({retry_after:.0f}초 후 재시도)")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
 class RateLimitException(NetworkException):
     """요청 제한 관련 예외"""
     def __init__(self, message: str, retry_after: Optional[int] = None):
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, HttpUrl, Field, field_validator, ConfigDict
-from datetime import datetime
+from pydantic import BaseModel, HttpUrl, Field, field_validator, field_serializer, ConfigDict
+from datetime import datetime, timezone
 from typing import Optional, List
 from enum import Enum
 
@@ -47,7 +47,8 @@ class GameNews(BaseModel):
     @classmethod
     def validate_published_at(cls, v):
         """발행 일시 검증"""
-        if v > datetime.now():
+        now = datetime.now(timezone.utc) if v.tzinfo is not None else datetime.now()
+        if v > now:
             raise ValueError("발행 일시는 현재 시간보다 미래일 수 없습니다")
         return v
     
@@ -59,6 +60,11 @@ class GameNews(BaseModel):
             raise ValueError("조회수는 0 이상이어야 합니다")
         return v
     
+    @field_serializer('url')
+    def serialize_url(self, v) -> str:
+        """URL 직렬화 (검증 없이 생성된 문자열 URL도 동일하게 처리)"""
+        return str(v)
+    
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
         return self.model_dump()
@@ -70,4 +76,48 @@ class GameNews(BaseModel):
     @classmethod
     def from_dict(cls, data: dict) -> 'GameNews':
         """딕셔너리에서 생성"""
-        return cls(**data) 
\ No newline at end of file
+        return cls(**data)
+    
+    @classmethod
+    def from_trusted(
+        cls,
+        id: str,
+        title: str,
+        url: str,
+        published_at: datetime,
+        game: GameType,
+        category: NewsType,
+        content: Optional[str] = None,
+        summary: Optional[str] = None,
+        is_important: bool = False,
+        tags: Optional[List[str]] = None,
+        view_count: Optional[int] = None
+    ) -> 'GameNews':
+        """검증 없이 생성 (스크래퍼가 이미 정규화한 데이터 전용)
+        
+        필드 검증기를 실행하지 않으므로 외부 입력에는 사용하지 않는다.
+        외부 데이터는 생성자나 from_dict()로 검증해야 한다. url은 HttpUrl로
+        파싱하지 않고 문자열 그대로 보관한다.
+        """
+        news = cls.__new__(cls)
+        # model_construct()와 같은 내부 속성을 직접 채워 필드별 처리 비용을 없앤다
+        object.__setattr__(news, '__dict__', {
+            'id': id,
+            'title': title,
+            'content': content,
+            'summary': summary,
+            'url': url,
+            'published_at': published_at,
+            'game': getattr(game, 'value', game),
+            'category': getattr(category, 'value', category),
+            'is_important': is_important,
+            'tags': tags if tags is not None else [],
+            'view_count': view_count,
+        })
+        object.__setattr__(news, '__pydantic_fields_set__', set(_ALL_FIELDS))
+        object.__setattr__(news, '__pydantic_extra__', None)
+        object.__setattr__(news, '__pydantic_private__', None)
+        return news
+
+
+_ALL_FIELDS = frozenset(GameNews.model_fields) 
\ No newline at end of file
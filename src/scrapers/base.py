@@ -1,19 +1,33 @@
 """게임 스크래퍼 기본 클래스"""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 import httpx
 import asyncio
+import time
 from datetime import datetime
 
+from src.config.settings import settings
 from src.models.game_news import GameNews, GameType, NewsType
 from src.models.exceptions import (
     NetworkException, 
     TimeoutException, 
+    DeadlineExceededException,
     ApiException,
-    ScrapingException
+    ScrapingException,
+    ValidationException
 )
-from src.utils.helpers import parse_timestamp, normalize_url, clean_text
+from src.utils.helpers import parse_timestamp, normalize_url, stable_article_id
+from src.utils.text import normalize_text
+from src.utils.deadline import check_deadline, bounded_timeout, remaining_time
+from src.utils.html_text import html_to_text
+from src.utils.host_limiter import host_limiter
+from src.utils.hedging import hedger
+from src.utils.resilience import CLOSED, RetryPolicy, circuit_breakers, endpoint_key, is_upstream_failure
+
+# 상세 조회 fallback용으로 기억할 최근 목록 게시글 수
+LISTED_INDEX_SIZE = 2000
+
 
 class BaseScraper(ABC):
     """게임 스크래퍼 기본 추상 클래스"""
@@ -27,6 +41,12 @@ class BaseScraper(ABC):
         self.game_type = game_type
         self.timeout = timeout
         self.session: Optional[httpx.AsyncClient] = None
+        # 업스트림 장애 시 재시도 정책
+        self.retry_policy = RetryPolicy()
+        # 최근 목록에서 본 게시글 (ID -> (조회 시각, 게시글)), 상세 조회 fallback용
+        self._listed: Dict[str, Tuple[float, GameNews]] = {}
+        # 정규화된 스크래핑 결과는 검증 없이 생성 (외부 입력 검증은 validators에서 수행)
+        self.trusted_ingest = settings.TRUSTED_INGEST
         
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
@@ -62,12 +82,18 @@ class BaseScraper(ABC):
             'Upgrade-Insecure-Requests': '1',
         }
     
-    async def make_request(self, url: str, method: str = 'GET', **kwargs) -> httpx.Response:
-        """HTTP 요청 실행
+    async def make_request(self, url: str, method: str = 'GET',
+                           retry_policy: Optional[RetryPolicy] = None, **kwargs) -> httpx.Response:
+        """HTTP 요청 실행 (엔드포인트 서킷 브레이커 + 업스트림 장애 시 재시도)
+        
+        엔드포인트가 차단 중이면 요청하지 않고 즉시 CircuitOpenException을 낸다.
+        네트워크 오류/타임아웃/5xx/429는 재시도 정책에 따라 다시 시도하되, 브레이커가
+        닫힌 상태가 아니거나 남은 마감 시간이 부족하면 더 기다리지 않는다.
         
         Args:
             url: 요청 URL
             method: HTTP 메서드
+            retry_policy: 재시도 정책 (기본값: 스크래퍼 기본 정책)
             **kwargs: 추가 요청 파라미터
             
         Returns:
@@ -76,17 +102,80 @@ class BaseScraper(ABC):
         Raises:
             NetworkException: 네트워크 오류
             TimeoutException: 타임아웃 오류
+            DeadlineExceededException: 도구 호출 마감 시간 초과
+            CircuitOpenException: 엔드포인트 차단 중
             ApiException: API 오류
         """
+        breaker = circuit_breakers.get(url)
+        delays = (retry_policy or self.retry_policy).delays()
+        
+        while True:
+            check_deadline(url)
+            breaker.before_call()
+            try:
+                response = await self._send(url, method, **kwargs)
+            except (NetworkException, ApiException) as e:
+                if not is_upstream_failure(e):
+                    if not isinstance(e, DeadlineExceededException):
+                        # 4xx 등은 엔드포인트가 응답한 것이므로 정상으로 집계
+                        breaker.record_success()
+                    raise
+                breaker.record_failure()
+                delay = next(delays, None)
+                remaining = remaining_time()
+                if (delay is None or breaker.state != CLOSED
+                        or (remaining is not None and remaining <= delay)):
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            
+            breaker.record_success()
+            return response
+    
+    async def hedged_request(self, url: str, **kwargs) -> httpx.Response:
+        """지연 꼬리가 긴 엔드포인트용 HTTP 요청 (ENABLE_HEDGING이면 헤지 요청 사용)
+        
+        첫 요청이 최근 응답 시간의 p90 안에 끝나지 않으면 같은 요청을 하나 더 보내
+        먼저 성공한 응답을 쓴다. 멱등한 GET 요청에만 사용한다.
+        
+        Args:
+            url: 요청 URL
+            **kwargs: make_request 파라미터
+            
+        Returns:
+            httpx.Response: 응답 객체
+        """
+        if not settings.ENABLE_HEDGING:
+            return await self.make_request(url, **kwargs)
+        return await hedger.run(endpoint_key(url), lambda: self.make_request(url, **kwargs))
+    
+    async def _send(self, url: str, method: str = 'GET', **kwargs) -> httpx.Response:
+        """HTTP 요청 1회 전송 (호스트 동시 요청 제한, 마감 시간 적용)"""
         if not self.session:
             await self.init_session()
         
         try:
             assert self.session is not None
-            response = await self.session.request(method, url, **kwargs)
+            # 개별 요청 타임아웃도 남은 마감 시간을 넘지 않도록 제한
+            kwargs.setdefault('timeout', bounded_timeout(self.timeout))
+            # 같은 호스트로의 동시 요청 수는 스크래퍼 전체에서 제한
+            async with host_limiter.slot(url):
+                started = time.monotonic()
+                request = self.session.request(method, url, **kwargs)
+                remaining = remaining_time()
+                if remaining is None:
+                    response = await request
+                else:
+                    # 마감 시 진행 중인 요청을 취소하여 연결을 반환
+                    response = await asyncio.wait_for(request, timeout=remaining)
+                elapsed = time.monotonic() - started
             response.raise_for_status()
+            # 헤지 대기 시간(p90) 산정용 요청 1회의 응답 시간 (재시도 대기 제외)
+            hedger.tracker(endpoint_key(url)).record(elapsed)
             return response
             
+        except asyncio.TimeoutError as e:
+            raise DeadlineExceededException(f"요청 처리 시간 초과: {url}", self.timeout) from e
         except httpx.TimeoutException as e:
             raise TimeoutException(f"요청 타임아웃: {url}", self.timeout) from e
         except httpx.HTTPStatusError as e:
@@ -98,6 +187,23 @@ class BaseScraper(ABC):
         except httpx.RequestError as e:
             raise NetworkException(f"네트워크 오류: {url}") from e
     
+    def make_article_id(self, url: str, native_id: Optional[str] = None) -> str:
+        """게시글 ID 결정
+        
+        게시판이 제공하는 ID가 있으면 그대로 쓰고, 없으면 URL에서 계산한
+        안정 ID를 사용한다 (프로세스가 달라도 같은 값).
+        
+        Args:
+            url: 게시글 URL
+            native_id: 게시판 자체 ID (없으면 None)
+            
+        Returns:
+            str: 게시글 ID
+        """
+        if native_id:
+            return str(native_id)
+        return stable_article_id(url)
+    
     def create_game_news(
         self,
         id: str,
@@ -127,13 +233,40 @@ class BaseScraper(ABC):
             
         Returns:
             GameNews: 생성된 뉴스 객체
+            
+        Raises:
+            ValidationException: 제목이 비어 있는 경우 (신뢰 모드)
         """
-        return GameNews(
+        title = normalize_text(title)
+        content = html_to_text(content) if content else None  # 문단/목록 줄바꿈 유지
+        summary = normalize_text(summary) if summary else None
+        url = normalize_url(url)
+        
+        if not self.trusted_ingest:
+            return GameNews(
+                id=id,
+                title=title,
+                content=content,
+                summary=summary,
+                url=url,
+                published_at=published_at,
+                game=self.game_type,
+                category=category,
+                is_important=is_important,
+                tags=tags or [],
+                view_count=view_count
+            )
+        
+        # 스크래퍼가 만든 값은 이미 정규화되어 있으므로 검증기를 다시 실행하지 않음
+        if not title:
+            raise ValidationException("제목은 필수입니다")
+        
+        return GameNews.from_trusted(
             id=id,
-            title=clean_text(title),
-            content=clean_text(content) if content else None,
-            summary=clean_text(summary) if summary else None,
-            url=normalize_url(url),
+            title=title,
+            content=content,
+            summary=summary,
+            url=url,
             published_at=published_at,
             game=self.game_type,
             category=category,
@@ -145,9 +278,12 @@ class BaseScraper(ABC):
     # 추상 메서드들 - 각 게임 스크래퍼에서 구현해야 함
     
     @abstractmethod
-    async def get_announcements(self) -> List[GameNews]:
+    async def get_announcements(self, since_id: Optional[str] = None) -> List[GameNews]:
         """공지사항 목록 조회
         
+        Args:
+            since_id: 이미 알고 있는 최신 게시글 ID (도달하면 수집 중단)
+            
         Returns:
             List[GameNews]: 공지사항 목록
         """
@@ -166,9 +302,12 @@ class BaseScraper(ABC):
         pass
     
     @abstractmethod
-    async def get_events(self) -> List[GameNews]:
+    async def get_events(self, since_id: Optional[str] = None) -> List[GameNews]:
         """이벤트 목록 조회
         
+        Args:
+            since_id: 이미 알고 있는 최신 게시글 ID (도달하면 수집 중단)
+            
         Returns:
             List[GameNews]: 이벤트 목록
         """
@@ -187,9 +326,12 @@ class BaseScraper(ABC):
         pass
     
     @abstractmethod
-    async def get_updates(self) -> List[GameNews]:
+    async def get_updates(self, since_id: Optional[str] = None) -> List[GameNews]:
         """업데이트 목록 조회
         
+        Args:
+            since_id: 이미 알고 있는 최신 게시글 ID (도달하면 수집 중단)
+            
         Returns:
             List[GameNews]: 업데이트 목록
         """
@@ -216,33 +358,135 @@ class BaseScraper(ABC):
         delay: float = 1.0,
         **kwargs
     ) -> httpx.Response:
-        """재시도 기능이 있는 HTTP 요청
+        """재시도 횟수/간격을 지정한 HTTP 요청
         
         Args:
             url: 요청 URL
             max_retries: 최대 재시도 횟수
-            delay: 재시도 간격 (초)
+            delay: 최소 재시도 간격 (초, decorrelated jitter로 늘어남)
             **kwargs: 추가 요청 파라미터
             
         Returns:
             httpx.Response: 응답 객체
         """
-        last_exception: Optional[Exception] = None
+        policy = RetryPolicy(max_retries=max_retries, base_delay=delay, max_delay=max(delay, settings.RETRY_MAX_DELAY))
+        return await self.make_request(url, retry_policy=policy, **kwargs)
+    
+    def remember_listed(self, news_list: Iterable[GameNews]) -> None:
+        """목록에서 가져온 게시글을 ID 색인에 저장 (상세 조회 fallback용)
         
-        for attempt in range(max_retries + 1):
-            try:
-                return await self.make_request(url, **kwargs)
-            except (NetworkException, TimeoutException) as e:
-                last_exception = e
-                if attempt < max_retries:
-                    await asyncio.sleep(delay * (2 ** attempt))  # 지수 백오프
+        Args:
+            news_list: 목록에서 파싱한 게시글
+        """
+        now = time.monotonic()
+        listed = self._listed
+        for news in news_list:
+            # 다시 넣어 최근 순서 유지 (넘치면 가장 오래전에 본 것부터 삭제)
+            listed.pop(news.id, None)
+            listed[news.id] = (now, news)
+        while len(listed) > LISTED_INDEX_SIZE:
+            del listed[next(iter(listed))]
+    
+    def find_listed(self, article_id: str, max_age: Optional[float] = None) -> Optional[GameNews]:
+        """최근 목록에서 본 게시글 조회
+        
+        Args:
+            article_id: 게시글 ID
+            max_age: 이보다 오래전에(초) 목록에서 본 게시글은 무시 (None이면 제한 없음)
+            
+        Returns:
+            Optional[GameNews]: 목록에서 파싱한 게시글 (공유 객체이므로 수정하지 말 것)
+        """
+        entry = self._listed.get(article_id)
+        if entry is None or (max_age is not None and time.monotonic() - entry[0] > max_age):
+            return None
+        return entry[1]
+    
+    def is_known_article(self, article_id: str, since_id: Optional[str], pinned: bool = False) -> bool:
+        """이미 수집한 게시글에 도달했는지 판단
+        
+        목록은 최신순으로 정렬되어 있으므로 since_id 게시글 이후의 항목은 모두
+        이전에 받은 게시글이다. since_id 게시글 자체는 커서 계산을 위해 목록에 포함하고
+        그 다음부터 수집을 중단한다. 상단 고정 게시글은 정렬 순서와 무관하므로 제외한다.
+        
+        Args:
+            article_id: 현재 게시글 ID
+            since_id: 클라이언트가 마지막으로 받은 게시글 ID
+            pinned: 상단 고정 게시글 여부
+            
+        Returns:
+            bool: 수집을 중단해야 하는지 여부
+        """
+        return bool(since_id) and not pinned and article_id == since_id
+    
+    async def fetch_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[Tuple[List[Tuple[GameNews, bool]], int]]],
+        page_size: int,
+        max_pages: int,
+        until_ts: Optional[int] = None,
+        concurrency: int = settings.PAGE_FETCH_CONCURRENCY
+    ) -> Tuple[List[GameNews], bool]:
+        """최신순 게시판의 여러 페이지를 동시에 가져와 병합
+        
+        1페이지를 먼저 받아 페이지당 시간 폭으로 until_ts까지 필요한 페이지 수를 어림한 뒤,
+        남은 페이지를 concurrency개씩 동시에 요청한다(실제 동시 요청 수는 호스트 제한기가
+        한 번 더 제한). 상단 고정 게시글은 페이지마다 반복되므로 ID로 중복을 제거하고,
+        고정 글을 뺀 마지막 게시글이 until_ts보다 오래되었거나 페이지가 덜 찼으면 중단한다.
+        페이지가 찼는지는 파싱에 실패한 게시글을 포함한 원본 게시글 수로 판단한다.
+        
+        Args:
+            fetch_page: 페이지 번호(1부터) -> ([(게시글, 상단 고정 여부)], 원본 게시글 수)
+            page_size: 페이지당 게시글 수 (덜 찬 페이지는 마지막 페이지)
+            max_pages: 최대 페이지 수
+            until_ts: 이 시각(epoch 초)보다 오래된 게시글이 나오는 페이지까지만 조회
+            concurrency: 한 번에 요청할 페이지 수
+            
+        Returns:
+            Tuple[List[GameNews], bool]: 페이지 순서대로 병합한 게시글 (중복 제거)과
+                게시판 끝(덜 찬 페이지)에 도달했는지 여부. 마지막 페이지의 until_ts 이전
+                게시글도 포함하므로, 마지막 게시글 시각부터 지금까지는 빠짐없이 확인한 구간이다
+        """
+        seen = set()
+        merged: List[GameNews] = []
+        exhausted = False
+        
+        def absorb(page: Tuple[List[Tuple[GameNews, bool]], int]) -> bool:
+            """페이지 결과 병합, 더 볼 필요가 없으면 True"""
+            nonlocal exhausted
+            items, count = page
+            for news, _ in items:
+                if news.id in seen:
                     continue
-                raise
+                seen.add(news.id)
+                merged.append(news)
+            if count < page_size:
+                exhausted = True
+                return True
+            regular = [news for news, pinned in items if not pinned]
+            return until_ts is not None and bool(regular) and regular[-1].published_at.timestamp() < until_ts
+        
+        first = await fetch_page(1)
+        if absorb(first) or max_pages <= 1:
+            return merged, exhausted
+        
+        # 1페이지의 시간 폭으로 until_ts까지 남은 페이지 수 어림 (과도한 선요청 방지)
+        batch = concurrency
+        regular = [news.published_at.timestamp() for news, pinned in first[0] if not pinned]
+        span = regular[0] - regular[-1] if regular else 0
+        if until_ts is not None and span > 0:
+            batch = max(1, min(concurrency, -(-(regular[-1] - until_ts) // span)))
+        
+        page = 2
+        while page <= max_pages:
+            numbers = range(page, min(page + int(batch), max_pages + 1))
+            results = await asyncio.gather(*(fetch_page(number) for number in numbers))
+            page += len(numbers)
+            if any([absorb(result) for result in results]):
+                break
+            batch = concurrency
         
-        if last_exception:
-            raise last_exception
-        else:
-            raise NetworkException(f"재시도 실패: {url}")
+        return merged, exhausted
     
     def validate_response_data(self, data: dict, required_fields: List[str]) -> bool:
         """응답 데이터 검증
@@ -1,13 +1,31 @@
 """에픽세븐 게임 스크래퍼"""
 
 import re
-from typing import List, Optional, Dict, Any
+import time
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
+from src.config.settings import settings
 from src.scrapers.base import BaseScraper
 from src.models.game_news import GameNews, GameType, NewsType
-from src.models.exceptions import ScrapingException, ApiException
-from src.utils.helpers import parse_timestamp, clean_text
+from src.models.exceptions import (
+    ScrapingException, ApiException, DeadlineExceededException, CircuitOpenException
+)
+from src.utils.timestamps import parse_timestamp, KST
+from src.utils.deadline import check_deadline
+from src.utils.classifier import KeywordClassifier, Classification, IMPORTANT
+
+# 제목 분류 규칙 (말머리 + 키워드 태그 / 중요 키워드)
+TITLE_CLASSIFIER = KeywordClassifier(
+    tags={keyword: [keyword] for keyword in ['점검', '업데이트', '패치', '이벤트', '출시', '종료']},
+    flags={
+        IMPORTANT: [
+            '긴급', '중요', '점검', '공지', '안내', '업데이트', '패치',
+            '이벤트', '출시', '릴리스', '오픈', '종료', '마감'
+        ]
+    },
+    bracket_tags=True
+)
 
 
 class EpicSevenScraper(BaseScraper):
@@ -23,10 +41,17 @@ class EpicSevenScraper(BaseScraper):
         "updates": "997"          # 업데이트
     }
     
+    # 카테고리 -> (게시판 키, 표시 이름)
+    BOARDS = {
+        NewsType.ANNOUNCEMENT: ("announcements", "공지사항"),
+        NewsType.EVENT: ("events", "이벤트"),
+        NewsType.UPDATE: ("updates", "업데이트"),
+    }
+    
     # 공통 API 파라미터
     COMMON_PARAMS = {
         "interaction_type_code": "LIKE,DISLIKE,COMMENT,VIEW",
-        "content_yn": "Y",
+        "content_yn": "Y" if settings.LIST_INCLUDE_CONTENT else "N",  # 본문 포함 시 상세 캐시로 사용
         "summary_yn": "Y",
         "sort_type_code": "LATEST",
         "headline_title_yn": "Y",
@@ -50,110 +75,96 @@ class EpicSevenScraper(BaseScraper):
         })
         return headers
     
-    async def get_announcements(self) -> List[GameNews]:
+    async def get_announcements(self, since_id: Optional[str] = None) -> List[GameNews]:
         """공지사항 목록 조회"""
-        try:
-            url = f"{self.BASE_URL}/article_group/BOARD/{self.BOARD_SEQ['announcements']}/article/list"
-            response = await self.make_request(url, params=self.COMMON_PARAMS)
-            data = response.json()
-            
-            if not self.validate_response_data(data, ['value']):
-                raise ScrapingException("공지사항 응답 데이터 형식이 올바르지 않습니다")
-            
-            value_data = data.get('value', {})
-            if 'list' not in value_data:
-                raise ScrapingException("공지사항 응답에 'list' 키가 없습니다")
-            
-            articles = value_data.get('list', [])
-            news_list = []
-            
-            for article in articles:
-                try:
-                    news = self._parse_article_data(article, NewsType.ANNOUNCEMENT)
-                    if news:
-                        news_list.append(news)
-                except Exception as e:
-                    # 개별 항목 파싱 실패는 로그만 남기고 계속 진행
-                    continue
-            
-            return news_list
-            
-        except Exception as e:
-            if isinstance(e, ScrapingException):
-                raise
-            raise ScrapingException(f"공지사항 조회 중 오류 발생: {str(e)}")
+        return await self._get_board_list(NewsType.ANNOUNCEMENT, since_id)
     
     async def get_announcement_detail(self, url: str) -> Optional[GameNews]:
         """공지사항 상세 조회"""
         return await self._get_detail(url, NewsType.ANNOUNCEMENT)
     
-    async def get_events(self) -> List[GameNews]:
+    async def get_events(self, since_id: Optional[str] = None) -> List[GameNews]:
         """이벤트 목록 조회"""
-        try:
-            url = f"{self.BASE_URL}/article_group/BOARD/{self.BOARD_SEQ['events']}/article/list"
-            response = await self.make_request(url, params=self.COMMON_PARAMS)
-            data = response.json()
-            
-            if not self.validate_response_data(data, ['value']):
-                raise ScrapingException("이벤트 응답 데이터 형식이 올바르지 않습니다")
-            
-            value_data = data.get('value', {})
-            if 'list' not in value_data:
-                raise ScrapingException("이벤트 응답에 'list' 키가 없습니다")
-            
-            articles = value_data.get('list', [])
-            news_list = []
-            
-            for article in articles:
-                try:
-                    news = self._parse_article_data(article, NewsType.EVENT)
-                    if news:
-                        news_list.append(news)
-                except Exception as e:
-                    continue
-            
-            return news_list
-            
-        except Exception as e:
-            if isinstance(e, ScrapingException):
-                raise
-            raise ScrapingException(f"이벤트 조회 중 오류 발생: {str(e)}")
+        return await self._get_board_list(NewsType.EVENT, since_id)
     
     async def get_event_detail(self, url: str) -> Optional[GameNews]:
         """이벤트 상세 조회"""
         return await self._get_detail(url, NewsType.EVENT)
     
-    async def get_updates(self) -> List[GameNews]:
+    async def get_updates(self, since_id: Optional[str] = None) -> List[GameNews]:
         """업데이트 목록 조회"""
+        return await self._get_board_list(NewsType.UPDATE, since_id)
+    
+    async def get_history(self, category: NewsType, pages: int = settings.MAX_HISTORY_PAGES,
+                          until_ts: Optional[int] = None) -> Tuple[List[GameNews], bool]:
+        """게시판 여러 페이지 조회 (백필/과거 범위 조회용)
+        
+        Args:
+            category: 뉴스 카테고리
+            pages: 최대 페이지 수
+            until_ts: 이 시각(epoch 초)보다 오래된 게시글에 도달하면 중단
+            
+        Returns:
+            Tuple[List[GameNews], bool]: 최신순 게시글 (상단 고정 글 중복 제거, 마지막
+                페이지의 until_ts 이전 게시글 포함)과 게시판 끝에 도달했는지 여부
+        """
+        return await self.fetch_pages(
+            lambda page: self._fetch_board_page(category, page),
+            page_size=self.COMMON_PARAMS["size"],
+            max_pages=pages,
+            until_ts=until_ts
+        )
+    
+    async def _get_board_list(self, category: NewsType, since_id: Optional[str]) -> List[GameNews]:
+        """게시판 첫 페이지 조회 (since_id 게시글까지만)"""
+        news_list = []
+        items, _ = await self._fetch_board_page(category)
+        for news, pinned in items:
+            news_list.append(news)
+            # 이미 받은 게시글까지 수집했으면 이후 항목은 건너뜀
+            if self.is_known_article(news.id, since_id, pinned):
+                break
+        return news_list
+    
+    async def _fetch_board_page(self, category: NewsType, page: int = 1) -> Tuple[List[Tuple[GameNews, bool]], int]:
+        """게시판 한 페이지 조회
+        
+        Returns:
+            Tuple[List[Tuple[GameNews, bool]], int]: (게시글, 상단 고정 여부) 목록과
+                파싱 실패 항목을 포함한 원본 게시글 수 (페이지가 찼는지 판단용)
+        """
+        board_key, label = self.BOARDS[category]
         try:
-            url = f"{self.BASE_URL}/article_group/BOARD/{self.BOARD_SEQ['updates']}/article/list"
-            response = await self.make_request(url, params=self.COMMON_PARAMS)
+            url = f"{self.BASE_URL}/article_group/BOARD/{self.BOARD_SEQ[board_key]}/article/list"
+            response = await self.make_request(url, params={**self.COMMON_PARAMS, "page": page})
             data = response.json()
             
             if not self.validate_response_data(data, ['value']):
-                raise ScrapingException("업데이트 응답 데이터 형식이 올바르지 않습니다")
+                raise ScrapingException(f"{label} 응답 데이터 형식이 올바르지 않습니다")
             
             value_data = data.get('value', {})
             if 'list' not in value_data:
-                raise ScrapingException("업데이트 응답에 'list' 키가 없습니다")
+                raise ScrapingException(f"{label} 응답에 'list' 키가 없습니다")
             
             articles = value_data.get('list', [])
-            news_list = []
-            
+            items = []
             for article in articles:
                 try:
-                    news = self._parse_article_data(article, NewsType.UPDATE)
-                    if news:
-                        news_list.append(news)
-                except Exception as e:
+                    news = self._parse_article_data(article, category)
+                except Exception:
+                    # 개별 항목 파싱 실패는 건너뛰고 계속 진행
                     continue
+                if news:
+                    items.append((news, self._is_pinned_article(article)))
             
-            return news_list
+            # 상세 조회 fallback이 목록을 다시 받지 않도록 ID 색인에 저장
+            self.remember_listed(news for news, _ in items)
+            return items, len(articles)
             
         except Exception as e:
             if isinstance(e, ScrapingException):
                 raise
-            raise ScrapingException(f"업데이트 조회 중 오류 발생: {str(e)}")
+            raise ScrapingException(f"{label} 조회 중 오류 발생: {str(e)}")
     
     async def get_update_detail(self, url: str) -> Optional[GameNews]:
         """업데이트 상세 조회"""
@@ -168,7 +179,6 @@ class EpicSevenScraper(BaseScraper):
             
             # OnStove API를 사용한 상세 조회
             try:
-                import time
                 timestamp = int(time.time() * 1000)
                 
                 detail_url = "https://api.onstove.com/cwms/v3.0/article"
@@ -180,25 +190,24 @@ class EpicSevenScraper(BaseScraper):
                     "timestemp": timestamp
                 }
                 
-                response = await self.make_request(detail_url, params=params)
+                # 상세 API는 지연 꼬리가 길어 헤지 요청 사용 (설정 시)
+                response = await self.hedged_request(detail_url, params=params)
                 data = response.json()
                 
                 if not self.validate_response_data(data, ['value']):
                     raise ScrapingException("상세 정보 응답 데이터 형식이 올바르지 않습니다")
                 
+                # 본문 HTML은 create_game_news에서 html_to_text로 한 번만 변환
                 article = data.get('value', {})
-                # HTML 태그 제거 및 텍스트 정리
-                if 'content' in article:
-                    content = article['content']
-                    # HTML 태그 제거
-                    from bs4 import BeautifulSoup
-                    soup = BeautifulSoup(content, 'html.parser')
-                    article['content'] = soup.get_text(separator=' ', strip=True)
                 
                 return self._parse_article_detail(article, category)
                 
+            except DeadlineExceededException:
+                # 마감 시간이 지났으면 fallback 요청을 추가로 보내지 않음
+                raise
             except Exception as e:
                 # 상세 API 실패 시 목록에서 찾기 (fallback)
+                check_deadline(f"{category.value} 상세 fallback")
                 return await self._get_detail_from_list(article_id, category)
             
         except Exception as e:
@@ -207,27 +216,25 @@ class EpicSevenScraper(BaseScraper):
             raise ScrapingException(f"상세 정보 조회 중 오류 발생: {str(e)}")
     
     async def _get_detail_from_list(self, article_id: str, category: NewsType) -> Optional[GameNews]:
-        """목록에서 상세 정보 찾기 (fallback)"""
+        """목록에서 상세 정보 찾기 (fallback)
+        
+        최근 목록 조회에서 본 게시글이면 ID 색인으로 바로 답하고, 없을 때만 해당
+        게시판 첫 페이지를 다시 받아 색인을 갱신한 뒤 찾는다.
+        """
         try:
-            # 카테고리에 따라 적절한 목록 조회
-            if category == NewsType.ANNOUNCEMENT:
-                articles_list = await self.get_announcements()
-            elif category == NewsType.EVENT:
-                articles_list = await self.get_events()
-            elif category == NewsType.UPDATE:
-                articles_list = await self.get_updates()
-            else:
-                articles_list = await self.get_announcements()
-            
-            # article_id가 일치하는 항목 찾기
-            for article in articles_list:
-                if article.id == article_id:
-                    # summary를 content로 복사하여 상세 정보처럼 만들기
-                    article.content = article.summary
-                    return article
+            news = self.find_listed(article_id, max_age=settings.CACHE_TTL)
+            if news is None:
+                await self._fetch_board_page(category)
+                news = self.find_listed(article_id)
+            if news is None:
+                return None
             
-            return None
+            # 색인의 게시글은 공유 객체이므로 복사본을 상세 정보처럼 만들기 (목록 본문이 없으면 summary)
+            return news.model_copy(update={"content": news.content or news.summary, "category": category})
             
+        except (DeadlineExceededException, CircuitOpenException):
+            # 차단 예외는 그대로 올려 서비스가 만료된 캐시로 응답할 수 있게 함
+            raise
         except Exception as e:
             raise ScrapingException(f"목록에서 상세 정보 찾기 실패: {str(e)}")
     
@@ -242,11 +249,8 @@ class EpicSevenScraper(BaseScraper):
             title = article['title']
             create_datetime = article['create_datetime']
             
-            # 타임스탬프 변환 (밀리초 단위)
-            if isinstance(create_datetime, (int, float)):
-                published_at = datetime.fromtimestamp(create_datetime / 1000)
-            else:
-                published_at = parse_timestamp(create_datetime)
+            # 타임스탬프 변환 (epoch 밀리초, 문자열이면 형식 판별)
+            published_at = parse_timestamp(create_datetime, source="onstove", default_tz=KST)
             
             # URL 생성
             url = f"https://page.onstove.com/epicseven/global/view/{article_id}"
@@ -258,11 +262,14 @@ class EpicSevenScraper(BaseScraper):
             # 조회수
             view_count = article.get('view_count', 0)
             
+            # 제목 분류 (중요도/태그 공용)
+            classification = TITLE_CLASSIFIER.classify(article.get('title', ''))
+            
             # 중요도 판단
-            is_important = self._is_important_article(article)
+            is_important = self._is_important_article(article, classification)
             
             # 태그 추출
-            tags = self._extract_tags(article)
+            tags = self._extract_tags(article, classification)
             
             # 제목 장식
             decorated_title = self._decorate_title(title, category, is_important, view_count)
@@ -294,11 +301,8 @@ class EpicSevenScraper(BaseScraper):
             title = article['title']
             create_datetime = article['create_datetime']
             
-            # 타임스탬프 변환 (밀리초 단위)
-            if isinstance(create_datetime, (int, float)):
-                published_at = datetime.fromtimestamp(create_datetime / 1000)
-            else:
-                published_at = parse_timestamp(create_datetime)
+            # 타임스탬프 변환 (epoch 밀리초, 문자열이면 형식 판별)
+            published_at = parse_timestamp(create_datetime, source="onstove", default_tz=KST)
             
             # URL 생성
             url = f"https://page.onstove.com/epicseven/global/view/{article_id}"
@@ -310,11 +314,14 @@ class EpicSevenScraper(BaseScraper):
             # 조회수
             view_count = article.get('view_count', 0)
             
+            # 제목 분류 (중요도/태그 공용)
+            classification = TITLE_CLASSIFIER.classify(article.get('title', ''))
+            
             # 중요도 판단
-            is_important = self._is_important_article(article)
+            is_important = self._is_important_article(article, classification)
             
             # 태그 추출
-            tags = self._extract_tags(article)
+            tags = self._extract_tags(article, classification)
             
             # 제목 장식
             decorated_title = self._decorate_title(title, category, is_important, view_count)
@@ -359,18 +366,23 @@ class EpicSevenScraper(BaseScraper):
         
         return None
     
-    def _is_important_article(self, article: Dict[str, Any]) -> bool:
-        """게시글 중요도 판단"""
-        title = article.get('title', '').lower()
+    def _is_pinned_article(self, article: Dict[str, Any]) -> bool:
+        """상단 고정 게시글 여부"""
+        return bool(article.get('is_top', False)) or article.get('fixed_yn', 'N') == 'Y'
+    
+    def _is_important_article(self, article: Dict[str, Any],
+                              classification: Optional[Classification] = None) -> bool:
+        """게시글 중요도 판단
         
-        # 중요 키워드
-        important_keywords = [
-            '긴급', '중요', '점검', '공지', '안내', '업데이트', '패치',
-            '이벤트', '출시', '릴리스', '오픈', '종료', '마감'
-        ]
+        Args:
+            article: API 게시글 데이터
+            classification: 제목 분류 결과 (없으면 새로 분류)
+        """
+        if classification is None:
+            classification = TITLE_CLASSIFIER.classify(article.get('title', ''))
         
         # 제목에 중요 키워드가 포함되어 있는지 확인
-        if any(keyword in title for keyword in important_keywords):
+        if classification.is_important:
             return True
         
         # 고정 게시물 여부 확인
@@ -384,15 +396,19 @@ class EpicSevenScraper(BaseScraper):
         
         return False
     
-    def _extract_tags(self, article: Dict[str, Any]) -> List[str]:
-        """게시글에서 태그 추출"""
-        tags = []
+    def _extract_tags(self, article: Dict[str, Any],
+                      classification: Optional[Classification] = None) -> List[str]:
+        """게시글에서 태그 추출
         
-        title = article.get('title', '')
+        Args:
+            article: API 게시글 데이터
+            classification: 제목 분류 결과 (없으면 새로 분류)
+        """
+        if classification is None:
+            classification = TITLE_CLASSIFIER.classify(article.get('title', ''))
         
-        # 말머리 추출 (대괄호 안의 내용)
-        bracket_matches = re.findall(r'\[([^\]]+)\]', title)
-        tags.extend(bracket_matches)
+        # 말머리(대괄호 안의 내용) 및 제목 키워드 태그
+        tags = list(classification.tags)
         
         # 카테고리 정보
         category = article.get('category', '')
@@ -404,12 +420,6 @@ class EpicSevenScraper(BaseScraper):
         if article_type:
             tags.append(article_type)
         
-        # 제목에서 키워드 추출
-        title_keywords = ['점검', '업데이트', '패치', '이벤트', '출시', '종료']
-        for keyword in title_keywords:
-            if keyword in title:
-                tags.append(keyword)
-        
         return list(set(tags))  # 중복 제거
     
     def _decorate_title(self, title: str, category: NewsType, is_important: bool, view_count: int) -> str:
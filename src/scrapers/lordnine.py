@@ -1,13 +1,37 @@
 """로드나인 게임 스크래퍼"""
 
 import re
-from typing import List, Optional, Dict, Any
+import time
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
+from src.config.settings import settings
 from src.scrapers.base import BaseScraper
 from src.models.game_news import GameNews, GameType, NewsType
-from src.models.exceptions import ScrapingException, ApiException
-from src.utils.helpers import parse_timestamp, clean_text
+from src.models.exceptions import (
+    ScrapingException, ApiException, DeadlineExceededException, CircuitOpenException
+)
+from src.utils.timestamps import parse_timestamp, KST
+from src.utils.deadline import check_deadline
+from src.utils.classifier import KeywordClassifier, Classification, IMPORTANT
+
+# 업데이트 판별 플래그
+UPDATE = "update"
+
+# 제목 분류 규칙 (태그 / 중요 키워드 / 업데이트 키워드)
+TITLE_CLASSIFIER = KeywordClassifier(
+    tags={
+        '공지': ['공지', '알림'],
+        '이벤트': ['이벤트', '행사'],
+        '점검': ['점검', '정기점검', '긴급점검'],
+        '업데이트': ['업데이트', '패치', '버전'],
+        '출시': ['출시', '릴리스', '런칭']
+    },
+    flags={
+        IMPORTANT: ['공지', '점검', '긴급', '중요', '필독'],
+        UPDATE: ['업데이트', '패치', '버전', '출시', '릴리스', '개선']
+    }
+)
 
 
 class LordnineScraper(BaseScraper):
@@ -26,7 +50,7 @@ class LordnineScraper(BaseScraper):
     # 공통 API 파라미터
     COMMON_PARAMS = {
         "interaction_type_code": "LIKE,DISLIKE,COMMENT,VIEW",
-        "content_yn": "Y",
+        "content_yn": "Y" if settings.LIST_INCLUDE_CONTENT else "N",  # 본문 포함 시 상세 캐시로 사용
         "summary_yn": "Y",
         "sort_type_code": "LATEST",
         "headline_title_yn": "Y",
@@ -49,103 +73,125 @@ class LordnineScraper(BaseScraper):
         })
         return headers
     
-    async def get_announcements(self) -> List[GameNews]:
+    async def get_announcements(self, since_id: Optional[str] = None) -> List[GameNews]:
         """공지사항 목록 조회"""
+        return await self._get_board_list("announcements", NewsType.ANNOUNCEMENT, "공지사항", since_id)
+    
+    async def get_announcement_detail(self, url: str) -> Optional[GameNews]:
+        """공지사항 상세 조회"""
+        return await self._get_detail(url, NewsType.ANNOUNCEMENT)
+    
+    async def get_events(self, since_id: Optional[str] = None) -> List[GameNews]:
+        """이벤트 목록 조회"""
+        return await self._get_board_list("events", NewsType.EVENT, "이벤트", since_id)
+    
+    async def get_event_detail(self, url: str) -> Optional[GameNews]:
+        """이벤트 상세 조회"""
+        return await self._get_detail(url, NewsType.EVENT)
+    
+    async def get_updates(self, since_id: Optional[str] = None) -> List[GameNews]:
+        """업데이트 목록 조회"""
         try:
-            url = f"{self.BASE_URL}/cwms/v3.0/article_group/BOARD/{self.BOARD_IDS['announcements']}/article/list"
-            response = await self.make_request(url, params=self.COMMON_PARAMS)
-            data = response.json()
-            
-            if not self.validate_response_data(data, ['value']):
-                raise ScrapingException("공지사항 응답 데이터 형식이 올바르지 않습니다")
-            
-            value_data = data.get('value', {})
-            if 'list' not in value_data:
-                raise ScrapingException("공지사항 응답에 'list' 키가 없습니다")
-            
-            articles = value_data.get('list', [])
-            news_list = []
-            
-            for article in articles:
-                try:
-                    news = self._parse_article_data(article, NewsType.ANNOUNCEMENT)
-                    if news:
-                        news_list.append(news)
-                except Exception as e:
-                    # 개별 항목 파싱 실패는 로그만 남기고 계속 진행
-                    continue
-            
-            return news_list
+            # 업데이트는 공지사항에서 업데이트 관련 키워드로 필터링
+            announcements = await self.get_announcements(since_id=since_id)
+            return self._filter_updates(announcements)
             
         except Exception as e:
             if isinstance(e, ScrapingException):
                 raise
-            raise ScrapingException(f"공지사항 조회 중 오류 발생: {str(e)}")
+            raise ScrapingException(f"업데이트 조회 중 오류 발생: {str(e)}")
     
-    async def get_announcement_detail(self, url: str) -> Optional[GameNews]:
-        """공지사항 상세 조회"""
-        return await self._get_detail(url, NewsType.ANNOUNCEMENT)
+    def _filter_updates(self, announcements: List[GameNews]) -> List[GameNews]:
+        """공지사항 중 업데이트 게시글만 골라 카테고리를 업데이트로 변경"""
+        # 업데이트 관련 키워드로 필터링 (제목 전체를 한 번에 분류)
+        classifications = TITLE_CLASSIFIER.classify_many([news.title for news in announcements])
+        
+        updates = []
+        for news, classification in zip(announcements, classifications):
+            if classification.has(UPDATE):
+                # 카테고리를 업데이트로 변경
+                update_news = news.copy()
+                update_news.category = NewsType.UPDATE
+                updates.append(update_news)
+        
+        return updates
     
-    async def get_events(self) -> List[GameNews]:
-        """이벤트 목록 조회"""
+    async def get_history(self, category: NewsType, pages: int = settings.MAX_HISTORY_PAGES,
+                          until_ts: Optional[int] = None) -> Tuple[List[GameNews], bool]:
+        """게시판 여러 페이지 조회 (백필/과거 범위 조회용)
+        
+        Args:
+            category: 뉴스 카테고리
+            pages: 최대 페이지 수
+            until_ts: 이 시각(epoch 초)보다 오래된 게시글에 도달하면 중단
+            
+        Returns:
+            Tuple[List[GameNews], bool]: 최신순 게시글 (상단 고정 글 중복 제거, 마지막
+                페이지의 until_ts 이전 게시글 포함)과 게시판 끝에 도달했는지 여부
+        """
+        board_key, label = ("events", "이벤트") if category == NewsType.EVENT else ("announcements", "공지사항")
+        parse_category = NewsType.EVENT if category == NewsType.EVENT else NewsType.ANNOUNCEMENT
+        news_list, exhausted = await self.fetch_pages(
+            lambda page: self._fetch_board_page(board_key, parse_category, label, page),
+            page_size=self.COMMON_PARAMS["size"],
+            max_pages=pages,
+            until_ts=until_ts
+        )
+        if category == NewsType.UPDATE:
+            return self._filter_updates(news_list), exhausted
+        return news_list, exhausted
+    
+    async def _get_board_list(self, board_key: str, category: NewsType, label: str,
+                              since_id: Optional[str]) -> List[GameNews]:
+        """게시판 첫 페이지 조회 (since_id 게시글까지만)"""
+        news_list = []
+        items, _ = await self._fetch_board_page(board_key, category, label)
+        for news, pinned in items:
+            news_list.append(news)
+            # 이미 받은 게시글까지 수집했으면 이후 항목은 건너뜀
+            if self.is_known_article(news.id, since_id, pinned):
+                break
+        return news_list
+    
+    async def _fetch_board_page(self, board_key: str, category: NewsType, label: str,
+                                page: int = 1) -> Tuple[List[Tuple[GameNews, bool]], int]:
+        """게시판 한 페이지 조회
+        
+        Returns:
+            Tuple[List[Tuple[GameNews, bool]], int]: (게시글, 상단 고정 여부) 목록과
+                파싱 실패 항목을 포함한 원본 게시글 수 (페이지가 찼는지 판단용)
+        """
         try:
-            url = f"{self.BASE_URL}/cwms/v3.0/article_group/BOARD/{self.BOARD_IDS['events']}/article/list"
-            response = await self.make_request(url, params=self.COMMON_PARAMS)
+            url = f"{self.BASE_URL}/cwms/v3.0/article_group/BOARD/{self.BOARD_IDS[board_key]}/article/list"
+            response = await self.make_request(url, params={**self.COMMON_PARAMS, "page": page})
             data = response.json()
             
             if not self.validate_response_data(data, ['value']):
-                raise ScrapingException("이벤트 응답 데이터 형식이 올바르지 않습니다")
+                raise ScrapingException(f"{label} 응답 데이터 형식이 올바르지 않습니다")
             
             value_data = data.get('value', {})
             if 'list' not in value_data:
-                raise ScrapingException("이벤트 응답에 'list' 키가 없습니다")
+                raise ScrapingException(f"{label} 응답에 'list' 키가 없습니다")
             
             articles = value_data.get('list', [])
-            news_list = []
-            
+            items = []
             for article in articles:
                 try:
-                    news = self._parse_article_data(article, NewsType.EVENT)
-                    if news:
-                        news_list.append(news)
-                except Exception as e:
+                    news = self._parse_article_data(article, category)
+                except Exception:
+                    # 개별 항목 파싱 실패는 건너뛰고 계속 진행
                     continue
+                if news:
+                    items.append((news, self._is_pinned_article(article)))
             
-            return news_list
+            # 상세 조회 fallback이 목록을 다시 받지 않도록 ID 색인에 저장
+            self.remember_listed(news for news, _ in items)
+            return items, len(articles)
             
         except Exception as e:
             if isinstance(e, ScrapingException):
                 raise
-            raise ScrapingException(f"이벤트 조회 중 오류 발생: {str(e)}")
-    
-    async def get_event_detail(self, url: str) -> Optional[GameNews]:
-        """이벤트 상세 조회"""
-        return await self._get_detail(url, NewsType.EVENT)
-    
-    async def get_updates(self) -> List[GameNews]:
-        """업데이트 목록 조회"""
-        try:
-            # 업데이트는 공지사항에서 업데이트 관련 키워드로 필터링
-            announcements = await self.get_announcements()
-            
-            # 업데이트 관련 키워드
-            update_keywords = ['업데이트', '패치', '버전', '출시', '릴리스', '개선']
-            
-            updates = []
-            for news in announcements:
-                title_lower = news.title.lower()
-                if any(keyword in title_lower for keyword in update_keywords):
-                    # 카테고리를 업데이트로 변경
-                    update_news = news.copy()
-                    update_news.category = NewsType.UPDATE
-                    updates.append(update_news)
-            
-            return updates
-            
-        except Exception as e:
-            if isinstance(e, ScrapingException):
-                raise
-            raise ScrapingException(f"업데이트 조회 중 오류 발생: {str(e)}")
+            raise ScrapingException(f"{label} 조회 중 오류 발생: {str(e)}")
     
     async def get_update_detail(self, url: str) -> Optional[GameNews]:
         """업데이트 상세 조회"""
@@ -160,7 +206,6 @@ class LordnineScraper(BaseScraper):
             
             # OnStove API를 사용한 상세 조회
             try:
-                import time
                 timestamp = int(time.time() * 1000)
                 
                 detail_url = f"{self.BASE_URL}/cwms/v3.0/article"
@@ -172,25 +217,24 @@ class LordnineScraper(BaseScraper):
                     "timestemp": timestamp
                 }
                 
-                response = await self.make_request(detail_url, params=params)
+                # 상세 API는 지연 꼬리가 길어 헤지 요청 사용 (설정 시)
+                response = await self.hedged_request(detail_url, params=params)
                 data = response.json()
                 
                 if not self.validate_response_data(data, ['value']):
                     raise ScrapingException("상세 정보 응답 데이터 형식이 올바르지 않습니다")
                 
+                # 본문 HTML은 create_game_news에서 html_to_text로 한 번만 변환
                 article = data.get('value', {})
-                # HTML 태그 제거 및 텍스트 정리
-                if 'content' in article:
-                    content = article['content']
-                    # HTML 태그 제거
-                    from bs4 import BeautifulSoup
-                    soup = BeautifulSoup(content, 'html.parser')
-                    article['content'] = soup.get_text(separator=' ', strip=True)
                 
                 return self._parse_article_detail(article, category)
                 
+            except DeadlineExceededException:
+                # 마감 시간이 지났으면 fallback 요청을 추가로 보내지 않음
+                raise
             except Exception as e:
                 # 상세 API 실패 시 목록에서 찾기 (fallback)
+                check_deadline(f"{category.value} 상세 fallback")
                 return await self._get_detail_from_list(article_id, category)
             
         except Exception as e:
@@ -199,27 +243,29 @@ class LordnineScraper(BaseScraper):
             raise ScrapingException(f"상세 정보 조회 중 오류 발생: {str(e)}")
     
     async def _get_detail_from_list(self, article_id: str, category: NewsType) -> Optional[GameNews]:
-        """목록에서 상세 정보 찾기 (fallback)"""
+        """목록에서 상세 정보 찾기 (fallback)
+        
+        최근 목록 조회에서 본 게시글이면 ID 색인으로 바로 답하고, 없을 때만 해당
+        게시판 첫 페이지를 다시 받아 색인을 갱신한 뒤 찾는다.
+        """
         try:
-            # 카테고리에 따라 적절한 목록 조회
-            if category == NewsType.ANNOUNCEMENT:
-                articles_list = await self.get_announcements()
-            elif category == NewsType.EVENT:
-                articles_list = await self.get_events()
-            elif category == NewsType.UPDATE:
-                articles_list = await self.get_updates()
-            else:
-                articles_list = await self.get_announcements()
+            news = self.find_listed(article_id, max_age=settings.CACHE_TTL)
+            if news is None:
+                # 업데이트는 공지사항 게시판에서 골라내므로 공지사항 목록 한 번만 조회
+                if category == NewsType.EVENT:
+                    await self._fetch_board_page("events", NewsType.EVENT, "이벤트")
+                else:
+                    await self._fetch_board_page("announcements", NewsType.ANNOUNCEMENT, "공지사항")
+                news = self.find_listed(article_id)
+            if news is None:
+                return None
             
-            # article_id가 일치하는 항목 찾기
-            for article in articles_list:
-                if article.id == article_id:
-                    # summary를 content로 복사하여 상세 정보처럼 만들기
-                    article.content = article.summary
-                    return article
-            
-            return None
+            # 색인의 게시글은 공유 객체이므로 복사본을 상세 정보처럼 만들기 (목록 본문이 없으면 summary)
+            return news.model_copy(update={"content": news.content or news.summary, "category": category})
             
+        except (DeadlineExceededException, CircuitOpenException):
+            # 차단 예외는 그대로 올려 서비스가 만료된 캐시로 응답할 수 있게 함
+            raise
         except Exception as e:
             raise ScrapingException(f"목록에서 상세 정보 찾기 실패: {str(e)}")
     
@@ -234,31 +280,33 @@ class LordnineScraper(BaseScraper):
             title = article['title']
             create_datetime = article['create_datetime']
             
-            # 타임스탬프 변환 (밀리초 단위)
-            if isinstance(create_datetime, (int, float)):
-                published_at = datetime.fromtimestamp(create_datetime / 1000)
-            else:
-                published_at = parse_timestamp(create_datetime)
+            # 타임스탬프 변환 (epoch 밀리초, 문자열이면 형식 판별)
+            published_at = parse_timestamp(create_datetime, source="onstove", default_tz=KST)
             
             # URL 생성
             url = f"https://page.onstove.com/l9/global/view/{article_id}"
             
+            # 제목 분류 (중요도/태그 공용)
+            classification = TITLE_CLASSIFIER.classify(title)
+            
             # 중요도 판단
-            is_important = self._is_important_article(article)
+            is_important = self._is_important_article(article, classification)
             
             # 태그 추출
-            tags = self._extract_tags(article)
+            tags = self._extract_tags(article, classification)
             
             # 조회수
             interaction_info = article.get('user_interaction_score_info', {})
             view_count = interaction_info.get('view_score', 0)
             
-            # 요약
+            # 요약 / 본문 (content_yn=Y 목록에 포함된 HTML, create_game_news에서 텍스트로 변환)
             summary = article.get('summary', '')
+            content = article.get('content') or None
             
             return self.create_game_news(
                 id=article_id,
                 title=title,
+                content=content,
                 url=url,
                 published_at=published_at,
                 category=category,
@@ -283,20 +331,20 @@ class LordnineScraper(BaseScraper):
             create_datetime = article['create_datetime']
             content = article.get('content', '')
             
-            # 타임스탬프 변환 (밀리초 단위)
-            if isinstance(create_datetime, (int, float)):
-                published_at = datetime.fromtimestamp(create_datetime / 1000)
-            else:
-                published_at = parse_timestamp(create_datetime)
+            # 타임스탬프 변환 (epoch 밀리초, 문자열이면 형식 판별)
+            published_at = parse_timestamp(create_datetime, source="onstove", default_tz=KST)
             
             # URL 생성
             url = f"https://page.onstove.com/l9/global/view/{article_id}"
             
+            # 제목 분류 (중요도/태그 공용)
+            classification = TITLE_CLASSIFIER.classify(title)
+            
             # 중요도 판단
-            is_important = self._is_important_article(article)
+            is_important = self._is_important_article(article, classification)
             
             # 태그 추출
-            tags = self._extract_tags(article)
+            tags = self._extract_tags(article, classification)
             
             # 조회수
             interaction_info = article.get('user_interaction_score_info', {})
@@ -335,13 +383,24 @@ class LordnineScraper(BaseScraper):
         else:
             return None
     
-    def _is_important_article(self, article: Dict[str, Any]) -> bool:
-        """중요 게시글 판단"""
-        title = article.get('title', '').lower()
+    def _is_pinned_article(self, article: Dict[str, Any]) -> bool:
+        """상단 고정 게시글 여부"""
+        return article.get('fixed_yn', 'N') == 'Y'
+    
+    def _is_important_article(self, article: Dict[str, Any],
+                              classification: Optional[Classification] = None) -> bool:
+        """중요 게시글 판단
+        
+        Args:
+            article: API 게시글 데이터
+            classification: 제목 분류 결과 (없으면 새로 분류)
+        """
+        if classification is None:
+            classification = TITLE_CLASSIFIER.classify(article.get('title', ''))
         
         # headline_info에서 headline_name 추출
         headline_info = article.get('headline_info', {})
-        headline_name = headline_info.get('headline_name', '').lower()
+        headline_name = headline_info.get('headline_name', '')
         
         # fixed_yn 확인 (Y/N 형태)
         is_fixed = article.get('fixed_yn', 'N') == 'Y'
@@ -352,19 +411,24 @@ class LordnineScraper(BaseScraper):
         notice_positions = admin_option.get('notice_position_code', [])
         
         # 고정 게시물이거나 중요 키워드가 포함된 경우
-        important_keywords = ['공지', '점검', '긴급', '중요', '필독']
-        
         return (is_fixed or 
                 official_type in ['NOTICE', 'MAINTENANCE'] or
                 'ALL' in notice_positions or
-                any(keyword in title for keyword in important_keywords) or
-                any(keyword in headline_name for keyword in important_keywords))
+                classification.is_important or
+                (bool(headline_name) and TITLE_CLASSIFIER.classify(headline_name).is_important))
     
-    def _extract_tags(self, article: Dict[str, Any]) -> List[str]:
-        """게시글에서 태그 추출"""
-        tags = []
+    def _extract_tags(self, article: Dict[str, Any],
+                      classification: Optional[Classification] = None) -> List[str]:
+        """게시글에서 태그 추출
+        
+        Args:
+            article: API 게시글 데이터
+            classification: 제목 분류 결과 (없으면 새로 분류)
+        """
+        if classification is None:
+            classification = TITLE_CLASSIFIER.classify(article.get('title', ''))
         
-        title = article.get('title', '').lower()
+        tags = []
         
         # headline_info에서 headline_name 추출
         headline_info = article.get('headline_info', {})
@@ -384,16 +448,6 @@ class LordnineScraper(BaseScraper):
                 tags.append('점검')
         
         # 제목에서 태그 추출
-        tag_keywords = {
-            '공지': ['공지', '알림'],
-            '이벤트': ['이벤트', '행사'],
-            '점검': ['점검', '정기점검', '긴급점검'],
-            '업데이트': ['업데이트', '패치', '버전'],
-            '출시': ['출시', '릴리스', '런칭']
-        }
-        
-        for tag, keywords in tag_keywords.items():
-            if any(keyword in title for keyword in keywords):
-                tags.append(tag)
+        tags.extend(classification.tags)
         
         return list(set(tags))  # 중복 제거 
\ No newline at end of file
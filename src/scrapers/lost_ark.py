@@ -2,14 +2,56 @@
 
 import re
 import asyncio
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from playwright.async_api import async_playwright, Browser, Page
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from datetime import datetime, timezone
 
 from src.scrapers.base import BaseScraper
 from src.models.game_news import GameNews, GameType, NewsType
-from src.models.exceptions import ScrapingException, TimeoutException
-from src.utils.helpers import parse_timestamp, clean_text
+from src.models.exceptions import (
+    ScrapingException, TimeoutException, DeadlineExceededException, CircuitOpenException
+)
+from src.utils.timestamps import parse_timestamp, KST
+from src.utils.text import normalize_text
+from src.utils.deadline import check_deadline, bounded_timeout
+from src.utils.resilience import circuit_breakers
+from src.utils.classifier import KeywordClassifier, IMPORTANT, MAINTENANCE
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page
+
+
+def async_playwright():
+    """playwright 컨텍스트 매니저 생성 (playwright는 브라우저를 처음 띄울 때 import)"""
+    from playwright.async_api import async_playwright as _async_playwright
+    return _async_playwright()
+
+
+# 제목 키워드 -> 붙일 태그
+KEYWORD_TAGS = {
+    '업데이트': ['업데이트', 'update'],
+    '패치': ['패치', 'patch'],
+    '이벤트': ['이벤트', 'event'],
+    '점검': ['점검', 'maintenance'],
+    '공지': ['공지', 'notice'],
+    '출시': ['출시', 'release'],
+    '종료': ['종료', 'end']
+}
+
+# 제목 분류 규칙 (말머리 + 키워드 태그 / 중요 키워드 / 점검 키워드)
+TITLE_CLASSIFIER = KeywordClassifier(
+    tags={tag: [keyword] for keyword, tag_list in KEYWORD_TAGS.items() for tag in tag_list},
+    flags={
+        IMPORTANT: [
+            '긴급', '중요', '공지', '안내', '업데이트', '패치',
+            '점검', '오픈', '출시', '종료', '마감', '이벤트'
+        ],
+        MAINTENANCE: [
+            '점검', 'maintenance', '서버점검', '정기점검',
+            '긴급점검', '임시점검', '시스템점검'
+        ]
+    },
+    bracket_tags=True
+)
 
 
 class LostArkScraper(BaseScraper):
@@ -28,7 +70,7 @@ class LostArkScraper(BaseScraper):
     def __init__(self, timeout: int = 30):
         """로스트아크 스크래퍼 초기화"""
         super().__init__(GameType.LOST_ARK, timeout)
-        self.browser: Optional[Browser] = None
+        self.browser: Optional["Browser"] = None
         self.playwright = None
         
     async def init_browser(self):
@@ -66,7 +108,7 @@ class LostArkScraper(BaseScraper):
         """비동기 컨텍스트 매니저 종료"""
         await self.close_browser()
     
-    async def create_page(self) -> Page:
+    async def create_page(self) -> "Page":
         """새 페이지 생성"""
         if not self.browser:
             await self.init_browser()
@@ -82,56 +124,75 @@ class LostArkScraper(BaseScraper):
         
         return page
     
-    async def get_announcements(self) -> List[GameNews]:
+    async def _load_page(self, page: "Page", url: str) -> None:
+        """페이지 이동 및 렌더링 대기 (도구 호출 마감 시간 안에서만 대기)
+        
+        페이지 이동은 엔드포인트 서킷 브레이커를 거친다 (차단 중이면 브라우저를 쓰지 않고
+        즉시 CircuitOpenException). 브라우저 로딩은 무거우므로 재시도는 하지 않는다.
+        """
+        check_deadline(url)
+        breaker = circuit_breakers.get(url)
+        breaker.before_call()
+        try:
+            await page.goto(url, wait_until='networkidle', timeout=bounded_timeout(self.timeout) * 1000)
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        
+        # 페이지 로드 대기
+        check_deadline(url)
+        await page.wait_for_timeout(bounded_timeout(2.0) * 1000)
+    
+    async def get_announcements(self, since_id: Optional[str] = None) -> List[GameNews]:
         """공지사항 목록 조회"""
-        return await self._get_news_list(NewsType.ANNOUNCEMENT, "announcements")
+        return await self._get_news_list(NewsType.ANNOUNCEMENT, "announcements", since_id)
     
     async def get_announcement_detail(self, url: str) -> Optional[GameNews]:
         """공지사항 상세 조회"""
         return await self._get_news_detail(url, NewsType.ANNOUNCEMENT)
     
-    async def get_events(self) -> List[GameNews]:
+    async def get_events(self, since_id: Optional[str] = None) -> List[GameNews]:
         """이벤트 목록 조회"""
-        return await self._get_news_list(NewsType.EVENT, "events")
+        return await self._get_news_list(NewsType.EVENT, "events", since_id)
     
     async def get_event_detail(self, url: str) -> Optional[GameNews]:
         """이벤트 상세 조회"""
         return await self._get_news_detail(url, NewsType.EVENT)
     
-    async def get_updates(self) -> List[GameNews]:
+    async def get_updates(self, since_id: Optional[str] = None) -> List[GameNews]:
         """업데이트 목록 조회"""
-        return await self._get_news_list(NewsType.UPDATE, "updates")
+        return await self._get_news_list(NewsType.UPDATE, "updates", since_id)
     
     async def get_update_detail(self, url: str) -> Optional[GameNews]:
         """업데이트 상세 조회"""
         return await self._get_news_detail(url, NewsType.UPDATE)
     
-    async def _get_news_list(self, category: NewsType, path_key: str) -> List[GameNews]:
+    async def _get_news_list(self, category: NewsType, path_key: str, since_id: Optional[str] = None) -> List[GameNews]:
         """뉴스 목록 조회 공통 메서드"""
         try:
             page = await self.create_page()
             
             try:
                 url = f"{self.BASE_URL}{self.PATHS[path_key]}"
-                await page.goto(url, wait_until='networkidle', timeout=self.timeout * 1000)
-                
-                # 페이지 로드 대기
-                await page.wait_for_timeout(2000)
+                await self._load_page(page, url)
                 
                 # 뉴스 목록 추출
-                news_list = await self._extract_news_list(page, category)
+                news_list = await self._extract_news_list(page, category, since_id)
                 
                 return news_list
                 
             finally:
                 await page.close()
                 
+        except (DeadlineExceededException, CircuitOpenException):
+            raise
         except Exception as e:
             if "timeout" in str(e).lower():
                 raise TimeoutException(f"{category.value} 목록 조회 타임아웃", self.timeout)
             raise ScrapingException(f"{category.value} 목록 조회 중 오류 발생: {str(e)}")
     
-    async def _extract_news_list(self, page: Page, category: NewsType) -> List[GameNews]:
+    async def _extract_news_list(self, page: "Page", category: NewsType, since_id: Optional[str] = None) -> List[GameNews]:
         """페이지에서 뉴스 목록 추출"""
         news_list = []
         
@@ -179,6 +240,9 @@ class LostArkScraper(BaseScraper):
                     news = await self._parse_article_element(article, category, page)
                     if news:
                         news_list.append(news)
+                        # 이미 받은 게시글까지 수집했으면 이후 항목은 건너뜀
+                        if self.is_known_article(news.id, since_id):
+                            break
                 except Exception as e:
                     # 개별 항목 파싱 실패는 무시하고 계속 진행
                     continue
@@ -188,7 +252,7 @@ class LostArkScraper(BaseScraper):
         
         return news_list
     
-    async def _parse_article_element(self, element, category: NewsType, page: Page) -> Optional[GameNews]:
+    async def _parse_article_element(self, element, category: NewsType, page: "Page") -> Optional[GameNews]:
         """개별 기사 요소 파싱"""
         try:
             # 제목 추출 (여러 선택자 시도)
@@ -203,7 +267,7 @@ class LostArkScraper(BaseScraper):
                     title_element = await element.query_selector(selector)
                     if title_element:
                         title = await title_element.inner_text()
-                        title = clean_text(title)
+                        title = normalize_text(title)
                         break
                 except:
                     continue
@@ -211,7 +275,7 @@ class LostArkScraper(BaseScraper):
             # 제목이 없으면 전체 텍스트에서 추출
             if not title:
                 title = await element.inner_text()
-                title = clean_text(title.split('\n')[0])
+                title = normalize_text(title.split('\n')[0])
             
             if not title:
                 return None
@@ -241,31 +305,34 @@ class LostArkScraper(BaseScraper):
                 '.publish-date', '.write-date'
             ]
             
-            published_at = datetime.now()
+            published_at = None
             for selector in date_selectors:
                 try:
                     date_element = await element.query_selector(selector)
                     if date_element:
                         date_text = await date_element.inner_text()
-                        published_at = parse_timestamp(date_text)
+                        published_at = parse_timestamp(date_text, source="lost_ark", default_tz=KST)
                         break
                 except:
                     continue
             
-            # ID 생성 (URL에서 추출)
-            article_id = self._extract_id_from_url(url)
-            if not article_id:
-                article_id = str(hash(url))[-8:]  # URL 해시 사용
+            if published_at is None:
+                # 날짜를 찾지 못한 경우에만 수집 시각으로 대체
+                published_at = datetime.now(timezone.utc)
+            
+            # ID 생성 (URL의 게시글 번호, 없으면 URL 기반 안정 ID)
+            article_id = self.make_article_id(url, self._extract_id_from_url(url))
             
-            # 중요도 판단
-            is_important = self._is_important_news(title)
+            # 제목 분류 (중요도/점검/태그를 한 번에)
+            classification = TITLE_CLASSIFIER.classify(title)
+            is_important = classification.is_important
             
             # 점검 공지 필터링
-            if self._is_maintenance_notice(title):
+            if classification.is_maintenance:
                 # 점검 공지는 태그를 추가하되 포함시킴
                 tags = ['점검', 'maintenance']
             else:
-                tags = self._extract_tags_from_title(title)
+                tags = classification.tags
             
             return self.create_game_news(
                 id=article_id,
@@ -286,16 +353,13 @@ class LostArkScraper(BaseScraper):
             page = await self.create_page()
             
             try:
-                await page.goto(str(url), wait_until='networkidle', timeout=self.timeout * 1000)
-                await page.wait_for_timeout(2000)
+                await self._load_page(page, str(url))
                 
                 # 상세 내용 추출
                 content = await self._extract_detail_content(page)
                 
                 # 기본 정보는 목록에서 가져온 것을 사용
-                article_id = self._extract_id_from_url(str(url))
-                if not article_id:
-                    article_id = str(hash(url))[-8:]
+                article_id = self.make_article_id(str(url), self._extract_id_from_url(str(url)))
                 
                 # 제목 추출
                 title_selectors = [
@@ -309,7 +373,7 @@ class LostArkScraper(BaseScraper):
                         title_element = await page.query_selector(selector)
                         if title_element:
                             title = await title_element.inner_text()
-                            title = clean_text(title)
+                            title = normalize_text(title)
                             break
                     except:
                         continue
@@ -323,22 +387,26 @@ class LostArkScraper(BaseScraper):
                     '.date', '.time', '.regdate'
                 ]
                 
-                published_at = datetime.now()
+                published_at = None
                 for selector in date_selectors:
                     try:
                         date_element = await page.query_selector(selector)
                         if date_element:
                             date_text = await date_element.inner_text()
-                            published_at = parse_timestamp(date_text)
+                            published_at = parse_timestamp(date_text, source="lost_ark", default_tz=KST)
                             break
                     except:
                         continue
                 
+                if published_at is None:
+                    published_at = datetime.now(timezone.utc)
+                
                 # 중요도 및 태그
-                is_important = self._is_important_news(title)
-                tags = self._extract_tags_from_title(title)
+                classification = TITLE_CLASSIFIER.classify(title)
+                is_important = classification.is_important
+                tags = classification.tags
                 
-                if self._is_maintenance_notice(title):
+                if classification.is_maintenance:
                     tags.extend(['점검', 'maintenance'])
                 
                 return self.create_game_news(
@@ -356,12 +424,14 @@ class LostArkScraper(BaseScraper):
             finally:
                 await page.close()
                 
+        except (DeadlineExceededException, CircuitOpenException):
+            raise
         except Exception as e:
             if "timeout" in str(e).lower():
                 raise TimeoutException(f"상세 정보 조회 타임아웃: {url}", self.timeout)
             raise ScrapingException(f"상세 정보 조회 중 오류 발생: {str(e)}")
     
-    async def _extract_detail_content(self, page: Page) -> Optional[str]:
+    async def _extract_detail_content(self, page: "Page") -> Optional[str]:
         """상세 페이지에서 본문 내용 추출"""
         content_selectors = [
             '.view-content', '.detail-content', '.content-body',
@@ -374,7 +444,7 @@ class LostArkScraper(BaseScraper):
                 content_element = await page.query_selector(selector)
                 if content_element:
                     content = await content_element.inner_text()
-                    return clean_text(content)
+                    return normalize_text(content, keep_newlines=True)
             except:
                 continue
         
@@ -402,56 +472,12 @@ class LostArkScraper(BaseScraper):
     
     def _is_important_news(self, title: str) -> bool:
         """뉴스 중요도 판단"""
-        if not title:
-            return False
-        
-        title_lower = title.lower()
-        
-        important_keywords = [
-            '긴급', '중요', '공지', '안내', '업데이트', '패치',
-            '점검', '오픈', '출시', '종료', '마감', '이벤트'
-        ]
-        
-        return any(keyword in title_lower for keyword in important_keywords)
+        return TITLE_CLASSIFIER.classify(title).is_important
     
     def _is_maintenance_notice(self, title: str) -> bool:
         """점검 공지 여부 판단"""
-        if not title:
-            return False
-        
-        title_lower = title.lower()
-        maintenance_keywords = [
-            '점검', 'maintenance', '서버점검', '정기점검', 
-            '긴급점검', '임시점검', '시스템점검'
-        ]
-        
-        return any(keyword in title_lower for keyword in maintenance_keywords)
+        return TITLE_CLASSIFIER.classify(title).is_maintenance
     
     def _extract_tags_from_title(self, title: str) -> List[str]:
         """제목에서 태그 추출"""
-        if not title:
-            return []
-        
-        tags = []
-        
-        # 대괄호 안의 내용 추출
-        bracket_matches = re.findall(r'\[([^\]]+)\]', title)
-        tags.extend(bracket_matches)
-        
-        # 키워드 기반 태그
-        keyword_tags = {
-            '업데이트': ['업데이트', 'update'],
-            '패치': ['패치', 'patch'],
-            '이벤트': ['이벤트', 'event'],
-            '점검': ['점검', 'maintenance'],
-            '공지': ['공지', 'notice'],
-            '출시': ['출시', 'release'],
-            '종료': ['종료', 'end']
-        }
-        
-        title_lower = title.lower()
-        for keyword, tag_list in keyword_tags.items():
-            if keyword in title_lower:
-                tags.extend(tag_list)
-        
-        return list(set(tags))  # 중복 제거 
\ No newline at end of file
+        return TITLE_CLASSIFIER.classify(title).tags
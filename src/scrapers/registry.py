@@ -0,0 +1,104 @@
+"""게임 스크래퍼 레지스트리
+
+게임 이름과 스크래퍼 모듈 경로만 등록해 두고, 스크래퍼 클래스(및 playwright 같은
+무거운 의존성)는 해당 게임이 처음 요청될 때 import 및 생성한다.
+"""
+
+import importlib
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from src.config.settings import settings
+from src.models.exceptions import UnsupportedGameException
+
+if TYPE_CHECKING:
+    from src.scrapers.base import BaseScraper
+
+
+class ScraperRegistry:
+    """게임별 스크래퍼 지연 생성 레지스트리"""
+
+    def __init__(self):
+        self._specs: Dict[str, Tuple[str, str, str]] = {}
+        self._instances: Dict[str, "BaseScraper"] = {}
+
+    def register(self, name: str, module_path: str, class_name: str, description: str = "") -> None:
+        """스크래퍼 등록
+
+        Args:
+            name: 게임 이름 (도구의 game 파라미터 값)
+            module_path: 스크래퍼 모듈 경로 (예: src.scrapers.lordnine)
+            class_name: 스크래퍼 클래스 이름
+            description: 게임 설명
+        """
+        self._specs[name] = (module_path, class_name, description)
+        self._instances.pop(name, None)
+
+    def names(self) -> List[str]:
+        """등록된 게임 이름 목록"""
+        return list(self._specs)
+
+    def description(self, name: str) -> str:
+        """게임 설명 반환"""
+        return self._specs[name][2] if name in self._specs else ""
+
+    def is_registered(self, name: Optional[str]) -> bool:
+        """등록 여부 확인"""
+        return name in self._specs
+
+    def is_loaded(self, name: str) -> bool:
+        """스크래퍼 인스턴스 생성 여부 확인"""
+        return name in self._instances
+
+    def get(self, name: Optional[str]) -> "BaseScraper":
+        """스크래퍼 인스턴스 반환 (최초 호출 시 import 및 생성)
+
+        Args:
+            name: 게임 이름
+
+        Returns:
+            BaseScraper: 스크래퍼 인스턴스
+
+        Raises:
+            UnsupportedGameException: 등록되지 않은 게임인 경우
+        """
+        if name not in self._specs:
+            raise UnsupportedGameException(str(name))
+
+        scraper = self._instances.get(name)
+        if scraper is None:
+            module_path, class_name, _ = self._specs[name]
+            module = importlib.import_module(module_path)
+            scraper = getattr(module, class_name)(timeout=settings.REQUEST_TIMEOUT)
+            self._instances[name] = scraper
+
+        return scraper
+
+    def loaded(self) -> Dict[str, "BaseScraper"]:
+        """생성된 스크래퍼 인스턴스 목록"""
+        return dict(self._instances)
+
+    async def close_all(self) -> None:
+        """생성된 스크래퍼의 세션/브라우저 정리"""
+        for scraper in self._instances.values():
+            await scraper.__aexit__(None, None, None)
+
+
+def create_default_registry() -> ScraperRegistry:
+    """설정에서 활성화된 게임으로 기본 레지스트리 생성"""
+    registry = ScraperRegistry()
+
+    games = {
+        "lordnine": ("src.scrapers.lordnine", "LordnineScraper", "로드나인"),
+        "epic_seven": ("src.scrapers.epic_seven", "EpicSevenScraper", "에픽세븐"),
+        "lost_ark": ("src.scrapers.lost_ark", "LostArkScraper", "로스트아크"),
+    }
+
+    for name in settings.ENABLED_GAMES:
+        if name in games:
+            registry.register(name, *games[name])
+
+    return registry
+
+
+# 전역 레지스트리 인스턴스
+registry = create_default_registry()
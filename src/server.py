@@ -7,7 +7,8 @@ import asyncio
 import logging
 import sys
 import json
-from typing import List, Sequence, Any, Dict
+from datetime import datetime
+from typing import List, Optional, Sequence, Any, Dict
 
 # MCP 관련 import
 from mcp.server import Server
@@ -15,11 +16,14 @@ from mcp.server.stdio import stdio_server
 from mcp.server.models import InitializationOptions
 from mcp.types import ServerCapabilities, Tool, TextContent, ToolsCapability
 
-# 게임 스크래퍼 import
-from src.scrapers.lordnine import LordnineScraper
-from src.scrapers.epic_seven import EpicSevenScraper
-from src.scrapers.lost_ark import LostArkScraper
-from src.models.exceptions import ScrapingException
+# 게임 스크래퍼 레지스트리 (스크래퍼는 처음 사용할 때 import 및 생성)
+from src.scrapers.registry import registry
+from src.services.news_service import NewsService
+from src.config.settings import settings
+from src.models.exceptions import ScrapingException, DeadlineExceededException
+from src.utils.deadline import deadline_scope
+from src.models.game_news import GameNews, NewsType
+from src.utils.helpers import filter_news_since, parse_timestamp
 
 # 로깅 설정
 logging.basicConfig(
@@ -32,13 +36,30 @@ logger = logging.getLogger(__name__)
 # 서버 생성
 app = Server("game-news-scraper")
 
-# 스크래퍼 인스턴스
-scrapers = {
-    "lordnine": LordnineScraper(),
-    "epic_seven": EpicSevenScraper(),
-    "lost_ark": LostArkScraper()
+# 캐시를 관리하는 뉴스 조회 서비스
+news_service = NewsService(registry)
+
+# 목록 도구 공통 커서/기간 파라미터 (폴링 클라이언트용)
+SINCE_PROPERTIES = {
+    "since": {
+        "type": "string",
+        "description": "이 시각 이후에 게시된 뉴스만 조회 (ISO 8601 또는 UNIX 타임스탬프)"
+    },
+    "since_id": {
+        "type": "string",
+        "description": "마지막으로 받은 게시글 ID (이 게시글보다 새로운 뉴스만 조회)"
+    },
+    "from": {
+        "type": "string",
+        "description": "이 시각 이후(포함)에 게시된 뉴스만 조회 (ISO 8601 또는 UNIX 타임스탬프)"
+    },
+    "to": {
+        "type": "string",
+        "description": "이 시각 이전(포함)에 게시된 뉴스만 조회 (ISO 8601 또는 UNIX 타임스탬프)"
+    }
 }
 
+
 @app.list_tools()
 async def list_tools() -> List[Tool]:
     """게임 뉴스 수집 도구 목록"""
@@ -53,8 +74,10 @@ async def list_tools() -> List[Tool]:
                 "properties": {
                     "game": {
                         "type": "string",
-                        "enum": ["lordnine", "epic_seven", "lost_ark"],
-                        "description": "게임 종류 (lordnine: 로드나인, epic_seven: 에픽세븐, lost_ark: 로스트아크)"
+                        "enum": registry.names(),
+                        "description": "게임 종류 (" + ", ".join(
+                            f"{game}: {registry.description(game)}" for game in registry.names()
+                        ) + ")"
                     },
                     "limit": {
                         "type": "integer",
@@ -62,7 +85,8 @@ async def list_tools() -> List[Tool]:
                         "minimum": 1,
                         "maximum": 50,
                         "description": "조회할 공지사항 수 (기본값: 10)"
-                    }
+                    },
+                    **SINCE_PROPERTIES
                 },
                 "required": ["game"]
             }
@@ -75,7 +99,7 @@ async def list_tools() -> List[Tool]:
                 "properties": {
                     "game": {
                         "type": "string",
-                        "enum": ["lordnine", "epic_seven", "lost_ark"],
+                        "enum": registry.names(),
                         "description": "게임 종류"
                     },
                     "url": {
@@ -94,7 +118,7 @@ async def list_tools() -> List[Tool]:
                 "properties": {
                     "game": {
                         "type": "string",
-                        "enum": ["lordnine", "epic_seven", "lost_ark"],
+                        "enum": registry.names(),
                         "description": "게임 종류"
                     },
                     "limit": {
@@ -103,7 +127,8 @@ async def list_tools() -> List[Tool]:
                         "minimum": 1,
                         "maximum": 50,
                         "description": "조회할 이벤트 수 (기본값: 10)"
-                    }
+                    },
+                    **SINCE_PROPERTIES
                 },
                 "required": ["game"]
             }
@@ -116,7 +141,7 @@ async def list_tools() -> List[Tool]:
                 "properties": {
                     "game": {
                         "type": "string",
-                        "enum": ["lordnine", "epic_seven", "lost_ark"],
+                        "enum": registry.names(),
                         "description": "게임 종류"
                     },
                     "url": {
@@ -135,7 +160,7 @@ async def list_tools() -> List[Tool]:
                 "properties": {
                     "game": {
                         "type": "string",
-                        "enum": ["lordnine", "epic_seven", "lost_ark"],
+                        "enum": registry.names(),
                         "description": "게임 종류"
                     },
                     "limit": {
@@ -144,7 +169,8 @@ async def list_tools() -> List[Tool]:
                         "minimum": 1,
                         "maximum": 50,
                         "description": "조회할 업데이트 수 (기본값: 10)"
-                    }
+                    },
+                    **SINCE_PROPERTIES
                 },
                 "required": ["game"]
             }
@@ -157,7 +183,7 @@ async def list_tools() -> List[Tool]:
                 "properties": {
                     "game": {
                         "type": "string",
-                        "enum": ["lordnine", "epic_seven", "lost_ark"],
+                        "enum": registry.names(),
                         "description": "게임 종류"
                     },
                     "url": {
@@ -167,6 +193,134 @@ async def list_tools() -> List[Tool]:
                 },
                 "required": ["game", "url"]
             }
+        ),
+        Tool(
+            name="search_news",
+            description="수집된 게시글(제목, 요약, 본문)을 검색어로 검색합니다. 공백으로 구분한 단어는 모두 포함, \"OR\" 또는 \"|\"로 구분하면 하나 이상 포함",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "검색어 (예: \"보상 | 점검 연장\")"
+                    },
+                    "game": {
+                        "type": "string",
+                        "enum": registry.names(),
+                        "description": "게임 종류 (미지정 시 전체)"
+                    },
+                    "category": {
+                        "type": "string",
+                        "enum": [category.value for category in NewsType],
+                        "description": "카테고리 (미지정 시 전체)"
+                    },
+                    "since": {
+                        "type": "string",
+                        "description": "이 시각 이후에 게시된 글만 검색 (ISO 8601 또는 UNIX 타임스탬프)"
+                    },
+                    "until": {
+                        "type": "string",
+                        "description": "이 시각 이전에 게시된 글만 검색 (ISO 8601 또는 UNIX 타임스탬프)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "default": 10,
+                        "minimum": 1,
+                        "maximum": 50,
+                        "description": "조회할 결과 수 (기본값: 10)"
+                    }
+                },
+                "required": ["query"]
+            }
+        ),
+        Tool(
+            name="get_news_by_tags",
+            description="수집된 게시글을 태그(점검, 이벤트 등)로 조회합니다",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "tags": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "minItems": 1,
+                        "description": "조회할 태그 목록"
+                    },
+                    "match": {
+                        "type": "string",
+                        "enum": ["and", "or"],
+                        "default": "or",
+                        "description": "and: 모든 태그 포함, or: 하나 이상 포함 (기본값: or)"
+                    },
+                    "game": {
+                        "type": "string",
+                        "enum": registry.names(),
+                        "description": "게임 종류 (미지정 시 전체)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "default": 10,
+                        "minimum": 1,
+                        "maximum": 50,
+                        "description": "조회할 게시글 수 (기본값: 10)"
+                    }
+                },
+                "required": ["tags"]
+            }
+        ),
+        Tool(
+            name="get_changed_news",
+            description="지정한 시각 이후 수정된 게시글(점검 연장, 패치 노트 정정 등)과 변경 내용(diff)만 조회합니다",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "since": {
+                        "type": "string",
+                        "description": "이 시각 이후 감지된 수정만 조회 (ISO 8601 또는 UNIX 타임스탬프)"
+                    },
+                    "game": {
+                        "type": "string",
+                        "enum": registry.names(),
+                        "description": "게임 종류 (미지정 시 전체)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "default": 10,
+                        "minimum": 1,
+                        "maximum": 50,
+                        "description": "조회할 수정 내역 수 (기본값: 10)"
+                    }
+                },
+                "required": ["since"]
+            }
+        ),
+        Tool(
+            name="trending_news",
+            description="최근 조회수가 빠르게 늘고 있는 게시글을 조회합니다 (수집한 조회수 기록 기준, 업스트림 호출 없음)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "game": {
+                        "type": "string",
+                        "enum": registry.names(),
+                        "description": "게임 종류 (미지정 시 전체)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "default": 10,
+                        "minimum": 1,
+                        "maximum": 50,
+                        "description": "조회할 게시글 수 (기본값: 10)"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="get_server_status",
+            description="서버 상태(캐시 warm-up 완료 여부 등)를 조회합니다",
+            inputSchema={
+                "type": "object",
+                "properties": {}
+            }
         )
     ]
     
@@ -175,77 +329,138 @@ async def list_tools() -> List[Tool]:
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> Sequence[TextContent]:
-    """도구 호출 처리"""
+    """도구 호출 처리 (호출 전체에 마감 시간 적용)"""
     logger.info(f"=== 도구 호출: {name}, 인수: {arguments} ===")
     
     try:
+        # 마감 시간은 재시도/fallback/브라우저 대기까지 전파되며,
+        # 초과 시 진행 중인 스크래핑 작업은 취소된다
+        with deadline_scope(settings.TOOL_DEADLINE):
+            return await asyncio.wait_for(dispatch_tool(name, arguments), timeout=settings.TOOL_DEADLINE)
+    except (asyncio.TimeoutError, DeadlineExceededException):
+        logger.warning(f"도구 실행 시간 초과: {name} ({settings.TOOL_DEADLINE}초)")
+        return [TextContent(type="text", text=f"⏱️ 요청 처리 시간({settings.TOOL_DEADLINE:g}초)을 초과했습니다. 잠시 후 다시 시도해주세요.")]
+
+async def dispatch_tool(name: str, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    """도구 이름에 따라 핸들러 실행"""
+    try:
+        if name == "get_server_status":
+            return await handle_get_server_status(arguments)
+        if name == "search_news":
+            return await handle_search_news(arguments)
+        if name == "get_news_by_tags":
+            return await handle_get_news_by_tags(arguments)
+        if name == "get_changed_news":
+            return await handle_get_changed_news(arguments)
+        if name == "trending_news":
+            return await handle_trending_news(arguments)
+        
         game = arguments.get("game")
-        if game not in scrapers:
+        if not registry.is_registered(game):
             return [TextContent(type="text", text=f"❌ 지원하지 않는 게임입니다: {game}")]
         
-        scraper = scrapers[game]
-        
         if name == "get_game_announcements":
-            return await handle_get_announcements(scraper, arguments)
+            return await handle_get_announcements(game, arguments)
         elif name == "get_announcement_detail":
-            return await handle_get_announcement_detail(scraper, arguments)
+            return await handle_get_announcement_detail(game, arguments)
         elif name == "get_game_events":
-            return await handle_get_events(scraper, arguments)
+            return await handle_get_events(game, arguments)
         elif name == "get_event_detail":
-            return await handle_get_event_detail(scraper, arguments)
+            return await handle_get_event_detail(game, arguments)
         elif name == "get_game_updates":
-            return await handle_get_updates(scraper, arguments)
+            return await handle_get_updates(game, arguments)
         elif name == "get_update_detail":
-            return await handle_get_update_detail(scraper, arguments)
+            return await handle_get_update_detail(game, arguments)
         else:
             return [TextContent(type="text", text=f"❌ 알 수 없는 도구: {name}")]
             
+    except DeadlineExceededException:
+        # 마감 시간 초과는 call_tool에서 시간 초과 응답으로 처리
+        raise
     except Exception as e:
         logger.error(f"도구 실행 중 오류: {e}", exc_info=True)
         return [TextContent(type="text", text=f"❌ 오류 발생: {str(e)}")]
 
-async def handle_get_announcements(scraper, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+def format_news_list(game, news_list: List[GameNews], arguments: Dict[str, Any], emoji: str, label: str) -> Sequence[TextContent]:
+    """뉴스 목록을 응답 텍스트로 변환
+    
+    since/since_id 커서가 주어지면 그 이후의 뉴스만 포함하며, 새 소식이 없을 때는
+    짧은 응답만 반환한다. 응답 끝에는 다음 폴링에 사용할 since_id를 포함한다.
+    """
+    limit = arguments.get("limit", 10)
+    since = arguments.get("since")
+    since_id = arguments.get("since_id")
+    
+    if since is not None or since_id:
+        news_list = filter_news_since(news_list, since, since_id)
+        if not news_list:
+            return [TextContent(type="text", text=f"🆕 새 {label}이(가) 없습니다.")]
+    
+    # 제한된 개수만 반환
+    limited_news = news_list[:limit]
+    
+    result = f"{emoji} **{game} {label}** ({len(limited_news)}개)\n\n"
+    
+    for i, news in enumerate(limited_news, 1):
+        result += f"**{i}. {news.title}**\n"
+        result += f"   📅 {news.published_at.astimezone().strftime('%Y-%m-%d %H:%M')}\n"
+        result += f"   🔗 {news.url}\n"
+        if news.tags:
+            result += f"   🏷️ {', '.join(news.tags)}\n"
+        also_in = news_service.other_categories(news)
+        if also_in:
+            result += f"   📂 함께 게시: {', '.join(also_in)}\n"
+        result += "\n"
+    
+    latest = max(limited_news, key=lambda news: news.published_at)
+    result += f"🔖 since_id: {latest.id}\n"
+    
+    return [TextContent(type="text", text=result)]
+
+def to_epoch(value: Any) -> Optional[int]:
+    """도구 인수의 시각 값을 epoch 초로 변환 (없으면 None)"""
+    if value is None:
+        return None
+    return int(parse_timestamp(value).timestamp())
+
+async def load_news_list(game: str, category: NewsType, arguments: Dict[str, Any]) -> List[GameNews]:
+    """목록 조회 (from/to가 있으면 발행 시각 범위 색인에서 조회)"""
+    start = arguments.get("from")
+    end = arguments.get("to")
+    if start is None and end is None:
+        return await news_service.get_news_list(game, category, arguments.get("since_id"))
+    return await news_service.get_news_range(game, category, to_epoch(start), to_epoch(end))
+
+async def handle_get_announcements(game: str, arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """공지사항 목록 조회 처리"""
     try:
-        limit = arguments.get("limit", 10)
-        announcements = await scraper.get_announcements()
+        announcements = await load_news_list(game, NewsType.ANNOUNCEMENT, arguments)
         
         if not announcements:
             return [TextContent(type="text", text="📋 공지사항이 없습니다.")]
         
-        # 제한된 개수만 반환
-        limited_announcements = announcements[:limit]
-        
-        result = f"📢 **{scraper.game_type.value} 공지사항** ({len(limited_announcements)}개)\n\n"
-        
-        for i, news in enumerate(limited_announcements, 1):
-            result += f"**{i}. {news.title}**\n"
-            result += f"   📅 {news.published_at.strftime('%Y-%m-%d %H:%M')}\n"
-            result += f"   🔗 {news.url}\n"
-            if news.tags:
-                result += f"   🏷️ {', '.join(news.tags)}\n"
-            result += "\n"
-        
-        return [TextContent(type="text", text=result)]
+        return format_news_list(game, announcements, arguments, "📢", "공지사항")
         
+    except DeadlineExceededException:
+        raise
     except Exception as e:
         logger.error(f"공지사항 조회 오류: {e}", exc_info=True)
         return [TextContent(type="text", text=f"❌ 공지사항 조회 중 오류 발생: {str(e)}")]
 
-async def handle_get_announcement_detail(scraper, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+async def handle_get_announcement_detail(game: str, arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """공지사항 상세 조회 처리"""
     try:
         url = arguments.get("url")
         if not url:
             return [TextContent(type="text", text="❌ URL이 필요합니다.")]
         
-        detail = await scraper.get_announcement_detail(url)
+        detail = await news_service.get_news_detail(game, NewsType.ANNOUNCEMENT, url)
         
         if not detail:
             return [TextContent(type="text", text="❌ 공지사항 상세 정보를 찾을 수 없습니다.")]
         
         result = f"📢 **{detail.title}**\n\n"
-        result += f"📅 **게시일:** {detail.published_at.strftime('%Y-%m-%d %H:%M')}\n"
+        result += f"📅 **게시일:** {detail.published_at.astimezone().strftime('%Y-%m-%d %H:%M')}\n"
         result += f"🔗 **URL:** {detail.url}\n"
         if detail.tags:
             result += f"🏷️ **태그:** {', '.join(detail.tags)}\n"
@@ -257,51 +472,42 @@ async def handle_get_announcement_detail(scraper, arguments: Dict[str, Any]) ->
         
         return [TextContent(type="text", text=result)]
         
+    except DeadlineExceededException:
+        raise
     except Exception as e:
         logger.error(f"공지사항 상세 조회 오류: {e}", exc_info=True)
         return [TextContent(type="text", text=f"❌ 공지사항 상세 조회 중 오류 발생: {str(e)}")]
 
-async def handle_get_events(scraper, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+async def handle_get_events(game: str, arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """이벤트 목록 조회 처리"""
     try:
-        limit = arguments.get("limit", 10)
-        events = await scraper.get_events()
+        events = await load_news_list(game, NewsType.EVENT, arguments)
         
         if not events:
             return [TextContent(type="text", text="🎉 진행 중인 이벤트가 없습니다.")]
         
-        limited_events = events[:limit]
-        
-        result = f"🎉 **{scraper.game_type.value} 이벤트** ({len(limited_events)}개)\n\n"
-        
-        for i, news in enumerate(limited_events, 1):
-            result += f"**{i}. {news.title}**\n"
-            result += f"   📅 {news.published_at.strftime('%Y-%m-%d %H:%M')}\n"
-            result += f"   🔗 {news.url}\n"
-            if news.tags:
-                result += f"   🏷️ {', '.join(news.tags)}\n"
-            result += "\n"
-        
-        return [TextContent(type="text", text=result)]
+        return format_news_list(game, events, arguments, "🎉", "이벤트")
         
+    except DeadlineExceededException:
+        raise
     except Exception as e:
         logger.error(f"이벤트 조회 오류: {e}", exc_info=True)
         return [TextContent(type="text", text=f"❌ 이벤트 조회 중 오류 발생: {str(e)}")]
 
-async def handle_get_event_detail(scraper, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+async def handle_get_event_detail(game: str, arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """이벤트 상세 조회 처리"""
     try:
         url = arguments.get("url")
         if not url:
             return [TextContent(type="text", text="❌ URL이 필요합니다.")]
         
-        detail = await scraper.get_event_detail(url)
+        detail = await news_service.get_news_detail(game, NewsType.EVENT, url)
         
         if not detail:
             return [TextContent(type="text", text="❌ 이벤트 상세 정보를 찾을 수 없습니다.")]
         
         result = f"🎉 **{detail.title}**\n\n"
-        result += f"📅 **게시일:** {detail.published_at.strftime('%Y-%m-%d %H:%M')}\n"
+        result += f"📅 **게시일:** {detail.published_at.astimezone().strftime('%Y-%m-%d %H:%M')}\n"
         result += f"🔗 **URL:** {detail.url}\n"
         if detail.tags:
             result += f"🏷️ **태그:** {', '.join(detail.tags)}\n"
@@ -313,51 +519,42 @@ async def handle_get_event_detail(scraper, arguments: Dict[str, Any]) -> Sequenc
         
         return [TextContent(type="text", text=result)]
         
+    except DeadlineExceededException:
+        raise
     except Exception as e:
         logger.error(f"이벤트 상세 조회 오류: {e}", exc_info=True)
         return [TextContent(type="text", text=f"❌ 이벤트 상세 조회 중 오류 발생: {str(e)}")]
 
-async def handle_get_updates(scraper, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+async def handle_get_updates(game: str, arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """업데이트 목록 조회 처리"""
     try:
-        limit = arguments.get("limit", 10)
-        updates = await scraper.get_updates()
+        updates = await load_news_list(game, NewsType.UPDATE, arguments)
         
         if not updates:
             return [TextContent(type="text", text="🔄 최근 업데이트가 없습니다.")]
         
-        limited_updates = updates[:limit]
-        
-        result = f"🔄 **{scraper.game_type.value} 업데이트** ({len(limited_updates)}개)\n\n"
-        
-        for i, news in enumerate(limited_updates, 1):
-            result += f"**{i}. {news.title}**\n"
-            result += f"   📅 {news.published_at.strftime('%Y-%m-%d %H:%M')}\n"
-            result += f"   🔗 {news.url}\n"
-            if news.tags:
-                result += f"   🏷️ {', '.join(news.tags)}\n"
-            result += "\n"
-        
-        return [TextContent(type="text", text=result)]
+        return format_news_list(game, updates, arguments, "🔄", "업데이트")
         
+    except DeadlineExceededException:
+        raise
     except Exception as e:
         logger.error(f"업데이트 조회 오류: {e}", exc_info=True)
         return [TextContent(type="text", text=f"❌ 업데이트 조회 중 오류 발생: {str(e)}")]
 
-async def handle_get_update_detail(scraper, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+async def handle_get_update_detail(game: str, arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """업데이트 상세 조회 처리"""
     try:
         url = arguments.get("url")
         if not url:
             return [TextContent(type="text", text="❌ URL이 필요합니다.")]
         
-        detail = await scraper.get_update_detail(url)
+        detail = await news_service.get_news_detail(game, NewsType.UPDATE, url)
         
         if not detail:
             return [TextContent(type="text", text="❌ 업데이트 상세 정보를 찾을 수 없습니다.")]
         
         result = f"🔄 **{detail.title}**\n\n"
-        result += f"📅 **게시일:** {detail.published_at.strftime('%Y-%m-%d %H:%M')}\n"
+        result += f"📅 **게시일:** {detail.published_at.astimezone().strftime('%Y-%m-%d %H:%M')}\n"
         result += f"🔗 **URL:** {detail.url}\n"
         if detail.tags:
             result += f"🏷️ **태그:** {', '.join(detail.tags)}\n"
@@ -369,10 +566,159 @@ async def handle_get_update_detail(scraper, arguments: Dict[str, Any]) -> Sequen
         
         return [TextContent(type="text", text=result)]
         
+    except DeadlineExceededException:
+        raise
     except Exception as e:
         logger.error(f"업데이트 상세 조회 오류: {e}", exc_info=True)
         return [TextContent(type="text", text=f"❌ 업데이트 상세 조회 중 오류 발생: {str(e)}")]
 
+async def handle_search_news(arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    """수집된 게시글 전문 검색 처리 (업스트림 호출 없음)"""
+    query = (arguments.get("query") or "").strip()
+    if not query:
+        return [TextContent(type="text", text="❌ 검색어가 필요합니다.")]
+    
+    game = arguments.get("game")
+    if game is not None and not registry.is_registered(game):
+        return [TextContent(type="text", text=f"❌ 지원하지 않는 게임입니다: {game}")]
+    
+    category = arguments.get("category")
+    since = arguments.get("since")
+    until = arguments.get("until")
+    try:
+        category = NewsType(category) if category else None
+        since_ts = to_epoch(since)
+        until_ts = to_epoch(until)
+    except ValueError as e:
+        return [TextContent(type="text", text=f"❌ 잘못된 검색 조건입니다: {e}")]
+    
+    hits = news_service.search(
+        query, game=game, category=category,
+        since_ts=since_ts, until_ts=until_ts, limit=arguments.get("limit", 10)
+    )
+    if not hits:
+        return [TextContent(type="text", text=f"🔍 '{query}'에 대한 검색 결과가 없습니다.")]
+    
+    result = f"🔍 **'{query}' 검색 결과** ({len(hits)}개)\n\n"
+    for i, hit in enumerate(hits, 1):
+        result += f"**{i}. {hit.title}**\n"
+        result += f"   🎮 {hit.game} / {hit.category}\n"
+        result += f"   📅 {datetime.fromtimestamp(hit.published_ts).strftime('%Y-%m-%d %H:%M')}\n"
+        result += f"   🔗 {hit.url}\n\n"
+    
+    return [TextContent(type="text", text=result)]
+
+async def handle_get_news_by_tags(arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    """태그로 수집된 게시글 조회 처리 (업스트림 호출 없음)"""
+    tags = arguments.get("tags") or []
+    if isinstance(tags, str):
+        tags = [tags]
+    if not tags:
+        return [TextContent(type="text", text="❌ 조회할 태그가 필요합니다.")]
+    
+    game = arguments.get("game")
+    if game is not None and not registry.is_registered(game):
+        return [TextContent(type="text", text=f"❌ 지원하지 않는 게임입니다: {game}")]
+    
+    match = arguments.get("match", "or")
+    try:
+        news_list = news_service.find_by_tags(tags, match, game=game, limit=arguments.get("limit", 10))
+    except ValueError as e:
+        return [TextContent(type="text", text=f"❌ {e}")]
+    
+    joined = f" {match.upper()} ".join(tags)
+    if not news_list:
+        available = ", ".join(list(news_service.tag_index.tag_counts(game))[:20]) or "없음"
+        return [TextContent(type="text", text=f"🏷️ '{joined}' 태그의 게시글이 없습니다.\n수집된 태그: {available}")]
+    
+    result = f"🏷️ **'{joined}' 태그 게시글** ({len(news_list)}개)\n\n"
+    for i, news in enumerate(news_list, 1):
+        result += f"**{i}. {news.title}**\n"
+        result += f"   🎮 {news.game} / {news.category}\n"
+        result += f"   📅 {news.published_at.astimezone().strftime('%Y-%m-%d %H:%M')}\n"
+        result += f"   🔗 {news.url}\n"
+        result += f"   🏷️ {', '.join(news.tags)}\n\n"
+    
+    return [TextContent(type="text", text=result)]
+
+async def handle_get_changed_news(arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    """수정된 게시글과 diff 조회 처리 (업스트림 호출 없음)"""
+    game = arguments.get("game")
+    if game is not None and not registry.is_registered(game):
+        return [TextContent(type="text", text=f"❌ 지원하지 않는 게임입니다: {game}")]
+    
+    try:
+        since_ts = to_epoch(arguments.get("since"))
+    except ValueError as e:
+        return [TextContent(type="text", text=f"❌ 잘못된 기준 시각입니다: {e}")]
+    if since_ts is None:
+        return [TextContent(type="text", text="❌ 기준 시각(since)이 필요합니다.")]
+    
+    revisions = news_service.changed_since(since_ts, game=game, limit=arguments.get("limit", 10))
+    if not revisions:
+        return [TextContent(type="text", text="✏️ 그 이후 수정된 게시글이 없습니다.")]
+    
+    result = f"✏️ **수정된 게시글** ({len(revisions)}개)\n\n"
+    for i, revision in enumerate(revisions, 1):
+        result += f"**{i}. {revision.title}** (r{revision.number})\n"
+        result += f"   🎮 {revision.game}\n"
+        result += f"   🕒 {datetime.fromtimestamp(revision.changed_at).strftime('%Y-%m-%d %H:%M')} 감지\n"
+        result += f"   🔗 {revision.url}\n"
+        result += f"```diff\n{revision.diff}\n```\n\n"
+    
+    return [TextContent(type="text", text=result)]
+
+async def handle_trending_news(arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    """조회수 증가량 기준 인기 급상승 게시글 조회 처리 (업스트림 호출 없음)"""
+    game = arguments.get("game")
+    if game is not None and not registry.is_registered(game):
+        return [TextContent(type="text", text=f"❌ 지원하지 않는 게임입니다: {game}")]
+    
+    trending = news_service.trending(game=game, limit=arguments.get("limit", 10))
+    if not trending:
+        return [TextContent(type="text", text="🔥 아직 조회수 기록이 충분하지 않습니다. 게시글 목록을 조회한 뒤 다시 시도해주세요.")]
+    
+    result = f"🔥 **인기 급상승 게시글** (최근 {settings.TRENDING_WINDOW_HOURS:g}시간, {len(trending)}개)\n\n"
+    for i, (news, entry) in enumerate(trending, 1):
+        result += f"**{i}. {news.title}**\n"
+        result += f"   🎮 {news.game}\n"
+        result += f"   📈 시간당 +{entry.velocity:,.0f} 조회 (누적 {entry.views:,})\n"
+        result += f"   📅 {news.published_at.astimezone().strftime('%Y-%m-%d %H:%M')}\n"
+        result += f"   🔗 {news.url}\n\n"
+    
+    return [TextContent(type="text", text=result)]
+
+async def handle_get_server_status(arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    """서버 상태 조회 처리"""
+    status = news_service.status()
+    
+    if status["warmup_complete"]:
+        warmup = "완료"
+        if status["warmup_failures"]:
+            warmup += f" (실패 {status['warmup_failures']}건)"
+    elif status["warmup_running"]:
+        warmup = "진행 중"
+    elif status["warmup_error"]:
+        warmup = f"실패 ({status['warmup_error']})"
+    else:
+        warmup = "사용 안 함"
+    
+    result = "🩺 **서버 상태**\n\n"
+    result += f"🔥 **캐시 warm-up:** {warmup}\n"
+    result += f"🎮 **로드된 스크래퍼:** {', '.join(status['loaded_scrapers']) or '없음'}\n"
+    result += f"📦 **캐시된 목록:** {status['cached_lists']}개\n"
+    result += f"📄 **캐시된 상세:** {status['cached_details']}개\n"
+    result += f"🔍 **검색 인덱스:** {status['indexed_articles']}개\n"
+    result += f"🏷️ **색인된 태그:** {status['indexed_tags']}개\n"
+    result += f"🗄️ **아카이브된 게시글:** {status['archived_articles']}개\n"
+    result += f"✏️ **감지된 수정:** {status['revisions']}건\n"
+    result += f"🔗 **중복 묶음:** {status['duplicate_groups']}개\n"
+    result += f"📈 **조회수 추적 게시글:** {status['tracked_view_series']}개\n"
+    result += f"⛔ **차단된 엔드포인트:** {', '.join(status['open_circuits']) or '없음'}\n"
+    result += f"🪃 **헤지 요청:** {status['hedged_requests']}회\n"
+    
+    return [TextContent(type="text", text=result)]
+
 async def main():
     logger.info("=== 게임 뉴스 수집 MCP 서버 시작 ===")
     
@@ -380,6 +726,15 @@ async def main():
         async with stdio_server() as (read_stream, write_stream):
             logger.info("=== STDIO 서버 시작됨 ===")
             
+            # 이전 실행의 캐시 스냅샷 복원 후 주기적 저장 시작
+            news_service.restore_snapshot()
+            news_service.start_snapshots()
+            
+            # 캐시 warm-up은 백그라운드에서 진행 (STDIO 루프를 막지 않음)
+            # (스냅샷에서 복원된 유효 항목은 다시 가져오지 않음)
+            if settings.PREFETCH_ON_STARTUP:
+                news_service.start_prefetch()
+            
             # 명시적으로 툴 기능 활성화
             capabilities = ServerCapabilities(
                 tools=ToolsCapability(listChanged=True)
@@ -397,6 +752,9 @@ async def main():
     except Exception as e:
         logger.error(f"서버 실행 오류: {e}", exc_info=True)
         raise
+    finally:
+        await registry.close_all()
+        news_service.close()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
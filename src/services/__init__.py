@@ -0,0 +1,8 @@
+"""뉴스 조회 서비스 패키지"""
+
+from .news_service import NewsService, CATEGORY_METHODS
+
+__all__ = [
+    "NewsService",
+    "CATEGORY_METHODS",
+]
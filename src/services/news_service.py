@@ -0,0 +1,507 @@
+"""뉴스 조회 서비스
+
+MCP 도구와 스크래퍼 사이에서 캐시를 관리하고, 서버 시작 시 설정된 게임의 목록을
+백그라운드에서 미리 가져오는(warm-up) 기능을 제공한다. 캐시에는 GameNews 대신 경량
+ArticleRecord를 보관하고 응답할 때 GameNews로 되돌린다. 스크래퍼에서 가져온 게시글은
+_ingest()를 거쳐 로컬 인덱스(전문 검색, 태그 역색인, 발행 시각 범위 색인)에 증분 반영되고,
+본문이 있는 레코드는 디스크 아카이브에 보관된다. 같은 게시글을 다시 가져오면 수정 여부를
+비교해 리비전으로 기록하고, 여러 게시판에 올라온 중복 게시글은 하나의 대표 게시글로 묶는다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.config.settings import settings
+from src.models.exceptions import CircuitOpenException, DeadlineExceededException
+from src.models.game_news import GameNews, NewsType
+from src.scrapers.registry import ScraperRegistry
+from src.storage.cache import TTLCache
+from src.storage.archive import ContentArchive
+from src.storage.dedup import DuplicateIndex
+from src.storage.records import ArticleRecord
+from src.storage.revisions import Revision, RevisionStore
+from src.storage.search_index import SearchHit, SearchIndex
+from src.storage.snapshot import collect_entries, read_snapshot, restore_entries, write_snapshot
+from src.storage.tag_index import MATCH_ANY, TagIndex
+from src.storage.time_index import TimeIndex
+from src.storage.view_series import TrendingEntry, ViewSeriesStore
+from src.utils.hedging import hedger
+from src.utils.resilience import circuit_breakers
+
+logger = logging.getLogger(__name__)
+
+# 카테고리별 스크래퍼 메서드 이름 (목록, 상세)
+CATEGORY_METHODS: Dict[NewsType, Tuple[str, str]] = {
+    NewsType.ANNOUNCEMENT: ("get_announcements", "get_announcement_detail"),
+    NewsType.EVENT: ("get_events", "get_event_detail"),
+    NewsType.UPDATE: ("get_updates", "get_update_detail"),
+}
+
+
+class NewsService:
+    """캐시를 거쳐 게임 뉴스를 조회하는 서비스"""
+
+    def __init__(self, registry: ScraperRegistry, cache_ttl: int = settings.CACHE_TTL,
+                 enable_cache: bool = settings.ENABLE_CACHE,
+                 enable_search: bool = settings.ENABLE_SEARCH_INDEX,
+                 archive_dir: str = settings.ARCHIVE_DIR,
+                 snapshot_path: str = settings.SNAPSHOT_PATH):
+        """
+        Args:
+            registry: 스크래퍼 레지스트리
+            cache_ttl: 캐시 유효 시간 (초)
+            enable_cache: 캐시 사용 여부
+            enable_search: 전문 검색 인덱스 사용 여부
+            archive_dir: 본문 아카이브 디렉터리 (빈 문자열이면 사용 안 함)
+            snapshot_path: 캐시 스냅샷 파일 경로 (빈 문자열이면 사용 안 함)
+        """
+        self.registry = registry
+        self.enable_cache = enable_cache
+        self.list_cache = TTLCache(cache_ttl, settings.CACHE_MAX_ENTRIES, settings.CACHE_MAX_STALE)
+        self.detail_cache = TTLCache(cache_ttl, settings.CACHE_MAX_ENTRIES, settings.CACHE_MAX_STALE)
+        self.search_index = SearchIndex(settings.SEARCH_INDEX_PATH) if enable_search else None
+        self.tag_index = TagIndex()
+        self.time_index = TimeIndex()
+        self.archive = ContentArchive(archive_dir) if archive_dir else None
+        self.revisions = RevisionStore()
+        self.duplicates = DuplicateIndex()
+        self.views = ViewSeriesStore(window=int(settings.TRENDING_WINDOW_HOURS * 3600))
+
+        # 캐시 스냅샷 상태
+        self.snapshot_path = snapshot_path
+        self.snapshot_task: Optional[asyncio.Task] = None
+        self._snapshot_version: Optional[Tuple[int, int]] = None
+
+        # warm-up 상태
+        self.warmup_complete = False
+        self.warmup_task: Optional[asyncio.Task] = None
+        # warm-up 전체가 실패한 이유 / 미리 채우지 못한 (게임, 카테고리) 수
+        self.warmup_error: Optional[str] = None
+        self.warmup_failures = 0
+
+    async def get_news_list(self, game: str, category: NewsType,
+                            since_id: Optional[str] = None) -> List[GameNews]:
+        """뉴스 목록 조회
+
+        Args:
+            game: 게임 이름
+            category: 뉴스 카테고리
+            since_id: 이미 받은 최신 게시글 ID
+
+        Returns:
+            List[GameNews]: 뉴스 목록
+        """
+        key = (game, category.value)
+        if self.enable_cache:
+            cached = self.list_cache.get(key)
+            if cached is not None:
+                return [record.to_game_news() for record in cached]
+
+        scraper = self.registry.get(game)
+        try:
+            news_list = await getattr(scraper, CATEGORY_METHODS[category][0])(since_id=since_id)
+        except (DeadlineExceededException, CircuitOpenException) as e:
+            # 마감 시간 초과/업스트림 차단 시 만료된 캐시라도 있으면 최선의 결과로 반환
+            stale = self.list_cache.get_stale(key)
+            if stale is None:
+                raise
+            logger.warning(f"만료된 캐시 반환 ({type(e).__name__}): {game}/{category.value}")
+            return [record.to_game_news() for record in stale]
+
+        records = tuple(ArticleRecord.from_game_news(news) for news in news_list)
+        self._ingest(records)
+        self._cache_bodies(game, category, records)
+
+        # since_id로 중간에 끊긴 목록은 캐시하지 않음
+        if not since_id:
+            if records:
+                # 페이지 마지막 글 ~ 지금 사이의 글은 모두 확인함
+                self.time_index.mark_covered(game, category.value, records[-1].published_ts, int(time.time()))
+            if self.enable_cache:
+                self.list_cache.set(key, records)
+
+        return news_list
+
+    async def get_news_detail(self, game: str, category: NewsType, url: str) -> Optional[GameNews]:
+        """뉴스 상세 조회
+
+        Args:
+            game: 게임 이름
+            category: 뉴스 카테고리
+            url: 게시글 URL
+
+        Returns:
+            Optional[GameNews]: 뉴스 상세 정보
+        """
+        key = (game, category.value, str(url))
+        if self.enable_cache:
+            cached = self.detail_cache.get(key)
+            if cached is not None:
+                return cached.to_game_news()
+
+        archived = self._from_archive(game, str(url))
+        if archived is not None:
+            if self.enable_cache:
+                self.detail_cache.set(key, archived)
+            return archived.to_game_news()
+
+        scraper = self.registry.get(game)
+        try:
+            detail = await getattr(scraper, CATEGORY_METHODS[category][1])(url)
+        except (DeadlineExceededException, CircuitOpenException) as e:
+            stale = self.detail_cache.get_stale(key)
+            if stale is None:
+                raise
+            logger.warning(f"만료된 캐시 반환 ({type(e).__name__}): {game}/{url}")
+            return stale.to_game_news()
+
+        if detail is not None:
+            record = ArticleRecord.from_game_news(detail)
+            self._ingest((record,))
+            if self.enable_cache:
+                self.detail_cache.set(key, record)
+
+        return detail
+
+    def _cache_bodies(self, game: str, category: NewsType, records: Tuple[ArticleRecord, ...]) -> None:
+        """목록에 본문이 포함된 게시글을 상세 캐시에 저장 (이후 상세 조회는 API 호출 없음)"""
+        if not self.enable_cache:
+            return
+        for record in records:
+            if record.content is not None:
+                self.detail_cache.set((game, category.value, record.url), record)
+
+    def _from_archive(self, game: str, url: str) -> Optional[ArticleRecord]:
+        """아카이브된 오래된 게시글 조회 (최근 게시글은 수정될 수 있으므로 None)"""
+        if self.archive is None:
+            return None
+        record = self.archive.get(url)
+        if record is None or record.game != game:
+            return None
+        if time.time() - record.published_ts < settings.ARCHIVE_AFTER_DAYS * 86400:
+            return None
+        return record
+
+    def _ingest(self, records: Tuple[ArticleRecord, ...], now: Optional[float] = None) -> None:
+        """스크래퍼에서 가져온 레코드를 로컬 인덱스에 반영
+
+        Args:
+            records: 가져온 레코드
+            now: 수집 시각 (기본값: 현재 시각, 스냅샷 복원 시 저장 시각)
+        """
+        now = time.time() if now is None else now
+        if self.search_index is not None:
+            self.search_index.add(records)
+        self.tag_index.add(records)
+        self.time_index.add(records)
+        self.duplicates.add_many(records)
+        self.views.observe_many(records, now)
+        for revision in self.revisions.observe_many(records, now):
+            logger.info(f"게시글 수정 감지: {revision.key} r{revision.number} ({revision.title})")
+        if self.archive is not None:
+            for record in records:
+                if record.content is not None:
+                    self.archive.put(record)
+
+    def search(self, query: str, game: Optional[str] = None, category: Optional[NewsType] = None,
+               since_ts: Optional[int] = None, until_ts: Optional[int] = None,
+               limit: int = 10) -> List[SearchHit]:
+        """수집된 게시글 전문 검색 (업스트림 호출 없음)
+
+        Args:
+            query: 검색어 (공백: AND, "OR" 또는 "|": OR)
+            game: 게임 필터
+            category: 카테고리 필터
+            since_ts: 이 시각(epoch 초) 이후 발행
+            until_ts: 이 시각(epoch 초) 이전 발행
+            limit: 최대 결과 수
+
+        Returns:
+            List[SearchHit]: 관련도 순 검색 결과 (인덱스를 사용하지 않으면 빈 목록)
+        """
+        if self.search_index is None:
+            return []
+        # 중복 게시글을 묶은 뒤에도 limit개를 채울 수 있도록 넉넉히 조회
+        hits = self.search_index.search(
+            query, game=game, category=category.value if category else None,
+            since_ts=since_ts, until_ts=until_ts, limit=limit * 2
+        )
+        return self.duplicates.collapse(hits)[:limit]
+
+    async def get_news_range(self, game: str, category: NewsType, start_ts: Optional[int] = None,
+                             end_ts: Optional[int] = None) -> List[GameNews]:
+        """발행 시각 범위로 뉴스 목록 조회
+
+        범위가 이미 확인한 구간(목록 조회 시점에서 캐시 TTL 이내) 안이면 색인만으로
+        답하고, 아니면 목록을 가져와 색인을 갱신한 뒤 색인에서 답한다. 여러 페이지 조회를
+        지원하는 스크래퍼(get_history)는 start_ts에 도달할 때까지 과거 페이지를 가져온다.
+
+        Args:
+            game: 게임 이름
+            category: 뉴스 카테고리
+            start_ts: 시작 시각 (epoch 초, 포함)
+            end_ts: 끝 시각 (epoch 초, 포함)
+
+        Returns:
+            List[GameNews]: 최신순 뉴스 목록
+        """
+        now = int(time.time())
+        lo = start_ts if start_ts is not None else 0
+        hi = min(end_ts, now) if end_ts is not None else now
+        if not self.time_index.covers(game, category.value, lo, hi, slack=self.list_cache.ttl):
+            scraper = self.registry.get(game)
+            if start_ts is not None and hasattr(scraper, "get_history"):
+                await self._backfill(scraper, game, category, start_ts)
+            else:
+                await self.get_news_list(game, category)
+
+        return [
+            record.to_game_news()
+            for record in self.time_index.range(game, category.value, start_ts, end_ts)
+        ]
+
+    async def _backfill(self, scraper, game: str, category: NewsType, until_ts: int) -> None:
+        """until_ts까지 게시판 과거 페이지를 가져와 색인에 반영"""
+        news_list, exhausted = await scraper.get_history(category, until_ts=until_ts)
+        records = tuple(ArticleRecord.from_game_news(news) for news in news_list)
+        self._ingest(records)
+        self._cache_bodies(game, category, records)
+        if exhausted:
+            # 게시판 끝까지 확인했으므로 지금 이전의 글은 모두 확인함
+            self.time_index.mark_covered(game, category.value, 0, int(time.time()))
+        elif records:
+            # 마지막 페이지의 마지막 글 ~ 지금 사이의 글은 모두 확인함 (상단 고정 글은 페이지 앞쪽)
+            self.time_index.mark_covered(game, category.value, records[-1].published_ts, int(time.time()))
+
+    def changed_since(self, since_ts: float, game: Optional[str] = None,
+                      limit: Optional[int] = None) -> List[Revision]:
+        """since_ts 이후 수정이 감지된 게시글과 diff (업스트림 호출 없음)
+
+        Args:
+            since_ts: 기준 시각 (epoch 초)
+            game: 게임 필터
+            limit: 최대 결과 수
+
+        Returns:
+            List[Revision]: 최신순 리비전
+        """
+        return self.revisions.changed_since(since_ts, game=game, limit=limit)
+
+    def trending(self, game: Optional[str] = None, limit: int = 10) -> List[Tuple[GameNews, TrendingEntry]]:
+        """최근 조회수 증가량이 큰 게시글 (업스트림 호출 없음)
+
+        Args:
+            game: 게임 필터 (기본값: 전체 게임)
+            limit: 최대 결과 수
+
+        Returns:
+            List[Tuple[GameNews, TrendingEntry]]: 증가량 내림차순 (중복 게시글은 하나로 묶음)
+        """
+        entries = self.views.trending(time.time(), game=game, limit=limit * 2)
+        kept = {id(record) for record in self.duplicates.collapse(entry.record for entry in entries)}
+        entries = [entry for entry in entries if id(entry.record) in kept]
+        return [(entry.record.to_game_news(), entry) for entry in entries[:limit]]
+
+    def other_categories(self, news: GameNews) -> List[str]:
+        """같은 게시글(또는 중복 게시글)이 함께 올라온 다른 카테고리
+
+        Args:
+            news: 대상 게시글
+
+        Returns:
+            List[str]: news.category를 제외한 카테고리 목록
+        """
+        category = getattr(news.category, "value", news.category)
+        game = getattr(news.game, "value", news.game)
+        return [other for other in self.duplicates.categories(f"{game}:{news.id}") if other != category]
+
+    def find_by_tags(self, tags: List[str], mode: str = MATCH_ANY, game: Optional[str] = None,
+                     limit: Optional[int] = None) -> List[GameNews]:
+        """태그로 수집된 게시글 조회 (업스트림 호출 없음)
+
+        Args:
+            tags: 조회할 태그
+            mode: "and"(모든 태그 포함) 또는 "or"(하나 이상 포함)
+            game: 게임 필터
+            limit: 최대 결과 수
+
+        Returns:
+            List[GameNews]: 최신순 게시글
+
+        Raises:
+            ValueError: 지원하지 않는 mode인 경우
+        """
+        records = self.duplicates.collapse(self.tag_index.query(tags, mode, game=game))
+        return [record.to_game_news() for record in records[:limit]]
+
+    async def prefetch(self, games: Optional[List[str]] = None,
+                       categories: Optional[List[NewsType]] = None,
+                       detail_top_n: int = 0) -> None:
+        """설정된 (게임, 카테고리) 목록을 동시에 미리 조회하여 캐시를 채움
+
+        개별 조회 실패는 로그를 남기고 warmup_failures로 집계한다. 끝까지 실행되면
+        warmup_complete가 True가 되고, 도중에 중단되면 warmup_error에 이유를 남긴다.
+
+        Args:
+            games: 대상 게임 목록 (기본값: 등록된 전체 게임)
+            categories: 대상 카테고리 목록 (기본값: 전체 카테고리)
+            detail_top_n: 목록별로 상세 정보까지 가져올 상위 게시글 수
+        """
+        games = [game for game in (games or self.registry.names()) if self.registry.is_registered(game)]
+        categories = categories or list(NewsType)
+        semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+
+        async def warm(game: str, category: NewsType) -> None:
+            try:
+                async with semaphore:
+                    news_list = await self.get_news_list(game, category)
+                for news in news_list[:detail_top_n]:
+                    async with semaphore:
+                        await self.get_news_detail(game, category, str(news.url))
+            except Exception as e:
+                self.warmup_failures += 1
+                logger.warning(f"캐시 미리 채우기 실패 ({game}/{category.value}): {e}")
+
+        self.warmup_error = None
+        self.warmup_failures = 0
+        try:
+            logger.info(f"=== 캐시 warm-up 시작: {games} x {[c.value for c in categories]} ===")
+            await asyncio.gather(*(warm(game, category) for game in games for category in categories))
+        except asyncio.CancelledError:
+            self.warmup_error = "취소됨"
+            raise
+        except Exception as e:
+            self.warmup_error = str(e) or type(e).__name__
+            logger.error(f"캐시 warm-up 실패: {e}", exc_info=True)
+            return
+
+        self.warmup_complete = True
+        logger.info(f"=== 캐시 warm-up 완료 (실패 {self.warmup_failures}건) ===")
+
+    def start_prefetch(self) -> asyncio.Task:
+        """설정값으로 백그라운드 warm-up 작업 시작 (호출자를 블로킹하지 않음)"""
+        categories = [NewsType(category) for category in settings.PREFETCH_CATEGORIES] or None
+        self.warmup_task = asyncio.create_task(self.prefetch(
+            games=settings.PREFETCH_GAMES or None,
+            categories=categories,
+            detail_top_n=settings.PREFETCH_DETAIL_TOP_N
+        ))
+        return self.warmup_task
+
+    def _snapshot_caches(self) -> Dict[str, TTLCache]:
+        return {"lists": self.list_cache, "details": self.detail_cache}
+
+    def _cache_version(self) -> Tuple[int, int]:
+        return self.list_cache.version, self.detail_cache.version
+
+    def restore_snapshot(self) -> int:
+        """스냅샷 파일에서 목록/상세 캐시 복원
+
+        저장 시각을 유지하므로 TTL이 남은 항목은 바로 캐시 적중하고, 만료된 항목은
+        장애 시 응답용으로만 쓰인다. 복원한 레코드는 검색/태그/시간 색인에도 넣는다.
+
+        Returns:
+            int: 복원한 캐시 항목 수 (스냅샷을 사용하지 않거나 읽지 못하면 0)
+        """
+        if not self.snapshot_path or not self.enable_cache:
+            return 0
+        started = time.perf_counter()
+        try:
+            entries = read_snapshot(self.snapshot_path, settings.SNAPSHOT_MAX_AGE)
+        except ValueError as e:
+            logger.warning(f"캐시 스냅샷 복원 실패: {e}")
+            return 0
+
+        restored = restore_entries(self._snapshot_caches(), entries)
+        for (game, category), stored_at, records in entries.get("lists", []):
+            if records:
+                self.time_index.mark_covered(game, category, records[-1].published_ts, int(stored_at))
+        # 조회수/수정 이력이 시간 순서대로 쌓이도록 저장 시각 순으로 색인
+        batches = [(stored_at, records) for _, stored_at, records in entries.get("lists", [])]
+        batches += [(stored_at, (record,)) for _, stored_at, record in entries.get("details", [])]
+        for stored_at, records in sorted(batches, key=lambda batch: batch[0]):
+            self._ingest(records, now=stored_at)
+
+        self._snapshot_version = self._cache_version()
+        logger.info(f"캐시 스냅샷 복원: {restored}개 항목 ({(time.perf_counter() - started) * 1000:.1f}ms)")
+        return restored
+
+    async def save_snapshot(self, force: bool = False) -> bool:
+        """목록/상세 캐시를 스냅샷 파일에 저장
+
+        항목 수집은 이벤트 루프에서, 인코딩/압축/파일 쓰기는 스레드에서 수행한다.
+
+        Args:
+            force: 캐시가 바뀌지 않았어도 저장
+
+        Returns:
+            bool: 저장했으면 True
+        """
+        version = self._cache_version()
+        if not self.snapshot_path or (not force and version == self._snapshot_version):
+            return False
+        entries = collect_entries(self._snapshot_caches())
+        count = await asyncio.to_thread(write_snapshot, self.snapshot_path, entries)
+        self._snapshot_version = version
+        logger.debug(f"캐시 스냅샷 저장: {count}개 항목")
+        return True
+
+    def save_snapshot_sync(self) -> bool:
+        """종료 시 마지막 스냅샷 동기 저장 (바뀐 경우만)"""
+        if not self.snapshot_path or self._cache_version() == self._snapshot_version:
+            return False
+        try:
+            write_snapshot(self.snapshot_path, collect_entries(self._snapshot_caches()))
+        except OSError as e:
+            logger.warning(f"캐시 스냅샷 저장 실패: {e}")
+            return False
+        self._snapshot_version = self._cache_version()
+        return True
+
+    async def _snapshot_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.save_snapshot()
+            except OSError as e:
+                logger.warning(f"캐시 스냅샷 저장 실패: {e}")
+
+    def start_snapshots(self, interval: float = settings.SNAPSHOT_INTERVAL) -> Optional[asyncio.Task]:
+        """주기적 스냅샷 저장 작업 시작 (스냅샷을 사용하지 않으면 None)"""
+        if not self.snapshot_path or not self.enable_cache:
+            return None
+        self.snapshot_task = asyncio.create_task(self._snapshot_loop(interval))
+        return self.snapshot_task
+
+    def close(self) -> None:
+        """스냅샷 저장 후 로컬 저장소(검색 인덱스, 아카이브) 닫기"""
+        if self.snapshot_task is not None:
+            self.snapshot_task.cancel()
+            self.snapshot_task = None
+        self.save_snapshot_sync()
+        if self.search_index is not None:
+            self.search_index.close()
+        if self.archive is not None:
+            self.archive.close()
+
+    def status(self) -> Dict[str, object]:
+        """서비스 상태 반환"""
+        return {
+            "warmup_complete": self.warmup_complete,
+            "warmup_running": self.warmup_task is not None and not self.warmup_task.done(),
+            "warmup_error": self.warmup_error,
+            "warmup_failures": self.warmup_failures,
+            "loaded_scrapers": list(self.registry.loaded()),
+            "cached_lists": len(self.list_cache),
+            "cached_details": len(self.detail_cache),
+            "indexed_articles": len(self.search_index) if self.search_index is not None else 0,
+            "indexed_tags": len(self.tag_index.tag_counts()),
+            "archived_articles": len(self.archive) if self.archive is not None else 0,
+            "revisions": len(self.revisions),
+            "duplicate_groups": self.duplicates.group_count(),
+            "tracked_view_series": len(self.views),
+            "open_circuits": circuit_breakers.open_endpoints(),
+            "hedged_requests": hedger.hedges,
+        }
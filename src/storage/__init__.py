@@ -0,0 +1,29 @@
+"""뉴스 저장소 패키지"""
+
+from .cache import TTLCache
+from .records import ArticleRecord
+from .search_index import SearchIndex, SearchHit
+from .tag_index import TagIndex
+from .time_index import TimeIndex
+from .archive import ContentArchive
+from .revisions import RevisionStore, Revision
+from .dedup import DuplicateIndex
+from .view_series import ViewSeriesStore, TrendingEntry
+from .snapshot import read_snapshot, write_snapshot
+
+__all__ = [
+    "TTLCache",
+    "ArticleRecord",
+    "SearchIndex",
+    "SearchHit",
+    "TagIndex",
+    "TimeIndex",
+    "ContentArchive",
+    "RevisionStore",
+    "Revision",
+    "DuplicateIndex",
+    "ViewSeriesStore",
+    "TrendingEntry",
+    "read_snapshot",
+    "write_snapshot",
+]
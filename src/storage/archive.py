@@ -0,0 +1,193 @@
+"""게시글 본문 아카이브 (append-only 세그먼트 + zlib + mmap)
+
+패치 노트 본문은 데이터 대부분을 차지하므로 메모리에 두지 않고 디스크의 세그먼트
+파일에 레코드 단위로 압축해 덧붙인다. 메모리에는 키 -> (세그먼트, 오프셋, 길이)
+색인만 두고, 조회할 때는 세그먼트를 mmap으로 열어 필요한 레코드 하나만
+압축 해제한다.
+
+레코드 형식 (little-endian):
+    magic(2) | 키 길이(2) | 압축 데이터 길이(4) | 원문 CRC32(4) | 키(UTF-8) | zlib 데이터
+
+같은 키를 다시 쓰면 새 레코드를 덧붙이고 색인이 새 위치를 가리킨다(내용이 같으면
+쓰지 않는다). 색인은 열 때 세그먼트의 레코드 헤더만 훑어 다시 만들며, 비정상
+종료로 잘린 마지막 레코드는 무시하고 잘라낸다.
+"""
+
+import json
+import mmap
+import os
+import struct
+import zlib
+from typing import Dict, Iterator, Optional, Tuple
+
+from src.storage.records import ArticleRecord
+
+_MAGIC = b"GA"
+_HEADER = struct.Struct("<2sHII")
+_SEGMENT_NAME = "segment-{:05d}.dat"
+
+# 세그먼트 최대 크기 (넘으면 새 세그먼트로)
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+
+
+class ContentArchive:
+    """append-only 압축 게시글 아카이브"""
+
+    def __init__(self, directory: str, segment_bytes: int = DEFAULT_SEGMENT_BYTES, level: int = 6):
+        """
+        Args:
+            directory: 세그먼트 파일을 둘 디렉터리 (없으면 생성)
+            segment_bytes: 세그먼트 최대 크기 (바이트)
+            level: zlib 압축 수준
+        """
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.level = level
+        os.makedirs(directory, exist_ok=True)
+
+        # 키 -> (세그먼트 번호, 데이터 오프셋, 압축 길이, 원문 CRC32)
+        self._index: Dict[str, Tuple[int, int, int, int]] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._files: Dict[int, object] = {}
+
+        segments = sorted(
+            int(name[8:13]) for name in os.listdir(directory)
+            if name.startswith("segment-") and name.endswith(".dat")
+        )
+        for segment in segments:
+            self._scan(segment)
+        self._active = segments[-1] if segments else 1
+        self._writer = open(self._path(self._active), "ab")
+
+    def _path(self, segment: int) -> str:
+        return os.path.join(self.directory, _SEGMENT_NAME.format(segment))
+
+    def _scan(self, segment: int) -> None:
+        """세그먼트의 레코드 헤더를 훑어 색인 복원"""
+        path = self._path(segment)
+        size = os.path.getsize(path)
+        if size == 0:
+            return
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            offset = 0
+            while offset + _HEADER.size <= size:
+                magic, key_len, data_len, crc = _HEADER.unpack_from(view, offset)
+                data_offset = offset + _HEADER.size + key_len
+                if magic != _MAGIC or data_offset + data_len > size:
+                    break
+                key = view[offset + _HEADER.size:data_offset].decode("utf-8")
+                self._index[key] = (segment, data_offset, data_len, crc)
+                offset = data_offset + data_len
+        if offset < size:
+            # 잘린 마지막 레코드 제거
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+
+    def _view(self, segment: int, end: int) -> mmap.mmap:
+        """세그먼트 mmap (end까지 매핑되어 있지 않으면 다시 매핑)"""
+        view = self._maps.get(segment)
+        if view is None or len(view) < end:
+            if view is not None:
+                view.close()
+            f = self._files.get(segment)
+            if f is None:
+                f = self._files[segment] = open(self._path(segment), "rb")
+            view = self._maps[segment] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return view
+
+    def put_bytes(self, key: str, data: bytes) -> bool:
+        """원문 바이트 저장
+
+        Args:
+            key: 저장 키
+            data: 원문
+
+        Returns:
+            bool: 새 레코드를 썼으면 True (직전 내용과 같으면 False)
+        """
+        crc = zlib.crc32(data)
+        entry = self._index.get(key)
+        if entry is not None and entry[3] == crc and self.get_bytes(key) == data:
+            return False
+
+        compressed = zlib.compress(data, self.level)
+        encoded_key = key.encode("utf-8")
+        if self._writer.tell() > 0 and self._writer.tell() + len(compressed) > self.segment_bytes:
+            self._writer.close()
+            self._active += 1
+            self._writer = open(self._path(self._active), "ab")
+
+        offset = self._writer.tell()
+        self._writer.write(_HEADER.pack(_MAGIC, len(encoded_key), len(compressed), crc))
+        self._writer.write(encoded_key)
+        self._writer.write(compressed)
+        self._writer.flush()
+        self._index[key] = (self._active, offset + _HEADER.size + len(encoded_key), len(compressed), crc)
+        return True
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """원문 바이트 조회 (해당 레코드만 압축 해제)
+
+        Args:
+            key: 저장 키
+
+        Returns:
+            Optional[bytes]: 원문, 없으면 None
+        """
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        segment, offset, length, _ = entry
+        view = self._view(segment, offset + length)
+        return zlib.decompress(view[offset:offset + length])
+
+    def put(self, record: ArticleRecord) -> bool:
+        """게시글 레코드 저장 (URL을 키로 사용)
+
+        Args:
+            record: 저장할 레코드 (본문 포함)
+
+        Returns:
+            bool: 새 레코드를 썼으면 True
+        """
+        row = json.dumps(record.as_tuple(), ensure_ascii=False, separators=(",", ":"))
+        return self.put_bytes(record.url, row.encode("utf-8"))
+
+    def get(self, url: str) -> Optional[ArticleRecord]:
+        """게시글 레코드 조회
+
+        Args:
+            url: 게시글 URL
+
+        Returns:
+            Optional[ArticleRecord]: 저장된 레코드, 없으면 None
+        """
+        data = self.get_bytes(url)
+        if data is None:
+            return None
+        return ArticleRecord.from_tuple(json.loads(data))
+
+    def keys(self) -> Iterator[str]:
+        """저장된 키 목록"""
+        return iter(list(self._index))
+
+    def size_bytes(self) -> int:
+        """세그먼트 파일 전체 크기"""
+        return sum(os.path.getsize(self._path(segment)) for segment in range(1, self._active + 1)
+                   if os.path.exists(self._path(segment)))
+
+    def close(self) -> None:
+        """파일과 mmap 닫기"""
+        self._writer.close()
+        for view in self._maps.values():
+            view.close()
+        for f in self._files.values():
+            f.close()
+        self._maps.clear()
+        self._files.clear()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -0,0 +1,136 @@
+"""TTL 기반 인메모리 캐시"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterator, Optional, Tuple
+
+
+class TTLCache:
+    """만료 시간이 있는 간단한 인메모리 캐시
+    
+    항목마다 저장 시각(epoch 초)을 함께 보관하며, TTL이 지난 항목은 get()에서
+    반환하지 않는다. 장애 시 최선의 응답을 위해 get_stale()로 만료 항목도 조회할 수 있다.
+    
+    만료 항목은 max_stale(초)까지만 보관하고, 항목 수가 max_entries를 넘으면 그보다
+    오래 보관한 만료 항목부터 정리한 뒤 가장 오래 쓰이지 않은 항목(LRU)을 삭제한다.
+    """
+    
+    def __init__(self, ttl: int, max_entries: Optional[int] = None, max_stale: Optional[float] = None):
+        """
+        Args:
+            ttl: 항목 유효 시간 (초)
+            max_entries: 최대 항목 수 (None이면 제한 없음)
+            max_stale: 저장 후 이 시간(초)이 지난 항목은 get_stale()로도 반환하지 않고 삭제
+                (None이면 만료 항목을 계속 보관)
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries는 1 이상이어야 합니다")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_stale = max_stale
+        # 키 -> (저장 시각, 값), 최근 사용 순서 (마지막이 가장 최근)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # 다음 전체 만료 정리 시각 (용량이 찼을 때 TTL마다 한 번만 전체를 훑음)
+        self._next_purge = 0.0
+        # 변경될 때마다 증가 (스냅샷 저장 여부 판단용)
+        self.version = 0
+    
+    def _lookup(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """항목 조회 (보관 기한이 지났으면 삭제, 있으면 최근 사용으로 표시)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self.max_stale is not None and time.time() - entry[0] > self.max_stale:
+            del self._entries[key]
+            self.version += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """유효한 항목 조회
+        
+        Args:
+            key: 캐시 키
+            
+        Returns:
+            Optional[Any]: 캐시된 값, 없거나 만료되었으면 None
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        
+        stored_at, value = entry
+        if time.time() - stored_at > self.ttl:
+            return None
+        return value
+    
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """만료 여부와 관계없이 항목 조회 (max_stale 이내)"""
+        entry = self._lookup(key)
+        return entry[1] if entry else None
+    
+    def set(self, key: Hashable, value: Any, stored_at: Optional[float] = None) -> None:
+        """항목 저장 (최대 항목 수를 넘으면 오래된 항목 삭제)
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            stored_at: 저장 시각 (기본값: 현재 시각)
+        """
+        self._entries[key] = (stored_at if stored_at is not None else time.time(), value)
+        self._entries.move_to_end(key)
+        self.version += 1
+        
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            now = time.time()
+            if now >= self._next_purge:
+                self.purge(now)
+                self._next_purge = now + self.ttl
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def purge(self, now: Optional[float] = None) -> int:
+        """max_stale이 지난 항목 삭제
+        
+        Args:
+            now: 기준 시각 (기본값: 현재 시각)
+            
+        Returns:
+            int: 삭제한 항목 수
+        """
+        if self.max_stale is None:
+            return 0
+        cutoff = (time.time() if now is None else now) - self.max_stale
+        expired = [key for key, (stored_at, _) in self._entries.items() if stored_at < cutoff]
+        for key in expired:
+            del self._entries[key]
+        if expired:
+            self.version += 1
+        return len(expired)
+    
+    def delete(self, key: Hashable) -> None:
+        """항목 삭제"""
+        if self._entries.pop(key, None) is not None:
+            self.version += 1
+    
+    def clear(self) -> None:
+        """전체 항목 삭제"""
+        self._entries.clear()
+        self.version += 1
+    
+    def stored_at(self, key: Hashable) -> Optional[float]:
+        """항목 저장 시각 (없으면 None)"""
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+    
+    def entries(self) -> Iterator[Tuple[Hashable, float, Any]]:
+        """(키, 저장 시각, 값) 목록 순회"""
+        for key, (stored_at, value) in list(self._entries.items()):
+            yield key, stored_at, value
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,204 @@
+"""게시판/카테고리 간 중복 게시글 탐지 (SimHash)
+
+같은 소식이 여러 게시판에 올라온다(로드나인 업데이트는 공지사항의 일부, 에픽세븐
+공지/업데이트 게시판은 겹침). 게시글마다 제목과 본문(없으면 요약) 단어로 64비트
+SimHash를 만들고, 해밍 거리가 max_distance 이하이면서 같은 게임에 비슷한 시각
+(max_time_gap 이내)에 올라온 글을 하나의 대표 게시글로 묶는다. 대표 게시글은
+묶인 글들의 카테고리를 모두 가진다.
+
+해밍 거리 3 이하를 빠짐없이 찾기 위해 지문을 16비트씩 4개 구간(band)으로 나눠
+색인한다(비둘기집 원리로 적어도 한 구간은 일치). 후보는 같은 구간 값을 가진 글뿐이므로
+이력이 쌓여도 조회 비용은 거의 일정하다.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.storage.records import ArticleRecord
+
+_BITS = 64
+_BANDS = 4
+_BAND_BITS = _BITS // _BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+# 비트별 가중치 합을 한 번에 더하기 위한 레인 폭 (특징 수 < 2^20)
+_LANE = 20
+_WORD_PATTERN = re.compile(r"\w+")
+
+# (바이트 위치, 바이트 값) -> 8개 비트를 각 레인에 펼친 정수
+_SPREAD = [
+    [
+        sum(1 << (_LANE * (8 * position + bit)) for bit in range(8) if value >> bit & 1)
+        for value in range(256)
+    ]
+    for position in range(8)
+]
+
+# 제목 단어 가중치 (본문보다 짧으므로 가중)
+TITLE_WEIGHT = 3
+
+
+@lru_cache(maxsize=65536)
+def _feature_hash(feature: str) -> int:
+    """특징의 64비트 해시 (hash()와 달리 프로세스마다 같은 값)"""
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _features(record: ArticleRecord) -> Dict[str, int]:
+    """특징(단어) -> 가중치"""
+    features: Dict[str, int] = {}
+    for word in _WORD_PATTERN.findall((record.content or record.summary or "").lower()):
+        features[word] = 1
+    for word in _WORD_PATTERN.findall(record.title.lower()):
+        features[word] = features.get(word, 0) + TITLE_WEIGHT
+    return features
+
+
+def simhash(features: Dict[str, int]) -> int:
+    """가중치가 있는 특징 집합의 64비트 SimHash
+
+    특징 해시의 각 비트를 레인에 펼쳐 큰 정수 덧셈 한 번으로 비트별 가중치를 누적한다.
+
+    Args:
+        features: 특징 -> 가중치
+
+    Returns:
+        int: 64비트 지문
+    """
+    if not features:
+        return 0
+    total = 0
+    lanes = 0
+    spread = _SPREAD
+    for feature, weight in features.items():
+        h = _feature_hash(feature)
+        value = (
+            spread[0][h & 255] + spread[1][h >> 8 & 255] + spread[2][h >> 16 & 255]
+            + spread[3][h >> 24 & 255] + spread[4][h >> 32 & 255] + spread[5][h >> 40 & 255]
+            + spread[6][h >> 48 & 255] + spread[7][h >> 56 & 255]
+        )
+        lanes += value * weight if weight != 1 else value
+        total += weight
+
+    lane_mask = (1 << _LANE) - 1
+    fingerprint = 0
+    for bit in range(_BITS):
+        if (lanes >> (_LANE * bit) & lane_mask) * 2 > total:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def _bands(fingerprint: int) -> Tuple[int, ...]:
+    return tuple(fingerprint >> (_BAND_BITS * band) & _BAND_MASK for band in range(_BANDS))
+
+
+class DuplicateIndex:
+    """SimHash 기반 중복 게시글 색인"""
+
+    def __init__(self, max_distance: int = 3, max_time_gap: int = 86400):
+        """
+        Args:
+            max_distance: 중복으로 볼 최대 해밍 거리 (구간 수보다 작아야 함)
+            max_time_gap: 중복으로 볼 최대 발행 시각 차이 (초)
+        """
+        if max_distance >= _BANDS:
+            raise ValueError(f"max_distance는 {_BANDS} 미만이어야 합니다")
+        self.max_distance = max_distance
+        self.max_time_gap = max_time_gap
+        # 키 -> (게임, 지문, 발행 시각)
+        self._entries: Dict[str, Tuple[str, int, int]] = {}
+        # (게임, 구간 번호, 구간 값) -> 키 집합
+        self._buckets: Dict[Tuple[str, int, int], Set[str]] = {}
+        self._canonical: Dict[str, str] = {}
+        # 대표 키 -> 카테고리 목록 (처음 본 순서)
+        self._categories: Dict[str, List[str]] = {}
+
+    def add(self, record: ArticleRecord) -> str:
+        """레코드를 색인하고 대표 게시글 키 반환
+
+        이미 본 게시글이면 지문만 갱신하고(본문이 새로 들어온 경우 등) 기존 묶음을 유지한다.
+
+        Args:
+            record: 색인할 레코드
+
+        Returns:
+            str: 대표 게시글 키
+        """
+        key = record.key
+        fingerprint = simhash(_features(record))
+        previous = self._entries.get(key)
+        if previous is not None and previous[1] != fingerprint:
+            self._unindex(key, previous)
+
+        if previous is None or previous[1] != fingerprint:
+            self._entries[key] = (record.game, fingerprint, record.published_ts)
+            if key not in self._canonical:
+                match = self._find(record.game, fingerprint, record.published_ts, key)
+                self._canonical[key] = self._canonical[match] if match is not None else key
+            for band, value in enumerate(_bands(fingerprint)):
+                self._buckets.setdefault((record.game, band, value), set()).add(key)
+
+        categories = self._categories.setdefault(self._canonical[key], [])
+        if record.category not in categories:
+            categories.append(record.category)
+        return self._canonical[key]
+
+    def add_many(self, records: Iterable[ArticleRecord]) -> None:
+        """여러 레코드 색인"""
+        for record in records:
+            self.add(record)
+
+    def _find(self, game: str, fingerprint: int, published_ts: int, exclude: str) -> Optional[str]:
+        """가장 가까운 중복 후보 키"""
+        best, best_distance = None, self.max_distance + 1
+        for band, value in enumerate(_bands(fingerprint)):
+            for other in self._buckets.get((game, band, value), ()):
+                if other == exclude:
+                    continue
+                _, other_fingerprint, other_ts = self._entries[other]
+                if abs(other_ts - published_ts) > self.max_time_gap:
+                    continue
+                distance = (fingerprint ^ other_fingerprint).bit_count()
+                if distance < best_distance:
+                    best, best_distance = other, distance
+        return best
+
+    def _unindex(self, key: str, entry: Tuple[str, int, int]) -> None:
+        game, fingerprint, _ = entry
+        for band, value in enumerate(_bands(fingerprint)):
+            keys = self._buckets.get((game, band, value))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._buckets[(game, band, value)]
+
+    def canonical(self, key: str) -> str:
+        """대표 게시글 키 (색인되지 않은 키는 그대로)"""
+        return self._canonical.get(key, key)
+
+    def categories(self, key: str) -> List[str]:
+        """게시글이 속한 묶음의 카테고리 목록"""
+        return list(self._categories.get(self.canonical(key), []))
+
+    def collapse(self, records: Iterable[ArticleRecord]) -> List[ArticleRecord]:
+        """같은 묶음의 레코드는 처음 것만 남김 (순서 유지)"""
+        seen = set()
+        result = []
+        for record in records:
+            canonical = self.canonical(record.key)
+            if canonical not in seen:
+                seen.add(canonical)
+                result.append(record)
+        return result
+
+    def group_count(self) -> int:
+        """게시글이 둘 이상 묶인 대표 게시글 수"""
+        counts: Dict[str, int] = {}
+        for canonical in self._canonical.values():
+            counts[canonical] = counts.get(canonical, 0) + 1
+        return sum(1 for count in counts.values() if count > 1)
+
+    def __len__(self) -> int:
+        return len(self._entries)
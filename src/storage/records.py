@@ -0,0 +1,130 @@
+"""캐시/저장소용 경량 게시글 레코드
+
+pydantic GameNews 인스턴스는 필드 딕셔너리, HttpUrl 객체, 태그 리스트 등을 함께 들고
+있어 수천 건을 메모리에 보관하기에는 무겁다. ArticleRecord는 __slots__ 기반으로
+게임/카테고리/태그 문자열을 intern하고, 발행 일시를 정수 epoch(초)로 보관한다.
+GameNews로의 변환은 MCP 응답을 만들 때만 수행한다.
+"""
+
+import sys
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from src.models.game_news import GameNews
+
+# flags 비트
+_IMPORTANT = 1
+_NAIVE_TIME = 2  # 발행 일시가 timezone 정보 없이(로컬 시간) 수집된 경우
+
+_intern = sys.intern
+
+
+class ArticleRecord:
+    """__slots__ 기반 게시글 레코드"""
+
+    __slots__ = (
+        "id", "title", "url", "published_ts", "game", "category",
+        "flags", "tags", "view_count", "summary", "content",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        url: str,
+        published_ts: int,
+        game: str,
+        category: str,
+        flags: int = 0,
+        tags: Tuple[str, ...] = (),
+        view_count: Optional[int] = None,
+        summary: Optional[str] = None,
+        content: Optional[str] = None
+    ):
+        self.id = id
+        self.title = title
+        self.url = url
+        self.published_ts = published_ts
+        self.game = _intern(game)
+        self.category = _intern(category)
+        self.flags = flags
+        self.tags = tags
+        self.view_count = view_count
+        self.summary = summary
+        self.content = content
+
+    @property
+    def is_important(self) -> bool:
+        """중요 공지 여부"""
+        return bool(self.flags & _IMPORTANT)
+
+    @property
+    def key(self) -> str:
+        """게임 내에서 고유한 저장 키 (게임:ID)"""
+        return f"{self.game}:{self.id}"
+
+    @classmethod
+    def from_game_news(cls, news: GameNews) -> "ArticleRecord":
+        """GameNews에서 레코드 생성"""
+        published_at = news.published_at
+        flags = _IMPORTANT if news.is_important else 0
+        if published_at.tzinfo is None:
+            flags |= _NAIVE_TIME
+
+        return cls(
+            id=news.id,
+            title=news.title,
+            url=str(news.url),
+            published_ts=int(published_at.timestamp()),
+            game=getattr(news.game, "value", news.game),
+            category=getattr(news.category, "value", news.category),
+            flags=flags,
+            tags=tuple(_intern(tag) for tag in news.tags),
+            view_count=news.view_count,
+            summary=news.summary,
+            content=news.content,
+        )
+
+    def published_at(self) -> datetime:
+        """발행 일시 (수집 당시의 timezone 형태로 복원)"""
+        if self.flags & _NAIVE_TIME:
+            return datetime.fromtimestamp(self.published_ts)
+        return datetime.fromtimestamp(self.published_ts, tz=timezone.utc)
+
+    def to_game_news(self) -> GameNews:
+        """MCP 응답용 GameNews로 변환 (이미 검증된 데이터이므로 검증 생략)"""
+        return GameNews.from_trusted(
+            id=self.id,
+            title=self.title,
+            url=self.url,
+            published_at=self.published_at(),
+            game=self.game,
+            category=self.category,
+            content=self.content,
+            summary=self.summary,
+            is_important=self.is_important,
+            tags=list(self.tags),
+            view_count=self.view_count,
+        )
+
+    def with_category(self, category: str) -> "ArticleRecord":
+        """카테고리만 바꾼 복사본 (같은 게시글이 여러 게시판에 올라온 경우)"""
+        if category == self.category:
+            return self
+        copy = ArticleRecord(*self.as_tuple())
+        copy.category = _intern(category)
+        return copy
+
+    def as_tuple(self) -> tuple:
+        """필드 값 튜플 (__slots__ 순서, 저장용)"""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    @classmethod
+    def from_tuple(cls, values) -> "ArticleRecord":
+        """as_tuple() 결과에서 복원 (JSON을 거친 리스트도 허용)"""
+        record = cls(*values)
+        record.tags = tuple(_intern(tag) for tag in record.tags)
+        return record
+
+    def __repr__(self) -> str:
+        return f"ArticleRecord({self.key!r}, {self.title!r})"
@@ -0,0 +1,168 @@
+"""게시글 수정 이력 추적
+
+OnStove 공지는 게시 후에도 수정된다(점검 연장, 패치 노트 정정). 게시글마다 본문
+해시와 직전 본문(zlib 압축)만 보관하다가, 같은 게시글을 다시 가져왔을 때 제목이나
+본문 해시가 달라졌으면 직전 내용 대비 unified diff를 새 리비전으로 기록한다.
+클라이언트는 changed_since()로 특정 시각 이후 바뀐 게시글과 diff만 받아 본다.
+
+목록 레코드에는 본문이 없으므로 제목 변경만 감지하고, 본문 변경은 상세 조회 시
+감지한다. 처음 보는 게시글(또는 처음 보는 본문)은 기준 내용으로만 저장한다.
+"""
+
+import difflib
+import hashlib
+import zlib
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from src.storage.records import ArticleRecord
+
+# 보관할 최대 리비전 수 (넘으면 오래된 것부터 삭제)
+DEFAULT_MAX_REVISIONS = 1000
+
+
+def hash_content(content: str) -> str:
+    """본문 해시 (blake2b 128비트)"""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class Revision(NamedTuple):
+    """게시글 리비전 한 건"""
+    key: str
+    game: str
+    url: str
+    title: str
+    number: int
+    changed_at: float
+    content_hash: Optional[str]
+    diff: str
+
+
+class _State:
+    """게시글별 최신 상태"""
+
+    __slots__ = ("title", "content_hash", "body", "number")
+
+    def __init__(self, title: str, content_hash: Optional[str], body: Optional[bytes]):
+        self.title = title
+        self.content_hash = content_hash
+        self.body = body
+        self.number = 1
+
+
+class RevisionStore:
+    """게시글 수정 이력 저장소"""
+
+    def __init__(self, max_revisions: int = DEFAULT_MAX_REVISIONS):
+        """
+        Args:
+            max_revisions: 보관할 최대 리비전 수
+        """
+        self.max_revisions = max_revisions
+        self._states: Dict[str, _State] = {}
+        # 감지 시각 순 리비전 목록
+        self._revisions: List[Revision] = []
+        self._times: List[float] = []
+
+    def observe(self, record: ArticleRecord, now: float) -> Optional[Revision]:
+        """가져온 레코드를 직전 상태와 비교
+
+        Args:
+            record: 가져온 레코드
+            now: 감지 시각 (epoch 초)
+
+        Returns:
+            Optional[Revision]: 바뀌었으면 새 리비전, 아니면 None
+        """
+        digest = hash_content(record.content) if record.content is not None else None
+        state = self._states.get(record.key)
+        if state is None:
+            self._states[record.key] = _State(record.title, digest, self._pack(record.content))
+            return None
+
+        title_changed = record.title != state.title
+        content_changed = digest is not None and state.content_hash is not None and digest != state.content_hash
+        if not title_changed and not content_changed:
+            if digest is not None and state.content_hash is None:
+                # 목록으로만 보던 게시글의 본문을 처음 받음: 기준 본문으로 저장
+                state.content_hash = digest
+                state.body = self._pack(record.content)
+            return None
+
+        old_lines = [state.title]
+        new_lines = [record.title]
+        if content_changed:
+            old_lines += zlib.decompress(state.body).decode("utf-8").splitlines()
+            new_lines += record.content.splitlines()
+        diff = "\n".join(difflib.unified_diff(
+            old_lines, new_lines, f"r{state.number}", f"r{state.number + 1}", lineterm="", n=1
+        ))
+
+        state.title = record.title
+        state.number += 1
+        if digest is not None:
+            state.content_hash = digest
+            state.body = self._pack(record.content)
+
+        revision = Revision(
+            key=record.key,
+            game=record.game,
+            url=record.url,
+            title=record.title,
+            number=state.number,
+            changed_at=now,
+            content_hash=state.content_hash,
+            diff=diff,
+        )
+        self._append(revision)
+        return revision
+
+    def observe_many(self, records: Iterable[ArticleRecord], now: float) -> List[Revision]:
+        """여러 레코드 비교 (바뀐 것만 반환)"""
+        revisions = (self.observe(record, now) for record in records)
+        return [revision for revision in revisions if revision is not None]
+
+    @staticmethod
+    def _pack(content: Optional[str]) -> Optional[bytes]:
+        return zlib.compress(content.encode("utf-8")) if content is not None else None
+
+    def _append(self, revision: Revision) -> None:
+        self._revisions.append(revision)
+        self._times.append(revision.changed_at)
+        excess = len(self._revisions) - self.max_revisions
+        if excess > 0:
+            del self._revisions[:excess]
+            del self._times[:excess]
+
+    def changed_since(
+        self,
+        since: float,
+        game: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Revision]:
+        """since 이후 감지된 리비전 (최신순)
+
+        Args:
+            since: 기준 시각 (epoch 초, 이 시각 이후 감지된 것만)
+            game: 게임 필터
+            limit: 최대 결과 수
+
+        Returns:
+            List[Revision]: 최신순 리비전
+        """
+        result = []
+        for revision in reversed(self._revisions[bisect_left(self._times, since):]):
+            if game is not None and revision.game != game:
+                continue
+            result.append(revision)
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+    def content_hash(self, key: str) -> Optional[str]:
+        """게시글의 최신 본문 해시 (본문을 아직 받지 않았으면 None)"""
+        state = self._states.get(key)
+        return state.content_hash if state is not None else None
+
+    def __len__(self) -> int:
+        return len(self._revisions)
@@ -0,0 +1,308 @@
+"""게시글 전문 검색 인덱스 (SQLite FTS5)
+
+FTS5의 기본 토크나이저(unicode61)는 공백 기준으로 단어를 나누므로 조사가 붙은
+한국어("보상을", "점검이")는 검색어와 일치하지 않는다. 색인할 때 한글 구간을
+2글자 단위(bigram)로 쪼갠 토큰열로 바꿔 저장하고, 검색어도 같은 방식으로 쪼개
+연속 구문(phrase)으로 찾는다. "점검 연장" -> "점검" AND "연장",
+"업데이트" -> "업데 데이 이트" 구문. 영문/숫자는 단어 단위로 색인한다.
+
+NewsService가 목록/상세를 가져올 때마다 레코드를 넘겨 증분 갱신하며, 제목/요약과
+본문의 체크섬이 바뀐 행만 다시 색인한다. 목록 레코드에는 본문이 없으므로 이미
+색인된 본문은 유지한다.
+
+같은 게시글이 여러 게시판(예: 로드나인 공지사항과 업데이트 필터)에서 들어오므로
+게시글이 올라온 카테고리는 article_categories 테이블에 모두 기록하고, 카테고리
+필터는 이 테이블로 확인한다.
+"""
+
+import re
+import sqlite3
+import zlib
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from src.storage.records import ArticleRecord
+
+# 한글 음절/자모 구간, 그 밖의 단어(영문/숫자 등)
+_TOKEN_PATTERN = re.compile(
+    r"([가-힣ㄱ-ㆎ]+)|[^\W_가-힣ㄱ-ㆎ]+"
+)
+# 검색어 OR 구분자
+_OR_PATTERN = re.compile(r"\s+(?:OR|or)\s+|\s*\|\s*")
+
+# bm25 열 가중치 (제목, 요약, 본문)
+_BM25_WEIGHTS = (10.0, 4.0, 1.0)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    rowid INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    game TEXT NOT NULL,
+    category TEXT NOT NULL,
+    published_ts INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    head_sig INTEGER NOT NULL,
+    body_sig INTEGER
+);
+CREATE INDEX IF NOT EXISTS articles_published ON articles (game, category, published_ts);
+CREATE TABLE IF NOT EXISTS article_categories (
+    rowid INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    PRIMARY KEY (rowid, category)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (title, summary, content);
+-- 카테고리 테이블이 없던 색인 파일은 articles의 카테고리로 채움
+INSERT OR IGNORE INTO article_categories (rowid, category) SELECT rowid, category FROM articles;
+"""
+
+
+def bigram_tokens(text: Optional[str]) -> List[str]:
+    """색인/검색용 토큰 (한글은 2글자 단위, 그 밖의 단어는 소문자 단어)
+
+    Args:
+        text: 토큰으로 나눌 텍스트
+
+    Returns:
+        List[str]: 토큰 목록 (한 글자짜리 한글 구간은 그 글자 하나)
+    """
+    if not text:
+        return []
+    tokens = []
+    for match in _TOKEN_PATTERN.finditer(text):
+        run = match.group(1)
+        if run is None:
+            tokens.append(match.group().lower())
+        elif len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def _index_text(text: Optional[str]) -> str:
+    return " ".join(bigram_tokens(text))
+
+
+def _term_phrase(term: str) -> Optional[str]:
+    """검색어 한 단어 -> FTS5 구문 (토큰은 단어 문자뿐이라 따옴표 이스케이프가 필요 없음)"""
+    tokens = bigram_tokens(term)
+    if not tokens:
+        return None
+    last = tokens[-1]
+    if len(tokens) == 1 and len(last) == 1 and not last.isascii():
+        # 한 글자 검색어는 그 글자로 시작하는 bigram까지 찾음
+        return f'"{last}"*'
+    return '"' + " ".join(tokens) + '"'
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """검색어를 FTS5 MATCH 식으로 변환
+
+    공백으로 구분한 단어는 모두 포함(AND), "OR" 또는 "|"로 구분한 묶음은 하나 이상
+    포함(OR)으로 해석한다. 예: "보상 | 점검 연장" -> 보상 OR (점검 AND 연장)
+
+    Args:
+        query: 사용자 검색어
+
+    Returns:
+        Optional[str]: MATCH 식, 검색할 단어가 없으면 None
+    """
+    groups = []
+    for group in _OR_PATTERN.split(query.strip()):
+        phrases = [phrase for phrase in map(_term_phrase, group.split()) if phrase]
+        if phrases:
+            groups.append("(" + " AND ".join(phrases) + ")")
+    return " OR ".join(groups) or None
+
+
+def _signature(*parts: Optional[str]) -> int:
+    """변경 감지용 체크섬"""
+    return zlib.crc32("\x00".join(part or "" for part in parts).encode("utf-8"))
+
+
+class SearchHit(NamedTuple):
+    """검색 결과 한 건"""
+    key: str
+    game: str
+    category: str
+    published_ts: int
+    title: str
+    url: str
+    score: float
+
+
+class SearchIndex:
+    """게시글 전문 검색 인덱스"""
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: 메모리)
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        # 키 -> (rowid, 제목/요약 체크섬, 본문 체크섬)
+        self._rows: Dict[str, Tuple[int, int, Optional[int]]] = {
+            key: (rowid, head_sig, body_sig)
+            for rowid, key, head_sig, body_sig in self._conn.execute(
+                "SELECT rowid, key, head_sig, body_sig FROM articles"
+            )
+        }
+        # rowid -> 게시글이 올라온 카테고리
+        self._placed: Dict[int, Set[str]] = {}
+        for rowid, category in self._conn.execute("SELECT rowid, category FROM article_categories"):
+            self._placed.setdefault(rowid, set()).add(category)
+
+    def add(self, records: Iterable[ArticleRecord]) -> int:
+        """레코드 색인 (새 레코드는 추가, 바뀐 레코드만 갱신)
+
+        본문이 없는 레코드(목록 조회 결과)는 이미 색인된 본문을 지우지 않는다.
+        이미 색인된 게시글이 다른 카테고리로 들어오면 그 카테고리만 추가한다.
+
+        Args:
+            records: 색인할 레코드
+
+        Returns:
+            int: 추가/갱신한 레코드 수
+        """
+        changed = 0
+        with self._conn:
+            for record in records:
+                head_sig = _signature(record.title, record.summary)
+                body_sig = _signature(record.content) if record.content is not None else None
+                row = self._rows.get(record.key)
+
+                if row is None:
+                    rowid = self._conn.execute(
+                        "INSERT INTO articles (key, game, category, published_ts, title, url, head_sig, body_sig)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (record.key, record.game, record.category, record.published_ts,
+                         record.title, record.url, head_sig, body_sig)
+                    ).lastrowid
+                    self._conn.execute(
+                        "INSERT INTO articles_fts (rowid, title, summary, content) VALUES (?, ?, ?, ?)",
+                        (rowid, _index_text(record.title), _index_text(record.summary),
+                         _index_text(record.content))
+                    )
+                    self._rows[record.key] = (rowid, head_sig, body_sig)
+                    self._place(rowid, record.category)
+                    changed += 1
+                    continue
+
+                rowid, old_head, old_body = row
+                placed = self._place(rowid, record.category)
+                body_changed = body_sig is not None and body_sig != old_body
+                if head_sig == old_head and not body_changed:
+                    changed += placed
+                    continue
+
+                self._conn.execute(
+                    "UPDATE articles SET category = ?, published_ts = ?, title = ?, url = ?,"
+                    " head_sig = ?, body_sig = ? WHERE rowid = ?",
+                    (record.category, record.published_ts, record.title, record.url,
+                     head_sig, body_sig if body_changed else old_body, rowid)
+                )
+                if body_changed:
+                    self._conn.execute(
+                        "UPDATE articles_fts SET title = ?, summary = ?, content = ? WHERE rowid = ?",
+                        (_index_text(record.title), _index_text(record.summary),
+                         _index_text(record.content), rowid)
+                    )
+                else:
+                    self._conn.execute(
+                        "UPDATE articles_fts SET title = ?, summary = ? WHERE rowid = ?",
+                        (_index_text(record.title), _index_text(record.summary), rowid)
+                    )
+                self._rows[record.key] = (rowid, head_sig, body_sig if body_changed else old_body)
+                changed += 1
+        return changed
+
+    def _place(self, rowid: int, category: str) -> bool:
+        """게시글이 올라온 카테고리 기록 (새 카테고리면 True)"""
+        placed = self._placed.setdefault(rowid, set())
+        if category in placed:
+            return False
+        placed.add(category)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO article_categories (rowid, category) VALUES (?, ?)", (rowid, category)
+        )
+        return True
+
+    def categories(self, key: str) -> List[str]:
+        """게시글이 올라온 카테고리 목록 (정렬)"""
+        row = self._rows.get(key)
+        return sorted(self._placed.get(row[0], ())) if row is not None else []
+
+    def search(
+        self,
+        query: str,
+        game: Optional[str] = None,
+        category: Optional[str] = None,
+        since_ts: Optional[int] = None,
+        until_ts: Optional[int] = None,
+        limit: int = 10
+    ) -> List[SearchHit]:
+        """검색어와 일치하는 게시글을 관련도 순으로 조회
+
+        Args:
+            query: 검색어 (build_match_query 참고)
+            game: 게임 필터
+            category: 카테고리 필터
+            since_ts: 이 시각(epoch 초) 이후 발행
+            until_ts: 이 시각(epoch 초) 이전 발행
+            limit: 최대 결과 수
+
+        Returns:
+            List[SearchHit]: 관련도(bm25) 순, 같으면 최신순
+        """
+        match = build_match_query(query)
+        if match is None:
+            return []
+
+        sql = (
+            "SELECT a.key, a.game, a.category, a.published_ts, a.title, a.url,"
+            " bm25(articles_fts, ?, ?, ?) AS score"
+            " FROM articles_fts JOIN articles a ON a.rowid = articles_fts.rowid"
+            " WHERE articles_fts MATCH ?"
+        )
+        params: list = [*_BM25_WEIGHTS, match]
+        for clause, value in (
+            (" AND a.game = ?", game),
+            (" AND EXISTS (SELECT 1 FROM article_categories c"
+             " WHERE c.rowid = a.rowid AND c.category = ?)", category),
+            (" AND a.published_ts >= ?", since_ts),
+            (" AND a.published_ts <= ?", until_ts),
+        ):
+            if value is not None:
+                sql += clause
+                params.append(value)
+        sql += " ORDER BY score, a.published_ts DESC LIMIT ?"
+        params.append(limit)
+
+        hits = [SearchHit(*row) for row in self._conn.execute(sql, params)]
+        if category is not None:
+            # 다른 게시판에서 먼저 색인된 게시글도 요청한 카테고리로 반환
+            hits = [hit._replace(category=category) for hit in hits]
+        return hits
+
+    def remove(self, key: str) -> None:
+        """레코드 색인 삭제"""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        self._placed.pop(row[0], None)
+        with self._conn:
+            self._conn.execute("DELETE FROM article_categories WHERE rowid = ?", (row[0],))
+            self._conn.execute("DELETE FROM articles_fts WHERE rowid = ?", (row[0],))
+            self._conn.execute("DELETE FROM articles WHERE rowid = ?", (row[0],))
+
+    def close(self) -> None:
+        """연결 종료"""
+        self._conn.close()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
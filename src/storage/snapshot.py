@@ -0,0 +1,156 @@
+"""캐시 스냅샷 저장/복원
+
+데스크톱 클라이언트는 MCP 서버를 자주 재시작하므로, 목록/상세 캐시를 주기적으로
+gzip 압축 JSON 파일에 저장해 두고 시작할 때 다시 읽는다. 항목의 저장 시각을 그대로
+보존하므로 복원된 항목도 원래 TTL 기준으로 만료되며, 너무 오래된 항목(max_age
+초과)은 복원하지 않는다.
+
+파일은 같은 디렉터리의 임시 파일에 쓴 뒤 os.replace로 바꿔 넣으므로, 저장 도중
+종료되어도 이전 스냅샷이 깨지지 않는다.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Hashable, List, Tuple
+
+from src.storage.cache import TTLCache
+from src.storage.records import ArticleRecord
+
+SNAPSHOT_VERSION = 1
+
+# 캐시 값 종류 표시
+_RECORD = "r"
+_RECORDS = "l"
+
+Entry = Tuple[Hashable, float, Any]
+
+
+def collect_entries(caches: Dict[str, TTLCache]) -> Dict[str, List[Entry]]:
+    """캐시 항목 수집 (이벤트 루프 스레드에서 호출, 인코딩은 별도로)
+
+    Args:
+        caches: 이름 -> 캐시
+
+    Returns:
+        Dict[str, List[Entry]]: 이름 -> (키, 저장 시각, 값) 목록
+    """
+    return {name: list(cache.entries()) for name, cache in caches.items()}
+
+
+def _encode_value(value: Any) -> list:
+    if isinstance(value, ArticleRecord):
+        return [_RECORD, value.as_tuple()]
+    return [_RECORDS, [record.as_tuple() for record in value]]
+
+
+def _decode_value(encoded: list) -> Any:
+    kind, data = encoded
+    if kind == _RECORD:
+        return ArticleRecord.from_tuple(data)
+    return tuple(ArticleRecord.from_tuple(row) for row in data)
+
+
+def write_snapshot(path: str, entries: Dict[str, List[Entry]], level: int = 6) -> int:
+    """스냅샷 파일 원자적 저장
+
+    Args:
+        path: 스냅샷 파일 경로 (디렉터리가 없으면 생성)
+        entries: collect_entries() 결과
+        level: gzip 압축 수준
+
+    Returns:
+        int: 저장한 항목 수
+    """
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "saved_at": time.time(),
+        "caches": {
+            name: [[list(key) if isinstance(key, tuple) else key, stored_at, _encode_value(value)]
+                   for key, stored_at, value in items]
+            for name, items in entries.items()
+        },
+    }
+    data = gzip.compress(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        compresslevel=level, mtime=0
+    )
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".snapshot-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return sum(len(items) for items in entries.values())
+
+
+def read_snapshot(path: str, max_age: float) -> Dict[str, List[Entry]]:
+    """스냅샷 파일 읽기
+
+    Args:
+        path: 스냅샷 파일 경로
+        max_age: 이보다 오래전에(초) 저장된 항목은 제외
+
+    Returns:
+        Dict[str, List[Entry]]: 이름 -> (키, 저장 시각, 값) 목록.
+            파일이 없거나 형식이 다르면 빈 딕셔너리
+
+    Raises:
+        ValueError: 파일이 손상된 경우
+    """
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return {}
+
+    try:
+        payload = json.loads(gzip.decompress(raw))
+    except (OSError, EOFError, ValueError) as e:
+        raise ValueError(f"손상된 스냅샷 파일입니다: {path}") from e
+    if payload.get("version") != SNAPSHOT_VERSION:
+        return {}
+
+    cutoff = time.time() - max_age
+    return {
+        name: [
+            (tuple(key) if isinstance(key, list) else key, stored_at, _decode_value(value))
+            for key, stored_at, value in items
+            if stored_at >= cutoff
+        ]
+        for name, items in payload["caches"].items()
+    }
+
+
+def restore_entries(caches: Dict[str, TTLCache], entries: Dict[str, List[Entry]]) -> int:
+    """읽은 항목을 캐시에 넣음 (저장 시각 유지, 이미 더 새 항목이 있으면 건너뜀)
+
+    Args:
+        caches: 이름 -> 캐시
+        entries: read_snapshot() 결과
+
+    Returns:
+        int: 복원한 항목 수
+    """
+    restored = 0
+    for name, items in entries.items():
+        cache = caches.get(name)
+        if cache is None:
+            continue
+        for key, stored_at, value in items:
+            current = cache.stored_at(key)
+            if current is not None and current >= stored_at:
+                continue
+            cache.set(key, value, stored_at=stored_at)
+            restored += 1
+    return restored
@@ -0,0 +1,129 @@
+"""태그 역색인
+
+태그 -> 게시글 키 집합을 유지해 "점검 태그가 붙은 글" 같은 질의를 업스트림 호출
+없이 답한다. NewsService가 게시글을 가져올 때마다 증분 갱신하며, 같은 게시글의
+태그가 바뀌면 이전 태그에서 제거한다. 태그 비교는 대소문자를 구분하지 않는다.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.storage.records import ArticleRecord
+
+MATCH_ALL = "and"
+MATCH_ANY = "or"
+
+
+def _normalize_tag(tag: str) -> str:
+    return tag.strip().casefold()
+
+
+class TagIndex:
+    """태그 -> 게시글 키 역색인"""
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        self._records: Dict[str, ArticleRecord] = {}
+        # 정규화 태그 -> 처음 색인된 표기 (응답 표시용)
+        self._labels: Dict[str, str] = {}
+
+    def add(self, records: Iterable[ArticleRecord]) -> None:
+        """레코드 색인 (이미 있는 게시글은 최신 레코드와 태그로 교체)
+
+        Args:
+            records: 색인할 레코드
+        """
+        for record in records:
+            key = record.key
+            new_tags = {_normalize_tag(tag) for tag in record.tags}
+            previous = self._records.get(key)
+            if previous is not None:
+                for tag in {_normalize_tag(tag) for tag in previous.tags} - new_tags:
+                    self._discard(tag, key)
+
+            self._records[key] = record
+            for tag, label in zip(map(_normalize_tag, record.tags), record.tags):
+                if tag:
+                    self._postings.setdefault(tag, set()).add(key)
+                    self._labels.setdefault(tag, label.strip())
+
+    def _discard(self, tag: str, key: str) -> None:
+        keys = self._postings.get(tag)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del self._postings[tag]
+            del self._labels[tag]
+
+    def remove(self, key: str) -> None:
+        """레코드 색인 삭제"""
+        record = self._records.pop(key, None)
+        if record is not None:
+            for tag in {_normalize_tag(tag) for tag in record.tags}:
+                self._discard(tag, key)
+
+    def query(
+        self,
+        tags: Iterable[str],
+        mode: str = MATCH_ANY,
+        game: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[ArticleRecord]:
+        """태그로 게시글 조회
+
+        Args:
+            tags: 조회할 태그
+            mode: "and"(모든 태그 포함) 또는 "or"(하나 이상 포함)
+            game: 게임 필터
+            limit: 최대 결과 수 (None이면 전체)
+
+        Returns:
+            List[ArticleRecord]: 최신순 게시글
+
+        Raises:
+            ValueError: 지원하지 않는 mode인 경우
+        """
+        if mode not in (MATCH_ALL, MATCH_ANY):
+            raise ValueError(f"지원하지 않는 태그 조합 방식입니다: {mode}")
+
+        postings = [self._postings.get(tag, set()) for tag in {_normalize_tag(tag) for tag in tags} if tag]
+        if not postings:
+            return []
+        if mode == MATCH_ALL:
+            # 가장 작은 집합부터 교집합
+            postings.sort(key=len)
+            keys = postings[0].intersection(*postings[1:])
+        else:
+            keys = set().union(*postings)
+
+        records = (self._records[key] for key in keys)
+        if game is not None:
+            records = (record for record in records if record.game == game)
+
+        order = lambda record: record.published_ts
+        if limit is None:
+            return sorted(records, key=order, reverse=True)
+        return heapq.nlargest(limit, records, key=order)
+
+    def tag_counts(self, game: Optional[str] = None) -> Dict[str, int]:
+        """태그별 게시글 수 (많은 순)
+
+        Args:
+            game: 게임 필터
+
+        Returns:
+            Dict[str, int]: 태그 표기 -> 게시글 수
+        """
+        counts = {}
+        for tag, keys in self._postings.items():
+            count = len(keys) if game is None else sum(1 for key in keys if self._records[key].game == game)
+            if count:
+                counts[self._labels[tag]] = count
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
@@ -0,0 +1,141 @@
+"""발행 시각 범위 색인
+
+(게임, 카테고리)별로 발행 시각(epoch 초) 순 정렬 배열을 유지하고, bisect로
+[시작, 끝] 범위의 게시글을 찾는다. 또한 목록 조회로 빠짐없이 확인한 시각 구간
+(coverage)을 기록해, 요청한 범위를 색인만으로 답할 수 있는지 판단한다.
+
+목록 첫 페이지를 가져오면 "페이지 마지막 글의 발행 시각 ~ 조회 시각" 사이의 글은
+모두 본 것으로 간주한다(상단 고정글은 페이지 앞쪽에 오므로 마지막 글이 페이지가
+거슬러 올라간 시점이다).
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.storage.records import ArticleRecord
+
+_Bucket = Tuple[str, str]
+
+
+class TimeIndex:
+    """(게임, 카테고리)별 발행 시각 정렬 색인"""
+
+    def __init__(self):
+        # (게임, 카테고리) -> 정렬된 (발행 시각, 키) 목록
+        self._entries: Dict[_Bucket, List[Tuple[int, str]]] = {}
+        self._records: Dict[str, ArticleRecord] = {}
+        # 키 -> 게시글이 올라온 카테고리 (같은 글이 여러 게시판에 있을 수 있음)
+        self._placed: Dict[str, Set[str]] = {}
+        # (게임, 카테고리) -> 겹치지 않게 병합한 [시작, 끝] 구간 목록
+        self._coverage: Dict[_Bucket, List[List[int]]] = {}
+
+    def add(self, records: Iterable[ArticleRecord]) -> None:
+        """레코드 색인 (이미 있는 게시글은 최신 레코드로 교체)
+
+        같은 게시글이 다른 카테고리로 들어오면 그 카테고리에도 추가한다.
+
+        Args:
+            records: 색인할 레코드
+        """
+        for record in records:
+            key = record.key
+            previous = self._records.get(key)
+            placed = self._placed.setdefault(key, set())
+            if previous is not None and previous.published_ts != record.published_ts:
+                self._discard(previous, placed)
+                for category in placed:
+                    insort(self._entries.setdefault((record.game, category), []), (record.published_ts, key))
+
+            self._records[key] = record
+            if record.category not in placed:
+                placed.add(record.category)
+                insort(self._entries.setdefault((record.game, record.category), []), (record.published_ts, key))
+
+    def _discard(self, record: ArticleRecord, categories: Iterable[str]) -> None:
+        for category in categories:
+            entries = self._entries.get((record.game, category))
+            if entries:
+                i = bisect_left(entries, (record.published_ts, record.key))
+                if i < len(entries) and entries[i][1] == record.key:
+                    del entries[i]
+
+    def remove(self, key: str) -> None:
+        """레코드 색인 삭제"""
+        record = self._records.pop(key, None)
+        if record is not None:
+            self._discard(record, self._placed.pop(key, ()))
+
+    def range(
+        self,
+        game: str,
+        category: str,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> List[ArticleRecord]:
+        """발행 시각이 [start_ts, end_ts] 안인 게시글 조회
+
+        Args:
+            game: 게임 이름
+            category: 카테고리
+            start_ts: 시작 시각 (epoch 초, 포함, None이면 처음부터)
+            end_ts: 끝 시각 (epoch 초, 포함, None이면 끝까지)
+            limit: 최대 결과 수 (최신 글부터)
+
+        Returns:
+            List[ArticleRecord]: 최신순 게시글 (다른 카테고리로 먼저 들어온 게시글도 category로 표시)
+        """
+        entries = self._entries.get((game, category))
+        if not entries:
+            return []
+        lo = bisect_left(entries, (start_ts,)) if start_ts is not None else 0
+        hi = bisect_right(entries, (end_ts, "\U0010ffff")) if end_ts is not None else len(entries)
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return [self._records[key].with_category(category) for _, key in reversed(entries[lo:hi])]
+
+    def mark_covered(self, game: str, category: str, start_ts: int, end_ts: int) -> None:
+        """[start_ts, end_ts] 구간의 게시글을 빠짐없이 확인했음을 기록
+
+        Args:
+            game: 게임 이름
+            category: 카테고리
+            start_ts: 구간 시작 (epoch 초)
+            end_ts: 구간 끝 (epoch 초)
+        """
+        if start_ts > end_ts:
+            return
+        merged = []
+        for interval in sorted(self._coverage.get((game, category), []) + [[start_ts, end_ts]]):
+            if merged and interval[0] <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], interval[1])
+            else:
+                merged.append(list(interval))
+        self._coverage[(game, category)] = merged
+
+    def covers(self, game: str, category: str, start_ts: int, end_ts: int, slack: int = 0) -> bool:
+        """[start_ts, end_ts] 구간을 색인만으로 답할 수 있는지 여부
+
+        Args:
+            game: 게임 이름
+            category: 카테고리
+            start_ts: 구간 시작 (epoch 초)
+            end_ts: 구간 끝 (epoch 초)
+            slack: 구간 끝 허용 오차 (초). 확인 시각 이후 이만큼은 새 글이 없다고 간주
+
+        Returns:
+            bool: 한 확인 구간이 요청 구간 전체를 포함하면 True
+        """
+        intervals = self._coverage.get((game, category), [])
+        i = bisect_right(intervals, [start_ts, float("inf")]) - 1
+        return i >= 0 and intervals[i][0] <= start_ts and end_ts <= intervals[i][1] + slack
+
+    def coverage(self, game: str, category: str) -> List[Tuple[int, int]]:
+        """확인한 구간 목록 (진단용)"""
+        return [tuple(interval) for interval in self._coverage.get((game, category), [])]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
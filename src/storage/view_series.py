@@ -0,0 +1,165 @@
+"""게시글 조회수 시계열과 인기 급상승 집계
+
+목록을 가져올 때마다 받는 조회수(view_score)를 게시글별 (시각, 조회수) 표본으로
+쌓는다. 표본은 array('I') 두 개에 보관하고(표본당 8바이트), 최대 표본 수를 넘으면
+오래된 절반을 2:1로 솎아 내 최근 구간은 촘촘하게, 오래된 구간은 듬성듬성하게 남긴다.
+
+표본을 추가할 때 최근 window 구간의 시간당 조회수 증가량(velocity)을 같이 갱신해
+두므로, 인기 급상승 조회는 이력을 다시 훑지 않고 게시글별 집계값만 비교한다.
+"""
+
+import heapq
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from src.storage.records import ArticleRecord
+
+# 게시글당 최대 표본 수
+DEFAULT_MAX_SAMPLES = 64
+# 이 간격(초)보다 가까운 표본은 새 표본으로 덮어씀
+DEFAULT_MIN_INTERVAL = 60
+# 증가량 계산 구간 (초)
+DEFAULT_WINDOW = 6 * 3600
+
+
+class TrendingEntry(NamedTuple):
+    """인기 급상승 게시글 한 건"""
+    record: ArticleRecord
+    velocity: float  # 시간당 조회수 증가량
+    views: int
+
+
+class _Series:
+    """게시글별 조회수 표본과 집계값"""
+
+    __slots__ = ("record", "times", "views", "velocity")
+
+    def __init__(self, record: ArticleRecord):
+        self.record = record
+        self.times = array("I")
+        self.views = array("I")
+        self.velocity: Optional[float] = None
+
+
+class ViewSeriesStore:
+    """게시글 조회수 시계열 저장소"""
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        min_interval: int = DEFAULT_MIN_INTERVAL,
+        max_articles: int = 20000
+    ):
+        """
+        Args:
+            window: 증가량 계산 구간 (초)
+            max_samples: 게시글당 최대 표본 수 (넘으면 오래된 절반을 솎아 냄)
+            min_interval: 이 간격(초)보다 가까운 표본은 덮어씀
+            max_articles: 추적할 최대 게시글 수 (넘으면 가장 오래 갱신되지 않은 것부터 삭제)
+        """
+        if max_samples < 4:
+            raise ValueError("max_samples는 4 이상이어야 합니다")
+        self.window = window
+        self.max_samples = max_samples
+        self.min_interval = min_interval
+        self.max_articles = max_articles
+        # 키 -> 시계열 (최근 갱신 순서 유지)
+        self._series: Dict[str, _Series] = {}
+
+    def observe(self, record: ArticleRecord, now: float) -> None:
+        """조회수 표본 추가 (조회수가 없거나 마지막 표본보다 이전 시각이면 무시)
+
+        Args:
+            record: 가져온 레코드
+            now: 수집 시각 (epoch 초)
+        """
+        if record.view_count is None:
+            return
+        ts = int(now)
+        series = self._series.pop(record.key, None)
+        if series is None:
+            series = _Series(record)
+        self._series[record.key] = series
+
+        times, views = series.times, series.views
+        if times and ts < times[-1]:
+            return
+        series.record = record
+        if times and ts - times[-1] < self.min_interval:
+            times[-1] = ts
+            views[-1] = record.view_count
+        else:
+            times.append(ts)
+            views.append(record.view_count)
+            if len(times) > self.max_samples:
+                self._downsample(series)
+        series.velocity = self._velocity(series)
+
+        while len(self._series) > self.max_articles:
+            del self._series[next(iter(self._series))]
+
+    def observe_many(self, records: Iterable[ArticleRecord], now: float) -> None:
+        """여러 레코드의 조회수 표본 추가"""
+        for record in records:
+            self.observe(record, now)
+
+    @staticmethod
+    def _downsample(series: _Series) -> None:
+        """오래된 절반의 표본을 2:1로 솎아 냄 (각 쌍의 뒤쪽 표본 유지)"""
+        half = len(series.times) // 2
+        series.times[:half] = series.times[1:half:2]
+        series.views[:half] = series.views[1:half:2]
+
+    def _velocity(self, series: _Series) -> Optional[float]:
+        """최근 window 구간의 시간당 조회수 증가량
+
+        구간 안에서 가장 오래된 표본을 기준으로 하며, 게시글이 구간 안에 올라왔으면
+        발행 시각의 조회수를 0으로 보고 기준으로 삼는다. 기준이 없으면 None.
+        """
+        times, views = series.times, series.views
+        last_ts = times[-1]
+        start = last_ts - self.window
+        published_ts = series.record.published_ts
+        if start <= published_ts < last_ts:
+            base_ts, base_views = published_ts, 0
+        else:
+            i = bisect_left(times, start)
+            if i >= len(times) - 1:
+                return None
+            base_ts, base_views = times[i], views[i]
+        return max(views[-1] - base_views, 0) * 3600 / (last_ts - base_ts)
+
+    def trending(self, now: float, game: Optional[str] = None, limit: int = 10) -> List[TrendingEntry]:
+        """시간당 조회수 증가량이 큰 게시글 (마지막 표본이 window 안에 있는 것만)
+
+        Args:
+            now: 기준 시각 (epoch 초)
+            game: 게임 필터
+            limit: 최대 결과 수
+
+        Returns:
+            List[TrendingEntry]: 증가량 내림차순
+        """
+        cutoff = now - self.window
+        candidates = (
+            series for series in self._series.values()
+            if series.velocity is not None and series.times[-1] >= cutoff
+            and (game is None or series.record.game == game)
+        )
+        top = heapq.nlargest(limit, candidates, key=lambda series: series.velocity)
+        return [TrendingEntry(series.record, series.velocity, series.views[-1]) for series in top]
+
+    def samples(self, key: str) -> List[Tuple[int, int]]:
+        """게시글의 (시각, 조회수) 표본 목록 (오래된 순)"""
+        series = self._series.get(key)
+        if series is None:
+            return []
+        return list(zip(series.times, series.views))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._series
+
+    def __len__(self) -> int:
+        return len(self._series)
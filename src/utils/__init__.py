@@ -7,10 +7,28 @@ from .helpers import (
     extract_article_id,
     clean_text,
     generate_news_id,
+    canonical_url,
+    stable_article_id,
     is_important_news,
     extract_tags_from_title,
     format_view_count,
-    truncate_text
+    truncate_text,
+    filter_news_since
+)
+
+from .text import normalize_text
+from .html_text import html_to_text
+
+from .serialization import (
+    news_list_to_json,
+    news_list_to_python,
+    news_views_to_json,
+    records_to_json
+)
+
+from .classifier import (
+    KeywordClassifier,
+    Classification
 )
 
 from .validators import (
@@ -38,10 +56,27 @@ __all__ = [
     "extract_article_id",
     "clean_text",
     "generate_news_id",
+    "canonical_url",
+    "stable_article_id",
     "is_important_news",
     "extract_tags_from_title",
     "format_view_count",
     "truncate_text",
+    "filter_news_since",
+    
+    # 텍스트 정규화 / HTML 본문 변환
+    "normalize_text",
+    "html_to_text",
+    
+    # 일괄 직렬화
+    "news_list_to_json",
+    "news_list_to_python",
+    "news_views_to_json",
+    "records_to_json",
+    
+    # 키워드 분류기
+    "KeywordClassifier",
+    "Classification",
     
     # 검증 함수들
     "validate_game_news",
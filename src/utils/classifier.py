@@ -0,0 +1,174 @@
+"""제목 키워드 분류기
+
+여러 키워드 목록(태그, 중요도, 점검 여부 등)을 하나의 정규식 alternation으로
+컴파일하여 제목을 한 번만 훑고 태그와 플래그를 함께 계산한다.
+
+alternation은 각 위치에서 가장 긴 키워드를 소비하므로, 긴 키워드 안에 포함된 짧은
+키워드(예: '점검' ⊂ '정기점검')는 컴파일 시 긴 키워드에 라벨을 합쳐 둔다. 앞 키워드와
+일부만 겹쳐 시작하는 키워드(예: 'maintenance'의 끝 'e'로 시작하는 'end')는 소비된 구간에
+가려질 수 있으므로, 그런 키워드만 따로 `in` 검사로 보완한다. 결과는 키워드마다
+`keyword in title.lower()`를 검사한 것과 같다.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+# 플래그 이름
+IMPORTANT = "important"
+MAINTENANCE = "maintenance"
+
+
+class Classification(NamedTuple):
+    """분류 결과"""
+    tags: List[str]
+    flags: FrozenSet[str]
+
+    @property
+    def is_important(self) -> bool:
+        """중요 키워드 포함 여부"""
+        return IMPORTANT in self.flags
+
+    @property
+    def is_maintenance(self) -> bool:
+        """점검 키워드 포함 여부"""
+        return MAINTENANCE in self.flags
+
+    def has(self, flag: str) -> bool:
+        """임의 플래그 포함 여부"""
+        return flag in self.flags
+
+
+class KeywordClassifier:
+    """다중 키워드 단일 패스 분류기"""
+
+    def __init__(
+        self,
+        tags: Optional[Dict[str, Iterable[str]]] = None,
+        flags: Optional[Dict[str, Iterable[str]]] = None,
+        bracket_tags: bool = False
+    ):
+        """
+        Args:
+            tags: 태그 -> 해당 태그를 붙이는 키워드 목록
+            flags: 플래그 이름 -> 해당 플래그를 켜는 키워드 목록
+            bracket_tags: 대괄호 말머리([공지] 등)를 태그로 추가할지 여부
+        """
+        self.bracket_tags = bracket_tags
+
+        # 태그와 플래그에 비트를 하나씩 배정 (태그는 정의 순서대로 하위 비트)
+        self._tag_names: List[str] = list(dict.fromkeys(tags or {}))
+        self._flag_names: List[str] = list(dict.fromkeys(flags or {}))
+        flag_offset = len(self._tag_names)
+
+        # 키워드(소문자) -> 라벨 비트마스크
+        masks: Dict[str, int] = {}
+        for bit, keywords in enumerate((tags or {}).values()):
+            for keyword in keywords:
+                masks[keyword.lower()] = masks.get(keyword.lower(), 0) | (1 << bit)
+        for bit, keywords in enumerate((flags or {}).values(), flag_offset):
+            for keyword in keywords:
+                masks[keyword.lower()] = masks.get(keyword.lower(), 0) | (1 << bit)
+
+        # 긴 키워드에 그 안에 포함된 짧은 키워드의 라벨을 합침
+        self._masks: Dict[str, int] = {}
+        for keyword in masks:
+            mask = 0
+            for other, other_mask in masks.items():
+                if other in keyword:
+                    mask |= other_mask
+            self._masks[keyword] = mask
+
+        # 비트마스크 -> (태그 목록, 플래그 집합) 변환 결과 캐시
+        self._decoded: Dict[int, Tuple[Tuple[str, ...], FrozenSet[str]]] = {}
+
+        self._pattern: Optional[re.Pattern] = None
+        if self._masks:
+            keywords = sorted(self._masks, key=len, reverse=True)
+            # 한글처럼 대소문자가 없는 키워드만 있으면 IGNORECASE 없이 더 빠르게 매칭
+            cased = any(keyword != keyword.upper() for keyword in keywords)
+            self._pattern = re.compile(
+                "|".join(re.escape(keyword) for keyword in keywords),
+                re.IGNORECASE if cased else 0
+            )
+
+        # 다른 키워드와 일부만 겹쳐 alternation 스캔에서 누락될 수 있는 키워드
+        self._overlapping = tuple(
+            keyword for keyword in self._masks if _may_start_inside(keyword, self._masks)
+        )
+
+    def classify(self, title: Optional[str]) -> Classification:
+        """제목 하나를 분류
+
+        Args:
+            title: 게시글 제목
+
+        Returns:
+            Classification: 태그와 플래그
+        """
+        if not title:
+            return Classification([], frozenset())
+        keywords = self._pattern.findall(title) if self._pattern is not None else ()
+        brackets = _BRACKET_PATTERN.findall(title) if self.bracket_tags and "[" in title else ()
+        return self._collect(title, keywords, brackets)
+
+    def classify_many(self, titles: Iterable[Optional[str]]) -> List[Classification]:
+        """여러 제목을 분류
+
+        Args:
+            titles: 게시글 제목 목록
+
+        Returns:
+            List[Classification]: 제목 순서대로의 분류 결과
+        """
+        classify = self.classify
+        return [classify(title) for title in titles]
+
+    def _collect(self, title: str, keywords: List[str], brackets: List[str]) -> Classification:
+        """매치된 키워드/말머리를 태그와 플래그로 변환"""
+        masks = self._masks
+        mask = 0
+        for keyword in keywords:
+            mask |= masks.get(keyword) or masks[keyword.lower()]
+
+        if keywords and self._overlapping:
+            title_lower = title.lower()
+            for keyword in self._overlapping:
+                if keyword in title_lower:
+                    mask |= masks[keyword]
+
+        decoded = self._decoded.get(mask)
+        if decoded is None:
+            decoded = self._decoded[mask] = self._decode(mask)
+        tags, flags = decoded
+
+        if brackets:
+            return Classification(list(dict.fromkeys([*brackets, *tags])), flags)
+        return Classification(list(tags), flags)
+
+    def _decode(self, mask: int) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """비트마스크를 태그 목록과 플래그 집합으로 변환"""
+        tags = tuple(name for bit, name in enumerate(self._tag_names) if mask >> bit & 1)
+        offset = len(self._tag_names)
+        flags = frozenset(
+            name for bit, name in enumerate(self._flag_names, offset) if mask >> bit & 1
+        )
+        return tags, flags
+
+
+# 대괄호 말머리 ([공지] 등)
+_BRACKET_PATTERN = re.compile(r"\[([^\]\n]+)\]")
+
+
+def _may_start_inside(keyword: str, keywords: Iterable[str]) -> bool:
+    """keyword가 다른 키워드의 중간에서 시작해 그 끝을 넘어설 수 있는지 확인
+
+    예: 'maintenance'의 접미사 'e'는 'end'의 접두사이므로 "maintenancend" 같은
+    제목에서 'end'는 'maintenance'에 가려진다.
+    """
+    for other in keywords:
+        if keyword in other:
+            continue
+        for size in range(1, min(len(other), len(keyword))):
+            if other.endswith(keyword[:size]):
+                return True
+    return False
@@ -0,0 +1,78 @@
+"""도구 호출 단위의 전체 마감 시간(deadline) 관리
+
+deadline_scope() 안에서 실행되는 모든 작업(재시도, fallback, 브라우저 대기 포함)은
+contextvars를 통해 같은 마감 시각을 공유한다. asyncio 작업은 생성 시점의 컨텍스트를
+복사하므로 하위 작업에도 자동으로 전파된다.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from src.models.exceptions import DeadlineExceededException
+
+# 현재 작업의 마감 시각 (time.monotonic 기준), 없으면 None
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """마감 시간 범위 설정
+    
+    이미 더 이른 마감 시각이 설정되어 있으면 그 값을 유지한다.
+    
+    Args:
+        seconds: 지금부터 허용할 최대 시간 (초), None이면 제한 없음
+    """
+    if seconds is None:
+        yield
+        return
+    
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """마감까지 남은 시간 (초), 마감이 없으면 None"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def check_deadline(operation: str = "") -> None:
+    """마감 시간이 지났으면 예외 발생
+    
+    Args:
+        operation: 오류 메시지에 포함할 작업 설명
+        
+    Raises:
+        DeadlineExceededException: 마감 시간이 지난 경우
+    """
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededException(f"요청 처리 시간 초과: {operation}".rstrip(": "))
+
+
+def bounded_timeout(timeout: float) -> float:
+    """개별 작업 타임아웃을 남은 마감 시간으로 제한
+    
+    Args:
+        timeout: 작업 자체의 타임아웃 (초)
+        
+    Returns:
+        float: min(timeout, 남은 시간)
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    return min(timeout, remaining)
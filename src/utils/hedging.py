@@ -0,0 +1,155 @@
+"""지연 꼬리를 줄이기 위한 헤지(hedged) 요청
+
+OnStove 상세 API는 대부분 200ms 안팎에 응답하지만 가끔 몇 초씩 걸린다. 첫 요청이
+최근 응답 시간의 p90 안에 끝나지 않으면 같은 요청을 하나 더 보내 먼저 끝난 쪽을 쓰고
+나머지는 취소한다. 추가 요청은 전체 요청 수의 budget_ratio 비율까지만 허용한다
+(토큰 버킷: 요청마다 budget_ratio개 적립, 헤지 1회에 1개 사용).
+
+p90은 엔드포인트별 최근 응답 시간 표본으로 계산하며, 표본이 min_samples개 모이기
+전에는 헤지하지 않는다. 표본은 재시도 대기를 뺀 HTTP 요청 1회의 응답 시간으로,
+BaseScraper._send가 성공한 요청마다 기록한다.
+"""
+
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from src.config.settings import settings
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """최근 응답 시간 표본"""
+
+    def __init__(self, size: int = 200):
+        """
+        Args:
+            size: 보관할 최근 표본 수
+        """
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float) -> None:
+        """응답 시간 기록 (초)"""
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q 분위수 (표본이 없으면 None)"""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class HedgeBudget:
+    """헤지 요청 토큰 버킷"""
+
+    def __init__(self, ratio: float, max_tokens: float = 10.0):
+        """
+        Args:
+            ratio: 요청 1회당 적립 토큰 (허용할 추가 요청 비율)
+            max_tokens: 최대 적립 토큰 (몰아서 쓸 수 있는 헤지 수)
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = 0.0
+
+    def deposit(self) -> None:
+        """요청 1회분 적립"""
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """헤지 1회분 사용 (부족하면 False)"""
+        if self.tokens < 1.0 - 1e-9:  # 0.1씩 적립한 부동소수점 오차 허용
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class Hedger:
+    """엔드포인트별 p90 기준 헤지 요청 실행기"""
+
+    def __init__(self, percentile: float = settings.HEDGE_PERCENTILE,
+                 budget_ratio: float = settings.HEDGE_BUDGET_RATIO,
+                 min_samples: int = settings.HEDGE_MIN_SAMPLES):
+        """
+        Args:
+            percentile: 헤지를 보낼 응답 시간 분위수
+            budget_ratio: 허용할 추가 요청 비율
+            min_samples: 헤지를 시작할 최소 표본 수
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.budget = HedgeBudget(budget_ratio)
+        self._trackers: Dict[str, LatencyTracker] = {}
+        # 보낸 헤지 / 헤지가 이긴 횟수
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def tracker(self, key: str) -> LatencyTracker:
+        """엔드포인트의 응답 시간 표본 (없으면 생성)"""
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            tracker = self._trackers[key] = LatencyTracker()
+        return tracker
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """헤지를 보낼 대기 시간 (표본이 부족하면 None)"""
+        tracker = self.tracker(key)
+        if len(tracker) < self.min_samples:
+            return None
+        return tracker.percentile(self.percentile)
+
+    async def run(self, key: str, attempt: Callable[[], Awaitable[T]]) -> T:
+        """요청 실행 (p90 안에 끝나지 않으면 헤지 요청 추가)
+
+        Args:
+            key: 엔드포인트 키 (응답 시간 표본 구분)
+            attempt: 요청 1회를 수행하는 코루틴 함수
+
+        Returns:
+            T: 먼저 성공한 요청의 결과
+
+        Raises:
+            Exception: 모든 요청이 실패하면 첫 요청의 예외
+        """
+        self.budget.deposit()
+        delay = self.hedge_delay(key)
+
+        if delay is None:
+            return await attempt()
+
+        first = asyncio.ensure_future(attempt())
+        second: Optional[asyncio.Future] = None
+        try:
+            done, _ = await asyncio.wait({first}, timeout=delay)
+            if done or not self.budget.try_spend():
+                return await first
+
+            self.hedges += 1
+            second = asyncio.ensure_future(attempt())
+            pending = {first, second}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            self.hedge_wins += 1
+                        return task.result()
+            return first.result()
+        finally:
+            for task in (first, second):
+                if task is None:
+                    continue
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # 같이 끝난 진 요청의 예외도 회수 (미회수 예외 경고 방지)
+                    task.exception()
+
+
+# 상세 조회용 전역 헤지 실행기
+hedger = Hedger()
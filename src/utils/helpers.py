@@ -2,49 +2,17 @@
 
 import re
 import hashlib
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Optional, Union, List
-from urllib.parse import urlparse, urljoin
+from typing import Optional, Union, List, TYPE_CHECKING
+from urllib.parse import urlparse, urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
 from src.models.exceptions import InvalidUrlException
+from src.utils.classifier import KeywordClassifier, IMPORTANT
+from src.utils.text import normalize_text
+from src.utils.timestamps import parse_timestamp
 
-def parse_timestamp(timestamp: Union[int, str, datetime]) -> datetime:
-    """다양한 형식의 타임스탬프를 datetime 객체로 변환
-    
-    Args:
-        timestamp: UNIX 타임스탬프(초/밀리초), ISO 문자열, 또는 datetime 객체
-        
-    Returns:
-        datetime: UTC 기준 datetime 객체
-        
-    Raises:
-        ValueError: 변환할 수 없는 형식인 경우
-    """
-    if isinstance(timestamp, datetime):
-        return timestamp.replace(tzinfo=timezone.utc) if timestamp.tzinfo is None else timestamp
-    
-    if isinstance(timestamp, str):
-        # ISO 형식 문자열 파싱
-        try:
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
-        except ValueError:
-            # 숫자 문자열일 수 있음
-            try:
-                timestamp = int(timestamp)
-            except ValueError:
-                raise ValueError(f"지원하지 않는 날짜 형식입니다: {timestamp}")
-    
-    if isinstance(timestamp, int):
-        # UNIX 타임스탬프 처리
-        # 밀리초 단위인지 확인 (13자리 이상)
-        if timestamp > 10**10:
-            timestamp_float = timestamp / 1000
-        else:
-            timestamp_float = float(timestamp)
-        
-        return datetime.fromtimestamp(timestamp_float, tz=timezone.utc)
-    
-    raise ValueError(f"지원하지 않는 타임스탬프 형식입니다: {type(timestamp)}")
+if TYPE_CHECKING:
+    from src.models.game_news import GameNews
 
 def validate_url(url: str) -> bool:
     """URL 유효성 검증
@@ -113,27 +81,60 @@ def extract_article_id(url: str) -> Optional[str]:
     return None
 
 def clean_text(text: str) -> str:
-    """텍스트 정제
+    """텍스트 정제 (normalize_text와 동일)
     
     Args:
         text: 정제할 텍스트
         
     Returns:
-        str: 정제된 텍스트
+        str: 태그 제거, 엔티티 디코딩, 공백 정리가 된 텍스트
     """
-    if not text:
-        return ""
+    return normalize_text(text)
+
+# ID 계산 시 무시하는 추적용 쿼리 파라미터
+_TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid')
+
+def canonical_url(url: str) -> str:
+    """ID 계산용 정규 URL
     
-    # HTML 태그 제거
-    text = re.sub(r'<[^>]+>', '', text)
+    스킴/호스트를 소문자로 바꾸고, 프래그먼트와 추적용 파라미터를 제거하고,
+    쿼리 파라미터를 정렬하고, 경로 끝의 '/'를 제거한다.
     
-    # 연속된 공백 제거
-    text = re.sub(r'\s+', ' ', text)
+    Args:
+        url: 원본 URL
+        
+    Returns:
+        str: 정규화된 URL
+    """
+    parsed = urlsplit(str(url).strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith(_TRACKING_PARAMS)
+    )
+    return urlunsplit((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path.rstrip('/') or '/',
+        urlencode(query),
+        '',
+    ))
+
+def stable_article_id(url: str) -> str:
+    """URL 기반의 안정적인 게시글 ID
     
-    # 앞뒤 공백 제거
-    text = text.strip()
+    내장 hash()는 프로세스마다 값이 달라지므로(해시 랜덤화) 캐시/저장소/중복 제거에
+    쓸 수 없다. 정규 URL의 blake2b 64비트 다이제스트를 사용하여 프로세스나 워커가
+    달라도 같은 게시글은 같은 ID를 갖는다. 게시판 숫자 ID와 구분되도록 'u'를 붙인다.
     
-    return text
+    Args:
+        url: 게시글 URL
+        
+    Returns:
+        str: 'u' + 16자리 16진수
+    """
+    digest = hashlib.blake2b(canonical_url(url).encode('utf-8'), digest_size=8)
+    return 'u' + digest.hexdigest()
 
 def generate_news_id(title: str, url: str, published_at: datetime) -> str:
     """뉴스 고유 ID 생성
@@ -144,17 +145,44 @@ def generate_news_id(title: str, url: str, published_at: datetime) -> str:
         published_at: 발행 일시
         
     Returns:
-        str: 고유 ID (해시값)
+        str: URL의 게시글 ID, 없으면 URL 기반 안정 ID
+             (URL이 없으면 제목과 발행 일시의 해시)
     """
-    # URL에서 게시글 ID 추출 시도
-    article_id = extract_article_id(url)
-    if article_id:
-        return article_id
+    if url:
+        # URL에서 게시글 ID 추출 시도
+        return extract_article_id(str(url)) or stable_article_id(url)
     
-    # 제목, URL, 발행일시를 조합하여 해시 생성
-    content = f"{title}|{url}|{published_at.isoformat()}"
+    # 제목과 발행일시를 조합하여 해시 생성
+    content = f"{title}|{published_at.isoformat()}"
     return hashlib.md5(content.encode('utf-8')).hexdigest()[:12]
 
+# 기본 중요 키워드
+DEFAULT_IMPORTANT_KEYWORDS = (
+    '긴급', '중요', '필독', '공지', '점검', '업데이트', '패치',
+    '이벤트', '보상', '버그', '수정', '신규', '추가', '변경'
+)
+
+# 중요 표시 특수 문자 (📌, ⚠️, 🔥 등)
+IMPORTANT_MARKS = tuple('📌⚠️🔥❗️‼️')
+
+# 기본 태그 키워드
+DEFAULT_TAG_KEYWORDS = {
+    '점검': ['점검', 'maintenance'],
+    '업데이트': ['업데이트', 'update', '패치', 'patch'],
+    '이벤트': ['이벤트', 'event'],
+    '공지': ['공지', 'notice', 'announcement'],
+    '버그': ['버그', 'bug', '수정', 'fix'],
+    '신규': ['신규', 'new', '추가', 'add'],
+}
+
+_TAG_CLASSIFIER = KeywordClassifier(tags=DEFAULT_TAG_KEYWORDS, bracket_tags=True)
+
+
+@lru_cache(maxsize=32)
+def _important_classifier(keywords: tuple) -> KeywordClassifier:
+    """중요 키워드 목록별 분류기 (키워드 목록 단위로 캐시)"""
+    return KeywordClassifier(flags={IMPORTANT: keywords + IMPORTANT_MARKS})
+
 def is_important_news(title: str, keywords: Optional[List[str]] = None) -> bool:
     """중요 뉴스 여부 판단
     
@@ -165,24 +193,8 @@ def is_important_news(title: str, keywords: Optional[List[str]] = None) -> bool:
     Returns:
         bool: 중요 뉴스 여부
     """
-    if not keywords:
-        keywords = [
-            '긴급', '중요', '필독', '공지', '점검', '업데이트', '패치',
-            '이벤트', '보상', '버그', '수정', '신규', '추가', '변경'
-        ]
-    
-    title_lower = title.lower()
-    
-    # 키워드 매칭
-    for keyword in keywords:
-        if keyword.lower() in title_lower:
-            return True
-    
-    # 특수 문자 패턴 (📌, ⚠️, 🔥 등)
-    if re.search(r'[📌⚠️🔥❗️‼️]', title):
-        return True
-    
-    return False
+    keywords = tuple(keywords) if keywords else DEFAULT_IMPORTANT_KEYWORDS
+    return _important_classifier(keywords).classify(title).is_important
 
 def extract_tags_from_title(title: str) -> List[str]:
     """제목에서 태그 추출
@@ -191,30 +203,9 @@ def extract_tags_from_title(title: str) -> List[str]:
         title: 뉴스 제목
         
     Returns:
-        List[str]: 추출된 태그 목록
+        List[str]: 추출된 태그 목록 (대괄호 태그 [태그] 포함)
     """
-    tags = []
-    
-    # 대괄호 안의 태그 추출 [태그]
-    bracket_tags = re.findall(r'\[([^\]]+)\]', title)
-    tags.extend(bracket_tags)
-    
-    # 키워드 기반 태그 추출
-    keyword_tags = {
-        '점검': ['점검', 'maintenance'],
-        '업데이트': ['업데이트', 'update', '패치', 'patch'],
-        '이벤트': ['이벤트', 'event'],
-        '공지': ['공지', 'notice', 'announcement'],
-        '버그': ['버그', 'bug', '수정', 'fix'],
-        '신규': ['신규', 'new', '추가', 'add'],
-    }
-    
-    title_lower = title.lower()
-    for tag, keywords in keyword_tags.items():
-        if any(keyword in title_lower for keyword in keywords):
-            tags.append(tag)
-    
-    return list(set(tags))  # 중복 제거
+    return _TAG_CLASSIFIER.classify(title).tags
 
 def format_view_count(count: Optional[int]) -> str:
     """조회수 포맷팅
@@ -249,4 +240,46 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     if not text or len(text) <= max_length:
         return text
     
-    return text[:max_length - len(suffix)] + suffix 
\ No newline at end of file
+    return text[:max_length - len(suffix)] + suffix 
+def _ensure_aware(dt: datetime) -> datetime:
+    """naive datetime은 로컬 시간대로 간주하여 aware datetime으로 변환"""
+    return dt.astimezone() if dt.tzinfo is None else dt
+
+def filter_news_since(
+    news_list: List["GameNews"],
+    since: Optional[Union[int, str, datetime]] = None,
+    since_id: Optional[str] = None
+) -> List["GameNews"]:
+    """기준 시점(커서)보다 새로운 뉴스만 필터링
+    
+    Args:
+        news_list: 최신순으로 정렬된 뉴스 목록
+        since: 기준 시각 (이 시각 이후에 게시된 뉴스만 반환)
+        since_id: 기준 게시글 ID (이 게시글보다 나중에 게시된 뉴스만 반환)
+        
+    Returns:
+        List[GameNews]: 기준 시점 이후의 뉴스 목록
+    """
+    if since is None and not since_id:
+        return list(news_list)
+    
+    cutoff = _ensure_aware(parse_timestamp(since)) if since is not None else None
+    
+    if since_id:
+        # 기준 게시글의 발행 일시를 커서로 사용 (상단 고정글 순서와 무관하게 동작)
+        for news in news_list:
+            if news.id == since_id:
+                published_at = _ensure_aware(news.published_at)
+                if cutoff is None or published_at > cutoff:
+                    cutoff = published_at
+                break
+    
+    result = []
+    for news in news_list:
+        if news.id == since_id:
+            continue
+        if cutoff is not None and _ensure_aware(news.published_at) <= cutoff:
+            continue
+        result.append(news)
+    
+    return result
@@ -0,0 +1,50 @@
+"""호스트별 동시 요청 수 제한
+
+로드나인과 에픽세븐은 같은 api.onstove.com을 쓰므로, 스크래퍼마다 따로 제한하면
+페이지를 동시에 가져올 때 같은 호스트로 요청이 몰린다. 모든 스크래퍼의 요청은
+make_request()에서 호스트별 세마포어를 거친다.
+
+asyncio.Semaphore는 처음 대기가 생긴 이벤트 루프에 묶이므로, 루프가 바뀌면(테스트마다
+새 루프 등) 새 세마포어를 만든다.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Tuple
+from urllib.parse import urlsplit
+
+from src.config.settings import settings
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수 제한기"""
+
+    def __init__(self, limit: int):
+        """
+        Args:
+            limit: 호스트당 최대 동시 요청 수
+        """
+        if limit < 1:
+            raise ValueError("limit은 1 이상이어야 합니다")
+        self.limit = limit
+        self._semaphores: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+    def semaphore(self, url: str) -> asyncio.Semaphore:
+        """URL 호스트의 세마포어 (현재 이벤트 루프 기준)"""
+        host = urlsplit(url).netloc.lower()
+        loop = asyncio.get_running_loop()
+        entry = self._semaphores.get(host)
+        if entry is None or entry[0] is not loop:
+            entry = (loop, asyncio.Semaphore(self.limit))
+            self._semaphores[host] = entry
+        return entry[1]
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """URL 호스트의 요청 슬롯 하나를 점유"""
+        async with self.semaphore(url):
+            yield
+
+
+# 전역 호스트 제한기 (모든 스크래퍼가 공유)
+host_limiter = HostLimiter(settings.MAX_REQUESTS_PER_HOST)
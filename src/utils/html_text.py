@@ -0,0 +1,115 @@
+"""HTML 본문 -> 텍스트 변환
+
+OnStove 상세 API의 content는 에디터가 만든 HTML(수백 KB의 패치 노트 포함)이다.
+lxml(libxml2) 파서로 한 번 파싱한 뒤 트리를 한 번 순회하여 텍스트를 모은다.
+
+- script/style 등 보이지 않는 요소는 제거
+- 문단/제목/표 행 등 블록 요소는 줄바꿈으로 구분
+- 목록 항목은 "- " (순서 목록은 "1. ") 접두어를 붙여 한 줄씩 출력
+- 엔티티(&amp;, &nbsp; 등)는 파서가 디코딩
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from lxml import etree
+
+from src.utils.text import normalize_text
+
+# 내용을 통째로 제거할 요소
+_SKIP_TAGS = ("script", "style", "noscript", "template", "iframe", "object")
+
+# 앞뒤로 줄을 바꾸는 블록 요소
+_BLOCK_TAGS = frozenset({
+    "p", "div", "section", "article", "header", "footer", "main", "aside", "nav",
+    "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "address", "figure",
+    "figcaption", "table", "thead", "tbody", "tfoot", "tr", "caption",
+    "ul", "ol", "dl", "dt", "dd", "li", "hr", "form", "fieldset", "details", "summary",
+})
+
+# 표 셀은 같은 줄에서 구분자로 분리
+_CELL_TAGS = frozenset({"td", "th"})
+
+# 구조상 줄바꿈 표시 (원문 공백과 구분하기 위한 제어 문자)
+_BREAK = "\x00"
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_BREAK_RUN_PATTERN = re.compile(r" ?(?:\x00 ?)+")
+
+_PARSER = etree.HTMLParser(remove_comments=True, remove_pis=True, no_network=True)
+
+
+def html_to_text(html: Optional[str]) -> str:
+    """HTML을 줄 구조가 보존된 텍스트로 변환
+
+    Args:
+        html: HTML 문자열 (마크업이 없는 일반 텍스트도 허용)
+
+    Returns:
+        str: 블록마다 한 줄로 정리된 텍스트 (빈 줄 없음)
+    """
+    if not html:
+        return ""
+
+    if "<" not in html:
+        # 마크업이 없으면 파서를 거치지 않음 (이미 변환된 텍스트의 줄 구조도 유지)
+        return normalize_text(html, keep_newlines=True)
+
+    try:
+        root = etree.fromstring(html, _PARSER)
+    except (etree.ParserError, ValueError):
+        root = None
+    if root is None:
+        # 파싱할 수 없는 입력은 태그만 걷어냄
+        return normalize_text(html)
+
+    etree.strip_elements(root, *_SKIP_TAGS, with_tail=False)
+
+    parts: List[str] = []
+    append = parts.append
+    list_counters: Dict[etree._Element, int] = {}
+
+    for event, element in etree.iterwalk(root, events=("start", "end")):
+        tag = element.tag
+        if not isinstance(tag, str):
+            # 남아 있는 주석/엔티티 노드는 꼬리 텍스트만 사용
+            if event == "end" and element.tail:
+                append(element.tail)
+            continue
+
+        if event == "start":
+            if tag in _BLOCK_TAGS:
+                append(_BREAK)
+                if tag == "li":
+                    append(_list_marker(element, list_counters))
+            elif tag == "br":
+                append(_BREAK)
+            elif tag in _CELL_TAGS:
+                append(" | " if element.getprevious() is not None else "")
+            elif tag == "img":
+                alt = element.get("alt")
+                if alt:
+                    append(f" {alt} ")
+            if element.text:
+                append(element.text)
+        else:
+            if tag in _BLOCK_TAGS:
+                append(_BREAK)
+            if element.tail:
+                append(element.tail)
+
+    text = _WHITESPACE_PATTERN.sub(" ", "".join(parts))
+    text = _BREAK_RUN_PATTERN.sub("\n", text)
+    return text.strip("\n ")
+
+
+def _list_marker(item: "etree._Element", counters: Dict["etree._Element", int]) -> str:
+    """목록 항목 접두어 ("- " 또는 순서 목록의 "1. ")"""
+    parent = item.getparent()
+    if parent is not None and parent.tag == "ol":
+        if parent not in counters:
+            start = parent.get("start", "1")
+            counters[parent] = int(start) - 1 if start.isdigit() else 0
+        counters[parent] += 1
+        return f"{counters[parent]}. "
+    return "- "
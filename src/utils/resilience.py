@@ -0,0 +1,179 @@
+"""업스트림 요청 재시도 정책과 엔드포인트별 서킷 브레이커
+
+api.onstove.com이 느려지거나 오류를 내기 시작하면 모든 도구 호출이 타임아웃까지
+기다리게 된다. 엔드포인트(호스트 + 숫자를 지운 경로)마다 서킷 브레이커를 두어,
+연속 실패가 failure_threshold번을 넘으면 reset_timeout 동안 요청을 보내지 않고
+즉시 CircuitOpenException을 낸다(호출자는 만료된 캐시로 응답할 수 있다). 그 뒤에는
+요청 하나만 시험 삼아 보내(half-open) 성공하면 다시 닫고, 실패하면 다시 연다.
+
+재시도 간격은 decorrelated jitter(직전 간격의 3배 안에서 무작위)로 정해, 여러 요청이
+동시에 실패해도 같은 시각에 몰려서 다시 보내지 않는다.
+"""
+
+import random
+import re
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from src.config.settings import settings
+from src.models.exceptions import (
+    ApiException,
+    CircuitOpenException,
+    DeadlineExceededException,
+    NetworkException,
+)
+
+# 브레이커 상태
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_DIGITS = re.compile(r"\d+")
+
+
+def endpoint_key(url: str) -> str:
+    """브레이커를 나눌 엔드포인트 키 (호스트 + 숫자를 *로 바꾼 경로)
+
+    게시판 번호/게시글 번호만 다른 URL은 같은 엔드포인트로 본다.
+    """
+    parts = urlsplit(url)
+    return f"{parts.netloc.lower()}{_DIGITS.sub('*', parts.path)}"
+
+
+def is_upstream_failure(error: Exception) -> bool:
+    """업스트림 장애로 볼 오류인지 (재시도/브레이커 실패 집계 대상)
+
+    네트워크 오류, 타임아웃, 5xx/429 응답이 해당한다. 도구 호출 마감 시간 초과와
+    브레이커 차단은 업스트림 상태와 무관하므로 제외한다.
+    """
+    if isinstance(error, (DeadlineExceededException, CircuitOpenException)):
+        return False
+    if isinstance(error, NetworkException):
+        return True
+    if isinstance(error, ApiException):
+        status = (error.response_data or {}).get("status_code")
+        return status is not None and (status >= 500 or status == 429)
+    return False
+
+
+class RetryPolicy:
+    """decorrelated jitter 재시도 정책"""
+
+    def __init__(self, max_retries: int = settings.MAX_RETRIES,
+                 base_delay: float = settings.RETRY_BASE_DELAY,
+                 max_delay: float = settings.RETRY_MAX_DELAY,
+                 rng: Optional[random.Random] = None):
+        """
+        Args:
+            max_retries: 최대 재시도 횟수 (0이면 재시도 안 함)
+            base_delay: 최소 재시도 간격 (초)
+            max_delay: 최대 재시도 간격 (초)
+            rng: 난수 생성기 (테스트용)
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rng = rng or random.Random()
+
+    def delays(self) -> Iterator[float]:
+        """재시도마다 기다릴 간격 (초)"""
+        delay = self.base_delay
+        for _ in range(self.max_retries):
+            delay = min(self.max_delay, self._rng.uniform(self.base_delay, delay * 3))
+            yield delay
+
+
+class CircuitBreaker:
+    """엔드포인트 하나의 서킷 브레이커"""
+
+    def __init__(self, name: str, failure_threshold: int = settings.CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = settings.CIRCUIT_RESET_TIMEOUT,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            name: 엔드포인트 키
+            failure_threshold: 이 횟수만큼 연속 실패하면 차단
+            reset_timeout: 차단 후 시험 요청을 보내기까지의 시간 (초)
+            clock: 시각 함수 (테스트용)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        # half-open 시험 요청 시작 시각 (진행 중이 아니면 None)
+        self._probe_started: Optional[float] = None
+
+    def before_call(self) -> None:
+        """요청 전 확인 (차단 중이면 즉시 예외)
+
+        Raises:
+            CircuitOpenException: 차단 중이거나 다른 시험 요청이 진행 중인 경우
+        """
+        now = self._clock()
+        if self.state == OPEN:
+            if now - self._opened_at < self.reset_timeout:
+                raise CircuitOpenException(self.name, self.reset_timeout - (now - self._opened_at))
+            self.state = HALF_OPEN
+            self._probe_started = None
+
+        if self.state == HALF_OPEN:
+            # 시험 요청은 하나만 (취소되어 결과가 안 오면 reset_timeout 뒤 새로 허용)
+            if self._probe_started is not None and now - self._probe_started < self.reset_timeout:
+                raise CircuitOpenException(self.name, self.reset_timeout)
+            self._probe_started = now
+
+    def record_success(self) -> None:
+        """요청 성공 기록 (차단 해제)"""
+        self.state = CLOSED
+        self.failures = 0
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        """요청 실패 기록 (연속 실패가 기준을 넘거나 시험 요청이 실패하면 차단)"""
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self._opened_at = self._clock()
+            self._probe_started = None
+
+    def retry_after(self) -> float:
+        """차단 해제(시험 요청 허용)까지 남은 시간 (초)"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+
+class BreakerRegistry:
+    """엔드포인트 키 -> 서킷 브레이커"""
+
+    def __init__(self, **options):
+        """
+        Args:
+            **options: CircuitBreaker 생성 옵션
+        """
+        self._options = options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, url: str) -> CircuitBreaker:
+        """URL 엔드포인트의 브레이커 (없으면 생성)"""
+        key = endpoint_key(url)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(key, **self._options)
+        return breaker
+
+    def open_endpoints(self) -> List[str]:
+        """현재 차단 중인 엔드포인트 키"""
+        return [key for key, breaker in self._breakers.items() if breaker.state != CLOSED]
+
+    def reset(self) -> None:
+        """모든 브레이커 삭제"""
+        self._breakers.clear()
+
+
+# 전역 브레이커 레지스트리 (모든 스크래퍼가 공유)
+circuit_breakers = BreakerRegistry()
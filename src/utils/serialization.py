@@ -0,0 +1,179 @@
+"""게시글 목록 일괄 직렬화
+
+목록 응답을 만들 때 GameNews를 하나씩 model_dump()한 뒤 json.dumps로 다시
+인코딩하면 항목마다 파이썬 딕셔너리를 두 번 거친다. 여기의 함수들은 목록
+전체를 한 번의 호출로 JSON으로 만든다.
+
+- news_list_to_json: TypeAdapter(List[GameNews])로 모델 목록을 바로 JSON 바이트로 인코딩
+- news_views_to_json: 응답에 필요한 필드만 골라(출력 키 이름 변경 가능) 한 번에 인코딩
+- records_to_json: 캐시의 ArticleRecord를 GameNews로 되돌리지 않고 바로 인코딩
+
+compact=True면 들여쓰기 없이 출력한다(응답 크기/인코딩 시간 절감).
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from src.models.game_news import GameNews
+from src.storage.records import ArticleRecord
+
+# 들여쓰기 출력 시 칸 수
+INDENT = 2
+
+# 목록 응답 필드 (출력 키 -> GameNews 속성)
+LIST_FIELDS: Mapping[str, str] = {
+    "id": "id",
+    "title": "title",
+    "url": "url",
+    "published_date": "published_at",
+    "summary": "summary",
+    "tags": "tags",
+    "view_count": "view_count",
+}
+
+# 상세 응답 필드
+DETAIL_FIELDS: Mapping[str, str] = {
+    "id": "id",
+    "title": "title",
+    "url": "url",
+    "published_date": "published_at",
+    "summary": "summary",
+    "content": "content",
+    "tags": "tags",
+    "view_count": "view_count",
+    "category": "category",
+}
+
+# to_json은 UTC를 'Z'로 쓰므로 isoformat()으로 미리 변환하는 필드
+_DATETIME_FIELDS = frozenset({"published_at"})
+
+_NEWS_LIST_ADAPTER = TypeAdapter(List[GameNews])
+
+
+def _indent(compact: bool) -> Optional[int]:
+    return None if compact else INDENT
+
+
+def dumps(value: Any, compact: bool = False) -> str:
+    """JSON 문자열로 인코딩 (한글은 이스케이프하지 않음)
+
+    datetime은 ISO 8601, HttpUrl은 문자열, 튜플은 배열로 인코딩한다.
+
+    Args:
+        value: 인코딩할 값
+        compact: True면 들여쓰기 없이 출력
+
+    Returns:
+        str: JSON 문자열
+    """
+    return to_json(value, indent=_indent(compact)).decode()
+
+
+def news_list_to_python(news_list: Sequence[GameNews]) -> List[Dict[str, Any]]:
+    """GameNews 목록을 딕셔너리 목록으로 일괄 직렬화 (model_dump와 같은 결과)
+
+    Args:
+        news_list: 직렬화할 GameNews 목록
+
+    Returns:
+        List[Dict[str, Any]]: 직렬화된 데이터 목록
+    """
+    return _NEWS_LIST_ADAPTER.dump_python(list(news_list), warnings=False)
+
+
+def news_list_to_json(news_list: Sequence[GameNews], compact: bool = False) -> str:
+    """GameNews 목록을 JSON 문자열로 일괄 직렬화 (모든 필드)
+
+    Args:
+        news_list: 직렬화할 GameNews 목록
+        compact: True면 들여쓰기 없이 출력
+
+    Returns:
+        str: JSON 배열 문자열
+    """
+    data = _NEWS_LIST_ADAPTER.dump_json(list(news_list), indent=_indent(compact), warnings=False)
+    return data.decode()
+
+
+def _views(news_list: Iterable[GameNews], fields: Mapping[str, str]) -> List[Dict[str, Any]]:
+    """필드 선택 (발행 일시는 GameNews.model_dump_json과 같은 isoformat 문자열로)"""
+    items = fields.items()
+    views = [{key: values[attr] for key, attr in items} for values in (news.__dict__ for news in news_list)]
+    for key in [key for key, attr in items if attr in _DATETIME_FIELDS]:
+        for view in views:
+            value = view[key]
+            if value is not None:
+                view[key] = value.isoformat()
+    return views
+
+
+def news_view(news: GameNews, fields: Mapping[str, str] = DETAIL_FIELDS) -> Dict[str, Any]:
+    """응답용 필드만 고른 딕셔너리
+
+    Args:
+        news: 대상 GameNews
+        fields: 출력 키 -> GameNews 속성 매핑
+
+    Returns:
+        Dict[str, Any]: 출력 키 순서대로 담은 딕셔너리
+    """
+    return _views([news], fields)[0]
+
+
+def news_views_to_json(
+    news_list: Iterable[GameNews],
+    fields: Mapping[str, str] = LIST_FIELDS,
+    compact: bool = False
+) -> str:
+    """GameNews 목록에서 응답용 필드만 골라 JSON 문자열로 일괄 직렬화
+
+    Args:
+        news_list: 직렬화할 GameNews 목록
+        fields: 출력 키 -> GameNews 속성 매핑 (기본: 목록 응답 필드)
+        compact: True면 들여쓰기 없이 출력
+
+    Returns:
+        str: JSON 배열 문자열
+    """
+    return dumps(_views(news_list, fields), compact)
+
+
+def records_to_json(
+    records: Iterable[ArticleRecord],
+    compact: bool = False,
+    include_content: bool = False
+) -> str:
+    """캐시 레코드 목록을 GameNews 변환 없이 JSON 문자열로 일괄 직렬화
+
+    출력 키는 GameNews 필드 이름과 같다.
+
+    Args:
+        records: 직렬화할 ArticleRecord 목록
+        compact: True면 들여쓰기 없이 출력
+        include_content: True면 본문(content)도 포함
+
+    Returns:
+        str: JSON 배열 문자열
+    """
+    records = list(records)
+    items = [
+        {
+            "id": record.id,
+            "title": record.title,
+            "url": record.url,
+            "published_at": record.published_at().isoformat(),
+            "game": record.game,
+            "category": record.category,
+            "summary": record.summary,
+            "is_important": record.is_important,
+            "tags": record.tags,
+            "view_count": record.view_count,
+        }
+        for record in records
+    ]
+    if include_content:
+        for item, record in zip(items, records):
+            item["content"] = record.content
+    return dumps(items, compact)
@@ -0,0 +1,77 @@
+"""텍스트 정규화
+
+제목/요약/본문 문자열에서 HTML 태그를 걷어내고, HTML 엔티티를 디코딩하고,
+공백을 정리하는 공통 루틴. 패턴은 모듈 로드 시 한 번만 컴파일하고, 마크업이
+없는 입력(대부분의 제목)은 정규식을 거치지 않는다.
+
+엔티티는 각각 정확히 한 번만 디코딩한다(&amp;lt; -> &lt;). 자주 나오는 엔티티는
+str.replace로 바꾸되 &amp;는 마지막에 바꾸고, 그 밖의 엔티티가 남아 있으면
+html.unescape와 같은 규칙의 정규식으로 나머지를 한 번에 디코딩한다.
+"""
+
+import re
+from functools import lru_cache
+from html import unescape
+from typing import Optional
+
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+# html.unescape와 같은 엔티티 규칙
+_ENTITY_PATTERN = re.compile(r"&(?:#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[^\t\n\f <&#;]{1,32};?)")
+
+# 자주 나오는 엔티티 (치환 결과에 '&'가 없으므로 순서대로 바꿔도 중복 디코딩되지 않음)
+_COMMON_ENTITIES = (
+    ("&nbsp;", "\xa0"),
+    ("&lt;", "<"),
+    ("&gt;", ">"),
+    ("&quot;", '"'),
+    ("&#39;", "'"),
+)
+
+_decode_entity = lru_cache(maxsize=512)(unescape)
+
+
+def _replace_entity(match: re.Match) -> str:
+    """엔티티 하나 디코딩"""
+    return _decode_entity(match.group())
+
+
+def _decode_entities(text: str) -> str:
+    """HTML 엔티티 디코딩 (각 엔티티를 한 번만)"""
+    for entity, char in _COMMON_ENTITIES:
+        if entity in text:
+            text = text.replace(entity, char)
+    if "&" not in text:
+        return text
+    if text.count("&") != text.count("&amp;"):
+        # &amp; 외의 엔티티가 남아 있음: &amp;까지 포함해 한 번에 디코딩
+        return _ENTITY_PATTERN.sub(_replace_entity, text)
+    return text.replace("&amp;", "&")
+
+
+def normalize_text(text: Optional[str], keep_newlines: bool = False) -> str:
+    """텍스트 정규화
+
+    HTML 태그 제거, 엔티티 디코딩, 공백 정리를 수행한다. 태그를 먼저 제거하므로
+    엔티티가 디코딩된 결과(&lt;b&gt; -> <b>)는 태그로 다시 해석하지 않는다.
+
+    Args:
+        text: 정규화할 텍스트
+        keep_newlines: True면 줄 구조를 유지 (줄마다 공백 정리, 빈 줄 제거)
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    if not text:
+        return ""
+
+    if "<" in text:
+        text = _TAG_PATTERN.sub("", text)
+    if "&" in text:
+        text = _decode_entities(text)
+
+    if not keep_newlines:
+        return " ".join(text.split())
+
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
@@ -0,0 +1,170 @@
+"""타임스탬프 파싱
+
+게시판마다 날짜 표기가 다르다(OnStove API는 epoch 밀리초, 로스트아크 게시판은
+"2024.05.12", 일부 페이지는 "2024년 5월 12일 오후 3:20"). parse_timestamp()는
+입력 형태를 판별해 알맞은 파서를 고르고, 판별한 형식을 출처(source)별로 기억해
+같은 출처의 다음 값은 바로 그 파서로 처리한다. 반환값은 항상 UTC 기준
+timezone-aware datetime이다.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Union
+
+# 한국 표준시 (게시판 날짜 문자열의 기본 시간대)
+KST = timezone(timedelta(hours=9), "KST")
+
+# 이 값보다 크면 밀리초 단위 epoch로 간주 (초 단위로는 2286년)
+_EPOCH_MS_THRESHOLD = 10 ** 10
+
+_EPOCH_PATTERN = re.compile(r"-?\d+(?:\.\d+)?")
+# 게시판 날짜: 앞쪽의 라벨("등록일" 등)은 허용하되 날짜/시각 뒤에는 요일 표기만 허용
+_DOTTED_PATTERN = re.compile(
+    r"(\d{4})\s*[./-]\s*(\d{1,2})\s*[./-]\s*(\d{1,2})\.?"
+    r"(?:\s*(?:\(\w+\))?\s*(\d{1,2}):(\d{2})(?::(\d{2}))?)?"
+    r"\s*(?:\(\w+\))?$"
+)
+_KOREAN_PATTERN = re.compile(
+    r"(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일"
+    r"(?:\s*(?:\(\w+\))?\s*(오전|오후)?\s*(\d{1,2})\s*(?::|시)\s*(\d{1,2})?\s*분?)?"
+    r"\s*(?:\(\w+\))?$"
+)
+
+# 문자열 형태(숫자 -> '9')를 형식 캐시 키로 사용
+_SHAPE_TABLE = str.maketrans("0123456789", "9999999999")
+
+# 출처(또는 문자열 형태) -> 마지막으로 성공한 형식 이름
+_detected_formats: Dict[str, str] = {}
+
+
+def _from_epoch(value: Union[int, float]) -> datetime:
+    """epoch 초/밀리초"""
+    if abs(value) > _EPOCH_MS_THRESHOLD:
+        value = value / 1000
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+def _parse_epoch(text: str) -> datetime:
+    if not _EPOCH_PATTERN.fullmatch(text):
+        raise ValueError(text)
+    return _from_epoch(float(text) if "." in text else int(text))
+
+
+def _parse_iso(text: str) -> datetime:
+    return datetime.fromisoformat(text.replace("Z", "+00:00"))
+
+
+def _parse_dotted(text: str) -> datetime:
+    match = _DOTTED_PATTERN.search(text)
+    if not match:
+        raise ValueError(text)
+    year, month, day, hour, minute, second = match.groups()
+    return datetime(
+        int(year), int(month), int(day),
+        int(hour or 0), int(minute or 0), int(second or 0)
+    )
+
+
+def _parse_korean(text: str) -> datetime:
+    match = _KOREAN_PATTERN.search(text)
+    if not match:
+        raise ValueError(text)
+    year, month, day, meridiem, hour, minute = match.groups()
+    hour = int(hour or 0)
+    if meridiem == "오후" and hour < 12:
+        hour += 12
+    elif meridiem == "오전" and hour == 12:
+        hour = 0
+    return datetime(int(year), int(month), int(day), hour, int(minute or 0))
+
+
+# 판별 순서 (앞쪽일수록 엄격한 형식)
+_PARSERS: Dict[str, Callable[[str], datetime]] = {
+    "epoch": _parse_epoch,
+    "iso": _parse_iso,
+    "dotted": _parse_dotted,
+    "korean": _parse_korean,
+}
+
+
+def _normalize(dt: datetime, default_tz: tzinfo) -> datetime:
+    """UTC 기준 aware datetime으로 변환 (naive 값은 default_tz 기준으로 해석)"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=default_tz)
+    return dt.astimezone(timezone.utc)
+
+
+def _sniff(text: str, key: str) -> datetime:
+    """형식을 판별하며 파싱하고, 성공한 형식을 key에 기억"""
+    cached = _detected_formats.get(key)
+    if cached is not None:
+        try:
+            return _PARSERS[cached](text)
+        except (ValueError, OverflowError, OSError):
+            pass
+
+    for name, parser in _PARSERS.items():
+        if name == cached:
+            continue
+        try:
+            dt = parser(text)
+        except (ValueError, OverflowError, OSError):
+            continue
+        _detected_formats[key] = name
+        return dt
+
+    raise ValueError(f"지원하지 않는 날짜 형식입니다: {text}")
+
+
+@lru_cache(maxsize=4096)
+def _parse_string(text: str, source: Optional[str], default_tz: tzinfo) -> datetime:
+    """문자열 파싱 (같은 문자열은 결과를 재사용)"""
+    key = source if source is not None else text.translate(_SHAPE_TABLE)
+    return _normalize(_sniff(text, key), default_tz)
+
+
+def parse_timestamp(
+    timestamp: Union[int, float, str, datetime],
+    source: Optional[str] = None,
+    default_tz: tzinfo = timezone.utc
+) -> datetime:
+    """다양한 형식의 타임스탬프를 datetime 객체로 변환
+
+    지원 형식: datetime, UNIX 타임스탬프(초/밀리초, 숫자 문자열 포함), ISO 8601,
+    점/슬래시 구분 날짜("2024.05.12", "2024. 5. 12. 10:30", "2024/05/12"),
+    한국어 날짜("2024년 5월 12일 (일) 오후 3:20").
+
+    Args:
+        timestamp: 변환할 값
+        source: 값의 출처 (예: "lost_ark.list"). 출처별로 판별한 형식을 기억해
+            다음 호출에서 먼저 시도한다. 없으면 문자열 형태별로 기억한다.
+        default_tz: timezone 정보가 없는 값을 해석할 시간대 (기본: UTC)
+
+    Returns:
+        datetime: UTC 기준 timezone-aware datetime 객체
+
+    Raises:
+        ValueError: 변환할 수 없는 형식인 경우
+    """
+    if isinstance(timestamp, datetime):
+        return _normalize(timestamp, default_tz)
+
+    if isinstance(timestamp, str):
+        text = timestamp.strip()
+        if not text:
+            raise ValueError("빈 날짜 문자열입니다")
+        return _parse_string(text, source, default_tz)
+
+    if isinstance(timestamp, (int, float)) and not isinstance(timestamp, bool):
+        try:
+            return _from_epoch(timestamp)
+        except (OverflowError, OSError) as e:
+            raise ValueError(f"범위를 벗어난 타임스탬프입니다: {timestamp}") from e
+
+    raise ValueError(f"지원하지 않는 타임스탬프 형식입니다: {type(timestamp)}")
+
+
+def detected_formats() -> Dict[str, str]:
+    """출처/형태별로 기억된 형식 (진단용)"""
+    return dict(_detected_formats)
@@ -1,12 +1,13 @@
 """데이터 검증 및 직렬화 관련 함수들"""
 
-import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pydantic import ValidationError
 
 from src.models.game_news import GameNews, GameType, NewsType
 from src.models.exceptions import ValidationException
+from src.utils.text import normalize_text
+from src.utils.serialization import news_list_to_json, news_list_to_python
 
 def validate_game_news(data: Dict[str, Any]) -> bool:
     """GameNews 데이터 유효성 검증
@@ -71,7 +72,7 @@ def serialize_game_news_list(news_list: List[GameNews]) -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: 직렬화된 데이터 리스트
     """
-    return [serialize_game_news(news) for news in news_list]
+    return news_list_to_python(news_list)
 
 def game_news_to_json(news: GameNews) -> str:
     """GameNews 객체를 JSON 문자열로 변환
@@ -84,17 +85,17 @@ def game_news_to_json(news: GameNews) -> str:
     """
     return news.json()
 
-def game_news_list_to_json(news_list: List[GameNews]) -> str:
+def game_news_list_to_json(news_list: List[GameNews], compact: bool = False) -> str:
     """GameNews 리스트를 JSON 문자열로 변환
     
     Args:
         news_list: 변환할 GameNews 리스트
+        compact: True면 들여쓰기 없이 출력
         
     Returns:
         str: JSON 문자열
     """
-    serialized = serialize_game_news_list(news_list)
-    return json.dumps(serialized, ensure_ascii=False, indent=2)
+    return news_list_to_json(news_list, compact=compact)
 
 def validate_game_type(game: str) -> bool:
     """게임 타입 유효성 검증
@@ -139,7 +140,7 @@ def validate_required_fields(data: Dict[str, Any], required_fields: List[str]) -
     return all(field in data and data[field] is not None for field in required_fields)
 
 def sanitize_html(text: str) -> str:
-    """HTML 태그 및 특수 문자 제거
+    """HTML 태그 및 특수 문자 제거 (normalize_text와 동일)
     
     Args:
         text: 정제할 텍스트
@@ -147,31 +148,7 @@ def sanitize_html(text: str) -> str:
     Returns:
         str: 정제된 텍스트
     """
-    import re
-    
-    if not text:
-        return ""
-    
-    # HTML 태그 제거
-    text = re.sub(r'<[^>]+>', '', text)
-    
-    # 특수 HTML 엔티티 변환
-    html_entities = {
-        '&amp;': '&',
-        '&lt;': '<',
-        '&gt;': '>',
-        '&quot;': '"',
-        '&#39;': "'",
-        '&nbsp;': ' ',
-    }
-    
-    for entity, char in html_entities.items():
-        text = text.replace(entity, char)
-    
-    # 연속된 공백 제거
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
+    return normalize_text(text)
 
 def validate_datetime_range(dt: datetime, min_date: Optional[datetime] = None, max_date: Optional[datetime] = None) -> bool:
     """날짜 범위 유효성 검증
@@ -205,15 +182,15 @@ def normalize_game_news_data(data: Dict[str, Any]) -> Dict[str, Any]:
     
     # 제목 정제
     if 'title' in normalized:
-        normalized['title'] = sanitize_html(str(normalized['title']))
+        normalized['title'] = normalize_text(str(normalized['title']))
     
     # 내용 정제
     if 'content' in normalized and normalized['content']:
-        normalized['content'] = sanitize_html(str(normalized['content']))
+        normalized['content'] = normalize_text(str(normalized['content']), keep_newlines=True)
     
     # 요약 정제
     if 'summary' in normalized and normalized['summary']:
-        normalized['summary'] = sanitize_html(str(normalized['summary']))
+        normalized['summary'] = normalize_text(str(normalized['summary']))
     
     # 태그 정규화
     if 'tags' in normalized and normalized['tags']:
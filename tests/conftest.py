@@ -5,6 +5,15 @@ from unittest.mock import AsyncMock
 from src.scrapers.lordnine import LordnineScraper
 from src.scrapers.epic_seven import EpicSevenScraper
 from src.scrapers.lost_ark import LostArkScraper
+from src.utils.resilience import circuit_breakers
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """테스트 간 서킷 브레이커 상태가 이어지지 않도록 초기화"""
+    circuit_breakers.reset()
+    yield
+    circuit_breakers.reset()
 
 
 @pytest.fixture
@@ -0,0 +1,155 @@
+"""본문 아카이브 테스트"""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+from src.storage.archive import ContentArchive
+from src.storage.records import ArticleRecord
+
+PATCH_NOTE = "\n".join(f"{i}. 스킬 [천둥의 일격] 재사용 대기시간이 2초 감소합니다." for i in range(200))
+
+
+def record(article_id: str, content: str = PATCH_NOTE, published_ts: int = 1715731200) -> ArticleRecord:
+    return ArticleRecord(
+        id=article_id,
+        title=f"패치 노트 {article_id}",
+        url=f"https://page.onstove.com/l9/global/view/{article_id}",
+        published_ts=published_ts,
+        game="lordnine",
+        category="update",
+        tags=("업데이트",),
+        content=content,
+    )
+
+
+class TestContentArchive:
+    """세그먼트 저장/조회"""
+
+    def test_round_trip_and_compression(self, tmp_path):
+        archive = ContentArchive(str(tmp_path))
+        original = record("1")
+
+        assert archive.put(original)
+        restored = archive.get(original.url)
+
+        assert restored.as_tuple() == original.as_tuple()
+        assert archive.size_bytes() < len(PATCH_NOTE.encode("utf-8")) / 5
+        assert archive.get("https://example.com/missing") is None
+        archive.close()
+
+    def test_unchanged_content_not_rewritten(self, tmp_path):
+        archive = ContentArchive(str(tmp_path))
+        archive.put(record("1"))
+        size = archive.size_bytes()
+
+        assert not archive.put(record("1"))
+        assert archive.size_bytes() == size
+
+        assert archive.put(record("1", content="수정된 본문"))
+        assert archive.get(record("1").url).content == "수정된 본문"
+        assert len(archive) == 1
+        archive.close()
+
+    def test_reopen_rebuilds_index(self, tmp_path):
+        archive = ContentArchive(str(tmp_path))
+        for i in range(5):
+            archive.put(record(str(i), content=f"본문 {i}"))
+        archive.put(record("2", content="본문 2 (수정)"))
+        archive.close()
+
+        reopened = ContentArchive(str(tmp_path))
+        assert len(reopened) == 5
+        assert reopened.get(record("2").url).content == "본문 2 (수정)"
+        reopened.close()
+
+    def test_truncated_tail_is_dropped(self, tmp_path):
+        archive = ContentArchive(str(tmp_path))
+        archive.put(record("1", content="첫 글"))
+        archive.put(record("2", content="둘째 글"))
+        archive.close()
+
+        path = os.path.join(str(tmp_path), "segment-00001.dat")
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 3)
+
+        reopened = ContentArchive(str(tmp_path))
+        assert record("1").url in reopened
+        assert record("2").url not in reopened
+
+        # 잘린 자리 뒤에 이어서 정상적으로 기록
+        reopened.put(record("3", content="셋째 글"))
+        reopened.close()
+        assert ContentArchive(str(tmp_path)).get(record("3").url).content == "셋째 글"
+
+    def test_segment_rollover(self, tmp_path):
+        archive = ContentArchive(str(tmp_path), segment_bytes=2048)
+        for i in range(20):
+            archive.put(record(str(i), content=f"{i} " + os.urandom(200).hex()))
+
+        assert len([name for name in os.listdir(str(tmp_path)) if name.endswith(".dat")]) > 1
+        assert all(archive.get(record(str(i)).url).id == str(i) for i in range(20))
+        archive.close()
+
+
+class DetailScraper:
+    """상세 조회 횟수를 기록하는 테스트용 스크래퍼"""
+
+    def __init__(self, timeout: int = 30):
+        self.timeout = timeout
+        self.detail_calls = 0
+        self.age_days = 30
+
+    async def get_update_detail(self, url):
+        self.detail_calls += 1
+        return GameNews(
+            id=url.rsplit("/", 1)[-1],
+            title="패치 노트",
+            url=url,
+            published_at=datetime.now() - timedelta(days=self.age_days),
+            game=GameType.LORDNINE,
+            category=NewsType.UPDATE,
+            content=PATCH_NOTE,
+        )
+
+
+class TestServiceArchive:
+    """NewsService 아카이브 조회"""
+
+    @pytest.mark.asyncio
+    async def test_old_article_served_from_archive(self, tmp_path):
+        registry = ScraperRegistry()
+        registry.register("lordnine", "tests.test_archive", "DetailScraper", "테스트")
+        url = "https://page.onstove.com/l9/global/view/77"
+
+        first = NewsService(registry, enable_cache=False, enable_search=False, archive_dir=str(tmp_path))
+        await first.get_news_detail("lordnine", NewsType.UPDATE, url)
+        first.close()
+
+        # 새 프로세스(빈 캐시)에서도 네트워크 없이 응답
+        second = NewsService(registry, enable_cache=False, enable_search=False, archive_dir=str(tmp_path))
+        detail = await second.get_news_detail("lordnine", NewsType.UPDATE, url)
+
+        assert detail.content == PATCH_NOTE
+        assert registry.get("lordnine").detail_calls == 1
+        assert second.status()["archived_articles"] == 1
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_recent_article_is_refetched(self, tmp_path):
+        registry = ScraperRegistry()
+        registry.register("lordnine", "tests.test_archive", "DetailScraper", "테스트")
+        registry.get("lordnine").age_days = 1
+        service = NewsService(registry, enable_cache=False, enable_search=False, archive_dir=str(tmp_path))
+        url = "https://page.onstove.com/l9/global/view/78"
+
+        await service.get_news_detail("lordnine", NewsType.UPDATE, url)
+        await service.get_news_detail("lordnine", NewsType.UPDATE, url)
+
+        assert registry.get("lordnine").detail_calls == 2
+        service.close()
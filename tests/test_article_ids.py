@@ -0,0 +1,58 @@
+"""안정적인 게시글 ID 테스트"""
+
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+from src.scrapers.lost_ark import LostArkScraper
+from src.utils.helpers import canonical_url, generate_news_id, stable_article_id
+
+URL = "https://lostark.game.onstove.com/News/Notice/Views?noticetype=all&page=2#comments"
+
+
+class TestStableArticleId:
+    """URL 기반 ID 테스트"""
+
+    def test_canonical_url(self):
+        assert canonical_url("HTTPS://LostArk.game.onstove.com/News/?utm_source=x&b=2&a=1#top") == (
+            "https://lostark.game.onstove.com/News?a=1&b=2"
+        )
+
+    def test_equivalent_urls_share_id(self):
+        variant = "https://LOSTARK.game.onstove.com/News/Notice/Views/?page=2&noticetype=all&utm_medium=share"
+
+        assert stable_article_id(URL) == stable_article_id(variant)
+        assert stable_article_id(URL) != stable_article_id(URL.replace("page=2", "page=3"))
+
+    def test_id_is_stable_across_processes(self):
+        """해시 랜덤화 시드가 달라도 같은 ID"""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = f"from src.utils.helpers import stable_article_id; print(stable_article_id({URL!r}))"
+        ids = set()
+        for seed in ("1", "2"):
+            result = subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=root,
+                env={**os.environ, "PYTHONHASHSEED": seed, "PYTHONPATH": root},
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            ids.add(result.stdout.strip())
+
+        assert ids == {stable_article_id(URL)}
+        assert len(stable_article_id(URL)) == 17
+
+    def test_generate_news_id(self):
+        published_at = datetime(2024, 5, 12)
+
+        assert generate_news_id("제목", "https://page.onstove.com/l9/global/view/123", published_at) == "123"
+        assert generate_news_id("제목", URL, published_at) == stable_article_id(URL)
+        assert generate_news_id("다른 제목", URL, published_at) == stable_article_id(URL)
+
+    def test_scraper_prefers_native_id(self):
+        scraper = LostArkScraper()
+
+        assert scraper.make_article_id("https://lostark.game.onstove.com/News/Notice/Views/1234", "1234") == "1234"
+        assert scraper.make_article_id(URL, scraper._extract_id_from_url(URL)) == stable_article_id(URL)
@@ -0,0 +1,66 @@
+"""TTL 캐시 테스트"""
+
+import time
+
+import pytest
+
+from src.config.settings import settings
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+from src.storage.cache import TTLCache
+
+
+class TestTTLCache:
+    """만료 / 용량 제한"""
+
+    def test_expired_entry_served_only_as_stale(self):
+        cache = TTLCache(60, max_stale=3600)
+        cache.set("recent", 1, stored_at=time.time() - 120)
+        cache.set("old", 2, stored_at=time.time() - 7200)
+
+        assert cache.get("recent") is None
+        assert cache.get_stale("recent") == 1
+        # 보관 기한이 지난 항목은 조회할 때 삭제
+        assert cache.get_stale("old") is None
+        assert [key for key, _, _ in cache.entries()] == ["recent"]
+
+    def test_lru_eviction(self):
+        cache = TTLCache(60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert cache.get_stale("b") is None
+        assert len(cache) == 2
+
+    def test_full_cache_drops_stale_entries_first(self):
+        cache = TTLCache(60, max_entries=3, max_stale=3600)
+        cache.set("old", 0, stored_at=time.time() - 7200)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert [key for key, _, _ in cache.entries()] == ["a", "b", "c"]
+
+    def test_purge(self):
+        cache = TTLCache(60, max_stale=3600)
+        cache.set("old", 0, stored_at=1000.0)
+        cache.set("new", 1)
+
+        assert cache.purge() == 1
+        assert len(cache) == 1
+        assert TTLCache(60).purge() == 0
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError):
+            TTLCache(60, max_entries=0)
+
+
+def test_service_caches_are_bounded():
+    service = NewsService(ScraperRegistry())
+
+    for cache in (service.list_cache, service.detail_cache):
+        assert cache.max_entries == settings.CACHE_MAX_ENTRIES
+        assert cache.max_stale == settings.CACHE_MAX_STALE
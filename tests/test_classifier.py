@@ -0,0 +1,79 @@
+"""제목 키워드 분류기 테스트"""
+
+from src.scrapers.lost_ark import KEYWORD_TAGS, TITLE_CLASSIFIER as LOST_ARK_CLASSIFIER
+from src.utils.classifier import KeywordClassifier, IMPORTANT, MAINTENANCE
+from src.utils.helpers import extract_tags_from_title, is_important_news
+
+TITLES = [
+    "[공지] 5월 15일(수) 정기점검 안내",
+    "[이벤트] 신규 영웅 출시 기념 이벤트",
+    "Maintenance Notice [Server]",
+    "긴급점검 완료 및 보상 안내",
+    "[업데이트] 3.2 패치 노트",
+    "커뮤니티 가이드라인",
+    "",
+    "이벤트 종료 [마감] 안내",
+]
+
+
+class TestKeywordClassifier:
+    """KeywordClassifier 테스트"""
+
+    def test_matches_substring_scan(self):
+        """키워드별 `in` 검사와 같은 결과를 내는지 확인"""
+        important = ['긴급', '중요', '공지', '안내', '점검', '이벤트']
+        maintenance = ['점검', 'maintenance', '정기점검', '긴급점검']
+        classifier = KeywordClassifier(flags={IMPORTANT: important, MAINTENANCE: maintenance})
+
+        for title in TITLES:
+            result = classifier.classify(title)
+            lower = title.lower()
+            assert result.is_important == any(keyword in lower for keyword in important)
+            assert result.is_maintenance == any(keyword in lower for keyword in maintenance)
+
+    def test_tags_include_brackets_and_keywords(self):
+        tags = LOST_ARK_CLASSIFIER.classify("[점검] 서버점검 안내 [긴급]").tags
+
+        assert tags == ["점검", "긴급", "maintenance"]
+
+    def test_partially_overlapping_keywords(self):
+        """앞 키워드에 가려지는 키워드도 찾는지 확인"""
+        classifier = KeywordClassifier(tags={"ab": ["ab"], "bcd": ["bcd"], "x": ["x"]})
+
+        assert classifier.classify("zabcdz").tags == ["ab", "bcd"]
+        assert classifier.classify("ABCD").tags == ["ab", "bcd"]
+
+    def test_lost_ark_tags_match_keyword_mapping(self):
+        for title in TITLES:
+            expected = set()
+            for keyword, tag_list in KEYWORD_TAGS.items():
+                if keyword in title.lower():
+                    expected.update(tag_list)
+            brackets = {tag for tag in LOST_ARK_CLASSIFIER.classify(title).tags if f"[{tag}]" in title}
+
+            assert set(LOST_ARK_CLASSIFIER.classify(title).tags) == expected | brackets
+
+    def test_classify_many_matches_classify(self):
+        assert LOST_ARK_CLASSIFIER.classify_many(TITLES) == [
+            LOST_ARK_CLASSIFIER.classify(title) for title in TITLES
+        ]
+
+    def test_empty_classifier(self):
+        result = KeywordClassifier().classify("[공지] 안내")
+        assert result.tags == []
+        assert not result.flags
+
+
+class TestHelperClassification:
+    """helpers 함수 위임 테스트"""
+
+    def test_is_important_news(self):
+        assert is_important_news("📌 안내문")
+        assert is_important_news("버그 수정 안내")
+        assert not is_important_news("커뮤니티 가이드라인")
+        assert is_important_news("Big News", keywords=["big"])
+
+    def test_extract_tags_from_title(self):
+        tags = extract_tags_from_title("[Notice] Patch notes and bug fix")
+
+        assert set(tags) == {"Notice", "공지", "업데이트", "버그"}
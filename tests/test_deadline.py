@@ -0,0 +1,85 @@
+"""도구 호출 마감 시간 테스트"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.models.exceptions import DeadlineExceededException
+from src.scrapers.epic_seven import EpicSevenScraper
+from src.utils.deadline import bounded_timeout, check_deadline, deadline_scope, remaining_time
+
+
+class TestDeadlineScope:
+    """deadline_scope 테스트"""
+
+    def test_no_deadline(self):
+        assert remaining_time() is None
+        assert bounded_timeout(30) == 30
+        check_deadline()
+
+    def test_nested_scope_keeps_earlier_deadline(self):
+        with deadline_scope(1):
+            with deadline_scope(60):
+                assert remaining_time() <= 1
+            assert bounded_timeout(30) <= 1
+        assert remaining_time() is None
+
+    def test_expired_deadline_raises(self):
+        with deadline_scope(0):
+            with pytest.raises(DeadlineExceededException):
+                check_deadline("테스트")
+
+
+class TestScraperDeadline:
+    """스크래퍼 마감 시간 전파 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_request_is_cancelled(self):
+        scraper = EpicSevenScraper()
+        cancelled = asyncio.Event()
+
+        async def slow_request(*args, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        scraper.session = MagicMock()
+        scraper.session.request = slow_request
+
+        with deadline_scope(0.05):
+            with pytest.raises(DeadlineExceededException):
+                await scraper.make_request("https://api.onstove.com/cwms/v3.0/article")
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_detail_does_not_fall_back_after_deadline(self):
+        scraper = EpicSevenScraper()
+
+        with patch.object(scraper, 'make_request', side_effect=DeadlineExceededException("마감")), \
+                patch.object(scraper, '_get_detail_from_list', new=AsyncMock()) as fallback:
+            with pytest.raises(DeadlineExceededException):
+                await scraper.get_announcement_detail("https://page.onstove.com/epicseven/global/view/12345")
+
+        fallback.assert_not_called()
+
+
+class TestServerDeadline:
+    """도구 호출 마감 시간 응답 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("tool, arguments, method", [
+        ("get_game_announcements", {"game": "epic_seven"}, "get_news_list"),
+        ("get_event_detail", {"game": "epic_seven", "url": "https://page.onstove.com/epicseven/global/view/1"},
+         "get_news_detail"),
+    ])
+    async def test_handler_does_not_swallow_deadline(self, tool, arguments, method):
+        from src import server
+
+        with patch.object(server.news_service, method, new=AsyncMock(side_effect=DeadlineExceededException("마감"))):
+            (result,) = await server.call_tool(tool, arguments)
+
+        assert result.text.startswith("⏱️")
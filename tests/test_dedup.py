@@ -0,0 +1,113 @@
+"""중복 게시글 탐지 테스트"""
+
+from datetime import datetime
+
+import pytest
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+from src.storage.dedup import DuplicateIndex, _features, simhash
+from src.storage.records import ArticleRecord
+
+BODY = "\n".join(
+    f"{i}. {skill} 스킬의 재사용 대기시간이 {i}초 감소합니다."
+    for i, skill in enumerate(["천둥의 일격", "바람 가르기", "대지 분쇄", "화염 폭풍", "얼음 창"] * 4)
+)
+
+
+def record(article_id: str, title: str, category: str = "announcement", content: str = None,
+           summary: str = None, published_ts: int = 1715731200, game: str = "epic_seven") -> ArticleRecord:
+    return ArticleRecord(
+        id=article_id,
+        title=title,
+        url=f"https://page.onstove.com/epicseven/global/view/{article_id}",
+        published_ts=published_ts,
+        game=game,
+        category=category,
+        summary=summary,
+        content=content,
+    )
+
+
+def distance(a: ArticleRecord, b: ArticleRecord) -> int:
+    return (simhash(_features(a)) ^ simhash(_features(b))).bit_count()
+
+
+class TestSimHash:
+    """지문 거리"""
+
+    def test_near_identical_bodies_are_close(self):
+        a = record("1", "5월 15일 업데이트 안내", content=BODY)
+        b = record("2", "5월 15일 업데이트 안내", content=BODY.replace("감소", "증가", 1))
+
+        assert distance(a, b) <= 3
+
+    def test_recurring_notices_are_far(self):
+        a = record("1", "[점검] 5월 15일 정기 점검 안내", summary="점검 시간 동안 게임 접속이 불가합니다")
+        b = record("2", "[점검] 5월 22일 정기 점검 안내", summary="점검 시간 동안 게임 접속이 불가합니다")
+        c = record("3", "[이벤트] 출석 체크 이벤트", summary="매일 접속하고 보상을 받으세요")
+
+        assert distance(a, b) > 3
+        assert distance(a, c) > 10
+
+    def test_empty(self):
+        assert simhash({}) == 0
+
+
+class TestDuplicateIndex:
+    """중복 묶음"""
+
+    def test_cross_board_copy_collapses(self):
+        index = DuplicateIndex()
+        first = record("1", "5월 15일 업데이트 안내", content=BODY)
+        copy = record("2", "5월 15일 업데이트 안내", category="update",
+                      content=BODY.replace("감소", "증가", 1), published_ts=1715731500)
+
+        assert index.add(first) == "epic_seven:1"
+        assert index.add(copy) == "epic_seven:1"
+        assert index.categories("epic_seven:2") == ["announcement", "update"]
+        assert index.collapse([copy, first]) == [copy]
+        assert index.group_count() == 1
+
+    def test_same_article_on_two_boards(self):
+        index = DuplicateIndex()
+        index.add(record("7", "업데이트 안내", summary="요약"))
+        index.add(record("7", "업데이트 안내", category="update", summary="요약"))
+
+        assert index.categories("epic_seven:7") == ["announcement", "update"]
+        assert len(index) == 1
+
+    def test_time_gap_and_game_separate_groups(self):
+        index = DuplicateIndex(max_time_gap=3600)
+        index.add(record("1", "업데이트 안내", content=BODY))
+        index.add(record("2", "업데이트 안내", content=BODY, published_ts=1715731200 + 7 * 86400))
+        index.add(record("3", "업데이트 안내", content=BODY, game="lordnine"))
+
+        assert index.canonical("epic_seven:2") == "epic_seven:2"
+        assert index.canonical("lordnine:3") == "lordnine:3"
+        assert index.group_count() == 0
+
+    def test_invalid_distance(self):
+        with pytest.raises(ValueError):
+            DuplicateIndex(max_distance=4)
+
+
+class TestServiceDuplicates:
+    """NewsService 응답에서의 중복 처리"""
+
+    def test_other_categories_and_tag_query_collapse(self):
+        service = NewsService(ScraperRegistry(), enable_search=False)
+        first = record("1", "5월 15일 업데이트 안내", content=BODY)
+        first.tags = ("업데이트",)
+        copy = record("2", "5월 15일 업데이트 안내", category="update", content=BODY)
+        copy.tags = ("업데이트",)
+        service._ingest((first, copy))
+
+        news = GameNews(
+            id="2", title="5월 15일 업데이트 안내", url=copy.url, published_at=datetime(2024, 5, 15),
+            game=GameType.EPIC_SEVEN, category=NewsType.UPDATE,
+        )
+        assert service.other_categories(news) == ["announcement"]
+        assert len(service.find_by_tags(["업데이트"])) == 1
+        assert service.status()["duplicate_groups"] == 1
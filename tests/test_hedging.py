@@ -0,0 +1,184 @@
+"""헤지 요청 테스트"""
+
+import asyncio
+import gc
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.scrapers.epic_seven import EpicSevenScraper
+from src.utils.hedging import HedgeBudget, Hedger, LatencyTracker
+from src.utils.resilience import RetryPolicy
+
+
+def warmed_hedger(p90: float = 0.02, budget_ratio: float = 1.0) -> Hedger:
+    hedger = Hedger(percentile=0.9, budget_ratio=budget_ratio, min_samples=10)
+    for _ in range(10):
+        hedger.tracker("detail").record(p90)
+    return hedger
+
+
+class SlowThenFast:
+    """첫 호출만 느린 요청"""
+
+    def __init__(self, slow: float = 1.0, fail_first: bool = False):
+        self.calls = 0
+        self.cancelled = 0
+        self.slow = slow
+        self.fail_first = fail_first
+
+    async def __call__(self):
+        self.calls += 1
+        number = self.calls
+        try:
+            if number == 1:
+                await asyncio.sleep(self.slow)
+                if self.fail_first:
+                    raise RuntimeError("첫 요청 실패")
+                return "first"
+            await asyncio.sleep(0.001)
+            return "hedge"
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+class TestLatencyTracker:
+    def test_percentile(self):
+        tracker = LatencyTracker(size=100)
+        for ms in range(1, 101):
+            tracker.record(ms / 1000)
+
+        assert tracker.percentile(0.9) == pytest.approx(0.091)
+        assert LatencyTracker().percentile(0.9) is None
+
+
+class TestHedgeBudget:
+    def test_ratio_caps_hedges(self):
+        budget = HedgeBudget(ratio=0.1)
+        spent = 0
+        for _ in range(100):
+            budget.deposit()
+            spent += budget.try_spend()
+
+        assert spent == 10
+
+
+class TestHedger:
+    @pytest.mark.asyncio
+    async def test_no_hedge_until_warm(self):
+        hedger = Hedger(min_samples=10)
+        attempt = SlowThenFast(slow=0.03)
+
+        assert await hedger.run("detail", attempt) == "first"
+        assert attempt.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_first_is_hedged_and_cancelled(self):
+        hedger = warmed_hedger()
+        hedger.budget.tokens = 1.0
+        attempt = SlowThenFast()
+
+        assert await hedger.run("detail", attempt) == "hedge"
+        await asyncio.sleep(0)
+        assert attempt.calls == 2
+        assert attempt.cancelled == 1
+        assert (hedger.hedges, hedger.hedge_wins) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_fast_first_is_not_hedged(self):
+        hedger = warmed_hedger(p90=0.5)
+        attempt = SlowThenFast(slow=0.001)
+
+        assert await hedger.run("detail", attempt) == "first"
+        assert attempt.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_budget_waits_for_first(self):
+        hedger = warmed_hedger(budget_ratio=0.0)
+        attempt = SlowThenFast(slow=0.05)
+
+        assert await hedger.run("detail", attempt) == "first"
+        assert attempt.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_first_uses_hedge(self):
+        hedger = warmed_hedger()
+        hedger.budget.tokens = 1.0
+        attempt = SlowThenFast(slow=0.05, fail_first=True)
+
+        assert await hedger.run("detail", attempt) == "hedge"
+
+    @pytest.mark.asyncio
+    async def test_failed_loser_exception_is_retrieved(self):
+        hedger = warmed_hedger()
+        hedger.budget.tokens = 1.0
+        release = asyncio.Event()
+        calls = []
+
+        async def attempt():
+            calls.append(None)
+            number = len(calls)
+            await release.wait()
+            if number == 1:
+                raise RuntimeError("첫 요청 실패")
+            return "hedge"
+
+        errors = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, context: errors.append(context))
+        try:
+            run = asyncio.ensure_future(hedger.run("detail", attempt))
+            await asyncio.sleep(0.05)
+            # 두 요청이 같은 시점에 끝나도록 함께 깨움
+            release.set()
+            assert await run == "hedge"
+            del run
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert len(calls) == 2
+        assert errors == []
+
+
+@pytest.mark.asyncio
+async def test_send_records_attempt_latency_without_retry_backoff():
+    scraper = EpicSevenScraper()
+    scraper.retry_policy = RetryPolicy(max_retries=1, base_delay=0.2, max_delay=0.2)
+    url = "https://api.onstove.com/cwms/v3.0/article"
+    failed = httpx.Response(503, request=httpx.Request("GET", url))
+    ok = httpx.Response(200, request=httpx.Request("GET", url))
+    scraper.session = MagicMock()
+    scraper.session.request = AsyncMock(side_effect=[failed, ok])
+    tracker = LatencyTracker()
+
+    with patch("src.scrapers.base.hedger.tracker", return_value=tracker) as get_tracker:
+        assert await scraper.make_request(url) is ok
+
+    # 실패한 요청은 기록하지 않고, 성공한 요청 1회의 시간만 기록 (재시도 대기 0.2초 제외)
+    get_tracker.assert_called_once_with("api.onstove.com/cwms/v*.*/article")
+    assert len(tracker) == 1
+    assert tracker.percentile(0.9) < 0.1
+
+
+@pytest.mark.asyncio
+async def test_scraper_detail_uses_hedging_when_enabled():
+    scraper = EpicSevenScraper()
+    response = MagicMock()
+    response.json.return_value = {"value": {
+        "article_id": 1, "title": "[공지] 점검", "create_datetime": 1715731200000, "content": "<p>본문</p>",
+    }}
+
+    with patch("src.scrapers.base.settings.ENABLE_HEDGING", True), \
+            patch("src.scrapers.base.hedger.run") as run, \
+            patch.object(scraper, "make_request", return_value=response) as make_request:
+        async def direct(key, attempt):
+            return await attempt()
+        run.side_effect = direct
+        detail = await scraper.get_announcement_detail("https://page.onstove.com/epicseven/global/view/1")
+
+    assert run.call_args[0][0] == "api.onstove.com/cwms/v*.*/article"
+    assert make_request.call_count == 1
+    assert detail.content == "본문"
@@ -0,0 +1,60 @@
+"""HTML 본문 텍스트 변환 테스트"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.scrapers.lordnine import LordnineScraper
+from src.utils.html_text import html_to_text
+
+
+class TestHtmlToText:
+    """html_to_text 테스트"""
+
+    def test_paragraphs_and_lists(self):
+        html = (
+            "<div><p>안녕하세요,&nbsp;<b>로드나인</b>입니다.</p>"
+            "<p>점검   일정<br>5월 15일</p>"
+            "<ul><li>항목 A</li><li>항목 <i>B</i></li></ul>"
+            "<ol start=\"3\"><li>하나</li><li>둘</li></ol></div>"
+        )
+
+        assert html_to_text(html) == (
+            "안녕하세요, 로드나인입니다.\n점검 일정\n5월 15일\n- 항목 A\n- 항목 B\n3. 하나\n4. 둘"
+        )
+
+    def test_strips_scripts_styles_and_comments(self):
+        html = "<p>본문</p><script>alert(1)</script><style>p{}</style><!-- 주석 --><p>끝 &amp; 마무리</p>"
+
+        assert html_to_text(html) == "본문\n끝 & 마무리"
+
+    def test_table_rows(self):
+        html = "<table><tr><th>구분</th><td>내용</td></tr><tr><td>1</td><td>2</td></tr></table>"
+
+        assert html_to_text(html) == "구분 | 내용\n1 | 2"
+
+    def test_plain_text_is_idempotent(self):
+        text = html_to_text("<p>a  b</p><ul><li>x</li></ul>")
+
+        assert html_to_text(text) == text == "a b\n- x"
+        assert html_to_text("  a &lt;b&gt; \n\n c ") == "a <b>\nc"
+        assert html_to_text("") == ""
+        assert html_to_text(None) == ""
+
+    @pytest.mark.asyncio
+    async def test_detail_content_keeps_structure(self):
+        scraper = LordnineScraper()
+        response = MagicMock()
+        response.json.return_value = {
+            "value": {
+                "article_id": 123,
+                "title": "패치 노트",
+                "create_datetime": 1715731200000,
+                "content": "<p>변경 사항</p><ul><li>버그 수정</li><li>밸런스 조정</li></ul>",
+            }
+        }
+
+        with patch.object(scraper, "make_request", return_value=response):
+            news = await scraper.get_announcement_detail("https://page.onstove.com/l9/global/view/123")
+
+        assert news.content == "변경 사항\n- 버그 수정\n- 밸런스 조정"
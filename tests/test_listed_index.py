@@ -0,0 +1,141 @@
+"""목록 게시글 ID 색인 기반 상세 조회 fallback 테스트"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.models.exceptions import ApiException
+from src.models.game_news import NewsType
+from src.scrapers.epic_seven import EpicSevenScraper
+from src.scrapers.lordnine import LordnineScraper
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+
+LIST_RESPONSE = {"value": {"list": [
+    {"article_id": 101, "title": "[공지] 5월 15일 업데이트 안내", "create_datetime": 1715731200000,
+     "summary": "업데이트 요약"},
+    {"article_id": 100, "title": "[공지] 정기 점검 안내", "create_datetime": 1715644800000,
+     "summary": "점검 요약"},
+]}}
+
+
+CONTENT_RESPONSE = {"value": {"list": [
+    {**LIST_RESPONSE["value"]["list"][0], "content": "<p>업데이트 <b>본문</b></p>"},
+    {**LIST_RESPONSE["value"]["list"][1], "content": ""},
+]}}
+
+
+class FakeApi:
+    """목록은 응답하고 상세 API는 실패하는 가짜 make_request"""
+
+    def __init__(self, list_response=LIST_RESPONSE):
+        self.list_response = list_response
+        self.list_calls = 0
+        self.detail_calls = 0
+        self.list_params = []
+
+    async def __call__(self, url, params=None, **kwargs):
+        if url.endswith("/article/list"):
+            self.list_calls += 1
+            self.list_params.append(params)
+            response = MagicMock()
+            response.json.return_value = self.list_response
+            return response
+        self.detail_calls += 1
+        raise ApiException("HTTP 오류 503", url, {"status_code": 503})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scraper_class, view_url", [
+    (LordnineScraper, "https://page.onstove.com/l9/global/view/101"),
+    (EpicSevenScraper, "https://page.onstove.com/epicseven/global/view/101"),
+])
+async def test_recent_list_answers_fallback_without_refetch(scraper_class, view_url):
+    scraper = scraper_class()
+    api = FakeApi()
+    scraper.make_request = api
+    scraper.hedged_request = api
+
+    listed = await scraper.get_announcements()
+    detail = await scraper.get_announcement_detail(view_url)
+
+    assert api.list_calls == 1
+    assert detail.id == "101"
+    assert detail.content == "업데이트 요약"
+    # 목록에서 돌려준 객체는 바뀌지 않음
+    assert listed[0].content is None
+
+
+@pytest.mark.asyncio
+async def test_miss_refetches_board_once():
+    scraper = LordnineScraper()
+    api = FakeApi()
+    scraper.make_request = api
+    scraper.hedged_request = api
+
+    detail = await scraper.get_update_detail("https://page.onstove.com/l9/global/view/101")
+    missing = await scraper.get_update_detail("https://page.onstove.com/l9/global/view/999")
+
+    assert detail.category == NewsType.UPDATE
+    assert missing is None
+    # 업데이트도 공지사항 게시판을 한 번씩만 조회 (이전에는 get_updates -> get_announcements)
+    assert api.list_calls == 2
+
+
+def test_listed_index_is_bounded(monkeypatch):
+    monkeypatch.setattr("src.scrapers.base.LISTED_INDEX_SIZE", 2)
+    scraper = EpicSevenScraper()
+    news = [scraper._parse_article_data(article, NewsType.ANNOUNCEMENT) for article in LIST_RESPONSE["value"]["list"]]
+    extra = scraper._parse_article_data({**LIST_RESPONSE["value"]["list"][0], "article_id": 102}, NewsType.ANNOUNCEMENT)
+
+    scraper.remember_listed(news)
+    scraper.remember_listed([news[0], extra])
+
+    assert scraper.find_listed("100") is None
+    assert scraper.find_listed("101") is news[0]
+    assert scraper.find_listed("102") is extra
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("game, module, class_name, view_url", [
+    ("lordnine", "src.scrapers.lordnine", "LordnineScraper", "https://page.onstove.com/l9/global/view/101"),
+    ("epic_seven", "src.scrapers.epic_seven", "EpicSevenScraper", "https://page.onstove.com/epicseven/global/view/101"),
+])
+async def test_list_bodies_answer_detail_without_api_call(game, module, class_name, view_url):
+    registry = ScraperRegistry()
+    registry.register(game, module, class_name, game)
+    service = NewsService(registry, enable_search=False)
+    scraper = registry.get(game)
+    api = FakeApi(CONTENT_RESPONSE)
+    scraper.make_request = api
+    scraper.hedged_request = api
+
+    await service.get_news_list(game, NewsType.ANNOUNCEMENT)
+    detail = await service.get_news_detail(game, NewsType.ANNOUNCEMENT, view_url)
+
+    assert api.list_params[0]["content_yn"] == "Y"
+    assert api.detail_calls == 0
+    assert detail.content == "업데이트 본문"
+
+
+@pytest.mark.asyncio
+async def test_list_without_content(monkeypatch):
+    monkeypatch.setitem(LordnineScraper.COMMON_PARAMS, "content_yn", "N")
+    registry = ScraperRegistry()
+    registry.register("lordnine", "src.scrapers.lordnine", "LordnineScraper", "로드나인")
+    service = NewsService(registry, enable_search=False)
+    scraper = registry.get("lordnine")
+    api = FakeApi()
+    scraper.make_request = api
+    scraper.hedged_request = api
+
+    listed = await service.get_news_list("lordnine", NewsType.ANNOUNCEMENT)
+    detail = await service.get_news_detail(
+        "lordnine", NewsType.ANNOUNCEMENT, "https://page.onstove.com/l9/global/view/101"
+    )
+
+    assert api.list_params[0]["content_yn"] == "N"
+    assert listed[0].content is None
+    # 본문이 없으면 상세 API를 시도하고, 실패하면 목록의 summary로 응답
+    assert api.detail_calls >= 1
+    assert detail.content == "업데이트 요약"
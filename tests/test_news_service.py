@@ -0,0 +1,130 @@
+"""뉴스 조회 서비스 테스트"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+
+
+class FakeScraper:
+    """호출 횟수를 기록하는 테스트용 스크래퍼"""
+
+    def __init__(self, timeout: int = 30):
+        self.timeout = timeout
+        self.list_calls = 0
+        self.detail_calls = 0
+        self.delay = 0.0
+
+    def _news(self, news_id: str, category: NewsType) -> GameNews:
+        return GameNews(
+            id=news_id,
+            title=f"뉴스 {news_id}",
+            url=f"https://page.onstove.com/l9/global/view/{news_id}",
+            published_at=datetime(2024, 1, 1),
+            game=GameType.LORDNINE,
+            category=category
+        )
+
+    async def _list(self, category: NewsType, since_id=None):
+        self.list_calls += 1
+        await asyncio.sleep(self.delay)
+        return [self._news("2", category), self._news("1", category)]
+
+    async def get_announcements(self, since_id=None):
+        return await self._list(NewsType.ANNOUNCEMENT, since_id)
+
+    async def get_events(self, since_id=None):
+        return await self._list(NewsType.EVENT, since_id)
+
+    async def get_updates(self, since_id=None):
+        return await self._list(NewsType.UPDATE, since_id)
+
+    async def _detail(self, url: str, category: NewsType):
+        self.detail_calls += 1
+        return self._news(url.rsplit("/", 1)[-1], category)
+
+    async def get_announcement_detail(self, url):
+        return await self._detail(url, NewsType.ANNOUNCEMENT)
+
+    async def get_event_detail(self, url):
+        return await self._detail(url, NewsType.EVENT)
+
+    async def get_update_detail(self, url):
+        return await self._detail(url, NewsType.UPDATE)
+
+
+@pytest.fixture
+def service():
+    registry = ScraperRegistry()
+    registry.register("fake", "tests.test_news_service", "FakeScraper", "테스트")
+    return NewsService(registry, cache_ttl=60, enable_cache=True)
+
+
+class TestNewsService:
+    """캐시 및 warm-up 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_list_is_cached(self, service):
+        first = await service.get_news_list("fake", NewsType.ANNOUNCEMENT)
+        second = await service.get_news_list("fake", NewsType.ANNOUNCEMENT)
+
+        assert [news.model_dump() for news in first] == [news.model_dump() for news in second]
+        assert service.registry.get("fake").list_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_since_id_result_not_cached(self, service):
+        await service.get_news_list("fake", NewsType.EVENT, since_id="1")
+        assert len(service.list_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_prefetch_warms_lists_and_details(self, service):
+        await service.prefetch(detail_top_n=1)
+
+        scraper = service.registry.get("fake")
+        assert service.warmup_complete
+        assert scraper.list_calls == 3
+        assert scraper.detail_calls == 3
+
+        await service.get_news_list("fake", NewsType.UPDATE)
+        assert scraper.list_calls == 3
+
+    @pytest.mark.asyncio
+    async def test_start_prefetch_runs_in_background(self, service):
+        service.registry.get("fake").delay = 0.05
+
+        task = service.start_prefetch()
+        assert not service.warmup_complete
+        assert service.status()["warmup_running"]
+
+        await task
+        assert service.warmup_complete
+
+    @pytest.mark.asyncio
+    async def test_prefetch_counts_failed_targets(self, service):
+        scraper = service.registry.get("fake")
+        scraper.get_events = AsyncMock(side_effect=RuntimeError("업스트림 오류"))
+
+        await service.prefetch()
+
+        assert service.warmup_complete
+        assert service.status()["warmup_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_prefetch_is_not_complete(self, service):
+        service.registry.get("fake").delay = 0.05
+
+        task = service.start_prefetch()
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        status = service.status()
+        assert not status["warmup_complete"]
+        assert not status["warmup_running"]
+        assert status["warmup_error"] == "취소됨"
@@ -0,0 +1,178 @@
+"""OnStove 게시판 여러 페이지 조회 테스트"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.models.game_news import NewsType
+from src.scrapers.epic_seven import EpicSevenScraper
+from src.scrapers.lordnine import LordnineScraper
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+from src.utils.host_limiter import HostLimiter
+
+NEWEST_MS = 1715731200000
+HOUR_MS = 3600 * 1000
+PAGE_SIZE = 20
+
+
+def article(article_id: int, create_ms: int, pinned: bool = False) -> dict:
+    return {
+        "article_id": article_id,
+        "title": f"[공지] {article_id}번 공지",
+        "create_datetime": create_ms,
+        "fixed_yn": "Y" if pinned else "N",
+        "summary": "요약",
+    }
+
+
+class FakeBoard:
+    """page 파라미터에 따라 최신순 페이지를 돌려주는 가짜 make_request"""
+
+    def __init__(self, total: int, broken: int = 0):
+        self.total = total
+        # 페이지마다 앞쪽 게시글 몇 개는 필수 필드가 없어 파싱되지 않음
+        self.broken = broken
+        self.pages = []
+
+    async def __call__(self, url, params=None, **kwargs):
+        page = params["page"]
+        self.pages.append(page)
+        await asyncio.sleep(0.01)
+
+        start = (page - 1) * PAGE_SIZE
+        # 상단 고정 글(아주 오래된 공지)은 모든 페이지 맨 앞에 반복됨
+        articles = [article(1, NEWEST_MS - 1000 * HOUR_MS, pinned=True)]
+        articles += [article(1000 - i, NEWEST_MS - i * HOUR_MS) for i in range(start, min(start + PAGE_SIZE, self.total))]
+        for broken in articles[1:1 + self.broken]:
+            del broken["title"]
+        response = MagicMock()
+        response.json.return_value = {"value": {"list": articles}}
+        return response
+
+
+class TestFetchPages:
+    """페이지 병합 / 조기 종료"""
+
+    @pytest.mark.asyncio
+    async def test_max_pages_merges_and_dedupes_pinned(self):
+        scraper = EpicSevenScraper()
+        board = FakeBoard(total=200)
+        with patch.object(scraper, "make_request", board):
+            news_list, exhausted = await scraper.get_history(NewsType.ANNOUNCEMENT, pages=3)
+
+        ids = [news.id for news in news_list]
+        assert len(ids) == len(set(ids)) == 1 + 3 * PAGE_SIZE
+        assert ids[0] == "1" and ids[-1] == str(1000 - 59)
+        assert sorted(board.pages) == [1, 2, 3]
+        assert not exhausted
+
+    @pytest.mark.asyncio
+    async def test_until_stops_after_crossing_page(self):
+        scraper = EpicSevenScraper()
+        board = FakeBoard(total=1000)
+        until_ts = (NEWEST_MS - 45 * HOUR_MS) // 1000
+        with patch.object(scraper, "make_request", board):
+            news_list, _ = await scraper.get_history(NewsType.ANNOUNCEMENT, pages=50, until_ts=until_ts)
+
+        # 45시간 전 글은 3페이지에 있으므로 3페이지까지만 요청
+        assert sorted(board.pages) == [1, 2, 3]
+        regular = [news for news in news_list if news.id != "1"]
+        assert regular[-1].published_at.timestamp() < until_ts
+
+    @pytest.mark.asyncio
+    async def test_short_page_ends_board(self):
+        scraper = EpicSevenScraper()
+        board = FakeBoard(total=30)
+        with patch.object(scraper, "make_request", board):
+            news_list, exhausted = await scraper.get_history(NewsType.ANNOUNCEMENT, pages=10)
+
+        assert len(news_list) == 31
+        assert max(board.pages) <= 5
+        assert exhausted
+
+    @pytest.mark.asyncio
+    async def test_unparseable_posts_do_not_end_board(self):
+        scraper = EpicSevenScraper()
+        board = FakeBoard(total=100, broken=2)
+        with patch.object(scraper, "make_request", board):
+            news_list, exhausted = await scraper.get_history(NewsType.ANNOUNCEMENT, pages=10)
+
+        # 파싱된 글은 페이지당 18개지만 원본 페이지는 가득 찼으므로 5페이지 모두 조회
+        assert len(news_list) == 1 + 5 * (PAGE_SIZE - 2)
+        assert set(board.pages) >= {1, 2, 3, 4, 5, 6}
+        assert exhausted
+
+    @pytest.mark.asyncio
+    async def test_lordnine_updates_are_filtered(self):
+        scraper = LordnineScraper()
+        board = FakeBoard(total=24)
+        with patch.object(scraper, "make_request", board):
+            updates, exhausted = await scraper.get_history(NewsType.UPDATE, pages=2)
+
+        assert updates == []
+        assert board.pages == [1]
+        assert exhausted
+
+
+class TestHostLimiter:
+    """호스트별 동시 요청 제한"""
+
+    @pytest.mark.asyncio
+    async def test_limits_per_host(self):
+        limiter = HostLimiter(2)
+        active = {"a": 0, "b": 0}
+        peak = {"a": 0, "b": 0}
+
+        async def request(host):
+            async with limiter.slot(f"https://{host}.example.com/list?page=1"):
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+                await asyncio.sleep(0.01)
+                active[host] -= 1
+
+        await asyncio.gather(*(request(host) for host in ["a", "b"] * 5))
+
+        assert peak == {"a": 2, "b": 2}
+
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError):
+            HostLimiter(0)
+
+
+@pytest.mark.asyncio
+async def test_range_query_backfills_history():
+    registry = ScraperRegistry()
+    registry.register("epic_seven", "src.scrapers.epic_seven", "EpicSevenScraper", "에픽세븐")
+    service = NewsService(registry, enable_search=False)
+    board = FakeBoard(total=1000)
+    start_ts = (NEWEST_MS - 50 * HOUR_MS) // 1000
+    end_ts = (NEWEST_MS - 40 * HOUR_MS) // 1000
+
+    with patch.object(registry.get("epic_seven"), "make_request", board):
+        news_list = await service.get_news_range("epic_seven", NewsType.ANNOUNCEMENT, start_ts, end_ts)
+        requested = len(board.pages)
+        await service.get_news_range("epic_seven", NewsType.ANNOUNCEMENT, start_ts, end_ts)
+
+    assert len(news_list) == 11
+    assert len(board.pages) == requested  # 확인한 구간은 다시 요청하지 않음
+
+
+@pytest.mark.asyncio
+async def test_exhausted_board_covers_older_ranges():
+    registry = ScraperRegistry()
+    registry.register("epic_seven", "src.scrapers.epic_seven", "EpicSevenScraper", "에픽세븐")
+    service = NewsService(registry, enable_search=False)
+    board = FakeBoard(total=30)
+    # 게시판의 가장 오래된 글(29시간 전)보다 훨씬 이전부터 조회
+    start_ts = (NEWEST_MS - 100 * HOUR_MS) // 1000
+
+    with patch.object(registry.get("epic_seven"), "make_request", board):
+        news_list = await service.get_news_range("epic_seven", NewsType.ANNOUNCEMENT, start_ts)
+        requested = len(board.pages)
+        older = await service.get_news_range("epic_seven", NewsType.ANNOUNCEMENT, start_ts - 86400, start_ts)
+
+    assert len(news_list) == 30  # 상단 고정 글(1000시간 전)은 범위 밖
+    assert older == []
+    assert len(board.pages) == requested  # 게시판 끝까지 확인했으므로 더 오래된 범위도 다시 요청하지 않음
@@ -0,0 +1,77 @@
+"""경량 게시글 레코드 테스트"""
+
+import gc
+import tracemalloc
+from datetime import datetime, timezone
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.storage.records import ArticleRecord
+
+
+def make_news(i: int) -> GameNews:
+    """테스트용 뉴스 생성"""
+    return GameNews(
+        id=str(10000000 + i),
+        title=f"[공지] {i}차 정기 점검 안내",
+        url=f"https://page.onstove.com/l9/global/view/{10000000 + i}",
+        published_at=datetime(2024, 5, 12, 10, 30),
+        game=GameType.LORDNINE,
+        category=NewsType.ANNOUNCEMENT,
+        summary=f"{i}차 정기 점검이 진행됩니다.",
+        is_important=True,
+        tags=["공지", "점검"],
+        view_count=1234
+    )
+
+
+def bytes_per_item(factory, count: int) -> float:
+    """factory가 만든 객체들이 유지하는 메모리 (건당 바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = factory(count)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(items) == count
+    return (after - before) / count
+
+
+class TestArticleRecord:
+    """ArticleRecord 테스트"""
+
+    def test_round_trip(self):
+        news = make_news(1)
+        restored = ArticleRecord.from_game_news(news).to_game_news()
+
+        assert restored.model_dump() == news.model_dump()
+
+    def test_round_trip_aware_datetime(self):
+        fields = make_news(1).model_dump()
+        fields["published_at"] = datetime(2024, 5, 12, 1, 30, tzinfo=timezone.utc)
+        news = GameNews.from_trusted(**fields)
+        restored = ArticleRecord.from_game_news(news).to_game_news()
+
+        assert restored.published_at == news.published_at
+        assert restored.published_at.tzinfo is not None
+
+    def test_interned_values(self):
+        first = ArticleRecord.from_game_news(make_news(1))
+        second = ArticleRecord.from_game_news(make_news(2))
+
+        assert first.game is second.game
+        assert first.tags[0] is second.tags[0]
+        assert first.key == "lordnine:10000001"
+
+    def test_bytes_per_article(self):
+        count = 2000
+        news_bytes = bytes_per_item(lambda n: [make_news(i) for i in range(n)], count)
+        record_bytes = bytes_per_item(
+            lambda n: [ArticleRecord.from_game_news(make_news(i)) for i in range(n)], count
+        )
+
+        # 측정값: GameNews 약 1,900, ArticleRecord 약 590 bytes/건 (Python 3.11)
+        assert record_bytes < 800
+        assert record_bytes < news_bytes / 2
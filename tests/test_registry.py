@@ -0,0 +1,52 @@
+"""스크래퍼 레지스트리 테스트"""
+
+import subprocess
+import sys
+import os
+
+import pytest
+
+from src.models.exceptions import UnsupportedGameException
+from src.models.game_news import GameType
+from src.scrapers.registry import ScraperRegistry, create_default_registry
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestScraperRegistry:
+    """레지스트리 지연 생성 테스트"""
+
+    def test_default_games(self):
+        registry = create_default_registry()
+        assert registry.names() == ["lordnine", "epic_seven", "lost_ark"]
+        assert registry.loaded() == {}
+
+    def test_lazy_instantiation(self):
+        registry = ScraperRegistry()
+        registry.register("lordnine", "src.scrapers.lordnine", "LordnineScraper", "로드나인")
+
+        assert not registry.is_loaded("lordnine")
+        scraper = registry.get("lordnine")
+
+        assert scraper.game_type == GameType.LORDNINE
+        assert registry.is_loaded("lordnine")
+        assert registry.get("lordnine") is scraper
+
+    def test_unknown_game(self):
+        registry = ScraperRegistry()
+        with pytest.raises(UnsupportedGameException):
+            registry.get("unknown")
+
+    def test_server_import_is_lazy(self):
+        """서버 모듈 import 시 스크래퍼와 playwright를 불러오지 않는지 확인"""
+        code = (
+            "import sys, src.server; "
+            "print(any(m in sys.modules for m in "
+            "('playwright', 'src.scrapers.lost_ark', 'src.scrapers.lordnine', 'src.scrapers.epic_seven')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "False"
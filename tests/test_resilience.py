@@ -0,0 +1,183 @@
+"""재시도 정책 / 서킷 브레이커 테스트"""
+
+import random
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from src.models.exceptions import ApiException, CircuitOpenException, NetworkException
+from src.models.game_news import NewsType
+from src.scrapers.epic_seven import EpicSevenScraper
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+from src.storage.records import ArticleRecord
+from src.utils.resilience import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, RetryPolicy, circuit_breakers, endpoint_key
+)
+
+LIST_URL = "https://api.onstove.com/cwms/v3.0/article_group/BOARD/995/article/list"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRetryPolicy:
+    """decorrelated jitter"""
+
+    def test_delays_are_bounded_and_jittered(self):
+        policy = RetryPolicy(max_retries=50, base_delay=0.1, max_delay=2.0, rng=random.Random(1))
+        delays = list(policy.delays())
+
+        assert len(delays) == 50
+        assert all(0.1 <= delay <= 2.0 for delay in delays)
+        assert len(set(delays)) > 40
+
+    def test_no_retries(self):
+        assert list(RetryPolicy(max_retries=0).delays()) == []
+
+
+class TestCircuitBreaker:
+    """상태 전이"""
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("api", failure_threshold=3, reset_timeout=30, clock=clock)
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record_failure()
+
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenException) as info:
+            breaker.before_call()
+        assert info.value.retry_after == pytest.approx(30)
+
+    def test_half_open_allows_single_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("api", failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 31
+
+        breaker.before_call()
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenException):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        breaker.before_call()
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("api", failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 31
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+        assert breaker.retry_after() == pytest.approx(30)
+
+    def test_abandoned_probe_expires(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("api", failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 31
+        breaker.before_call()  # 결과 없이 취소된 시험 요청
+        clock.now = 62
+
+        breaker.before_call()
+
+    def test_endpoint_key_ignores_ids(self):
+        assert endpoint_key(LIST_URL) == endpoint_key(LIST_URL.replace("995", "1000"))
+        assert endpoint_key(LIST_URL) != endpoint_key("https://api.onstove.com/cwms/v3.0/article")
+
+
+def status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", LIST_URL)
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status, request=request))
+
+
+class TestMakeRequest:
+    """스크래퍼 요청 경로"""
+
+    def scraper(self, responses):
+        scraper = EpicSevenScraper()
+        scraper.retry_policy = RetryPolicy(max_retries=2, base_delay=0, max_delay=0)
+        calls = []
+
+        async def request(method, url, **kwargs):
+            calls.append(url)
+            outcome = responses[min(len(calls), len(responses)) - 1]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        scraper.session = MagicMock()
+        scraper.session.request = request
+        return scraper, calls
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self):
+        ok = MagicMock()
+        scraper, calls = self.scraper([httpx.ConnectError("down"), status_error(503), ok])
+
+        assert await scraper.make_request(LIST_URL) is ok
+        assert len(calls) == 3
+        assert circuit_breakers.get(LIST_URL).state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        scraper, calls = self.scraper([status_error(404)])
+
+        with pytest.raises(ApiException):
+            await scraper.make_request(LIST_URL)
+        assert len(calls) == 1
+        assert circuit_breakers.get(LIST_URL).failures == 0
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        scraper, calls = self.scraper([httpx.ConnectError("down")])
+        for _ in range(2):
+            with pytest.raises(NetworkException):
+                await scraper.make_request(LIST_URL)
+        # 기본 기준 5회: 3 + 2번째 호출 도중 차단되면 재시도 중단
+        assert len(calls) == 5
+        assert circuit_breakers.get(LIST_URL).state == OPEN
+
+        with pytest.raises(CircuitOpenException):
+            await scraper.make_request(LIST_URL.replace("995", "1000"))
+        assert len(calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_service_serves_stale_list_while_open():
+    registry = ScraperRegistry()
+    registry.register("epic_seven", "src.scrapers.epic_seven", "EpicSevenScraper", "에픽세븐")
+    service = NewsService(registry, enable_search=False)
+    stale = ArticleRecord(
+        id="1", title="[공지] 점검", url="https://page.onstove.com/epicseven/global/view/1",
+        published_ts=1715731200, game="epic_seven", category="announcement",
+    )
+    # 만료되었지만 장애 시 응답용 보관 기한(CACHE_MAX_STALE) 안의 목록
+    service.list_cache.set(("epic_seven", "announcement"), (stale,), stored_at=time.time() - 3600)
+
+    scraper = registry.get("epic_seven")
+    scraper.retry_policy = RetryPolicy(max_retries=2, base_delay=0, max_delay=0)
+
+    with patch.object(scraper, "_send", side_effect=NetworkException("down")) as send:
+        # 3 + 2회 실패로 차단될 때까지는 오류 그대로
+        for _ in range(2):
+            with pytest.raises(NetworkException):
+                await service.get_news_list("epic_seven", NewsType.ANNOUNCEMENT)
+        news_list = await service.get_news_list("epic_seven", NewsType.ANNOUNCEMENT)
+
+    assert send.call_count == 5
+    assert [news.id for news in news_list] == ["1"]
+    assert service.status()["open_circuits"] == [endpoint_key(LIST_URL)]
@@ -0,0 +1,118 @@
+"""게시글 수정 이력 테스트"""
+
+from datetime import datetime
+
+import pytest
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+from src.storage.records import ArticleRecord
+from src.storage.revisions import RevisionStore, hash_content
+
+BODY = "점검 일시: 5월 15일 06:00 ~ 10:00\n점검 내용: 서버 안정화\n보상: 다이아 300"
+
+
+def record(title: str = "[점검] 정기 점검 안내", content: str = None, article_id: str = "1",
+           game: str = "lordnine") -> ArticleRecord:
+    return ArticleRecord(
+        id=article_id,
+        title=title,
+        url=f"https://page.onstove.com/l9/global/view/{article_id}",
+        published_ts=1715731200,
+        game=game,
+        category="announcement",
+        content=content,
+    )
+
+
+class TestRevisionStore:
+    """수정 감지 / diff"""
+
+    def test_first_sighting_is_baseline(self):
+        store = RevisionStore()
+
+        assert store.observe(record(content=BODY), now=100) is None
+        assert store.observe(record(content=BODY), now=200) is None
+        assert store.content_hash("lordnine:1") == hash_content(BODY)
+        assert len(store) == 0
+
+    def test_content_edit_records_delta(self):
+        store = RevisionStore()
+        store.observe(record(content=BODY), now=100)
+
+        edited = BODY.replace("10:00", "12:00")
+        revision = store.observe(record(content=edited), now=200)
+
+        assert revision.number == 2
+        assert revision.content_hash == hash_content(edited)
+        assert "-점검 일시: 5월 15일 06:00 ~ 10:00" in revision.diff
+        assert "+점검 일시: 5월 15일 06:00 ~ 12:00" in revision.diff
+        assert "보상" not in revision.diff  # 바뀐 줄 주변만 포함
+
+    def test_title_edit_from_list_record(self):
+        store = RevisionStore()
+        store.observe(record(content=BODY), now=100)
+
+        revision = store.observe(record(title="[점검] 정기 점검 안내 (연장)"), now=200)
+
+        assert revision.diff.splitlines()[-1] == "+[점검] 정기 점검 안내 (연장)"
+        # 본문 없는 목록 레코드는 본문 해시를 바꾸지 않음
+        assert store.content_hash("lordnine:1") == hash_content(BODY)
+
+    def test_first_body_after_list_is_baseline(self):
+        store = RevisionStore()
+        store.observe(record(), now=100)
+
+        assert store.observe(record(content=BODY), now=200) is None
+        assert store.content_hash("lordnine:1") == hash_content(BODY)
+
+    def test_changed_since(self):
+        store = RevisionStore(max_revisions=3)
+        for article_id, game in (("1", "lordnine"), ("2", "epic_seven")):
+            store.observe(record(article_id=article_id, game=game), now=0)
+        for now in range(1, 5):
+            store.observe(record(title=f"제목 {now}", article_id=str(now % 2 + 1),
+                                 game="lordnine" if now % 2 == 0 else "epic_seven"), now=now)
+
+        assert [revision.changed_at for revision in store.changed_since(0)] == [4, 3, 2]
+        assert [revision.changed_at for revision in store.changed_since(3)] == [4, 3]
+        assert [revision.changed_at for revision in store.changed_since(0, game="lordnine")] == [4, 2]
+        assert len(store.changed_since(0, limit=1)) == 1
+
+
+class EditingScraper:
+    """상세 본문이 호출마다 바뀌는 테스트용 스크래퍼"""
+
+    def __init__(self, timeout: int = 30):
+        self.timeout = timeout
+        self.version = 0
+
+    async def get_announcement_detail(self, url):
+        self.version += 1
+        return GameNews(
+            id="5",
+            title="[점검] 긴급 점검",
+            url=url,
+            published_at=datetime(2024, 5, 15),
+            game=GameType.LORDNINE,
+            category=NewsType.ANNOUNCEMENT,
+            content=f"종료 예정: {9 + self.version}:00",
+        )
+
+
+@pytest.mark.asyncio
+async def test_service_tracks_detail_edits():
+    registry = ScraperRegistry()
+    registry.register("lordnine", "tests.test_revisions", "EditingScraper", "테스트")
+    service = NewsService(registry, enable_cache=False, enable_search=False)
+    url = "https://page.onstove.com/l9/global/view/5"
+
+    await service.get_news_detail("lordnine", NewsType.ANNOUNCEMENT, url)
+    await service.get_news_detail("lordnine", NewsType.ANNOUNCEMENT, url)
+
+    revisions = service.changed_since(0)
+    assert [revision.number for revision in revisions] == [2]
+    assert "+종료 예정: 11:00" in revisions[0].diff
+    assert service.changed_since(0, game="epic_seven") == []
+    assert service.status()["revisions"] == 1
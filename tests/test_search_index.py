@@ -0,0 +1,142 @@
+"""전문 검색 인덱스 테스트"""
+
+import pytest
+
+from src.models.game_news import NewsType
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+from src.storage.records import ArticleRecord
+from src.storage.search_index import SearchIndex, bigram_tokens, build_match_query
+
+
+def record(article_id: str, title: str, game: str = "lordnine", category: str = "announcement",
+           published_ts: int = 1715731200, summary: str = None, content: str = None) -> ArticleRecord:
+    return ArticleRecord(
+        id=article_id,
+        title=title,
+        url=f"https://page.onstove.com/l9/global/view/{article_id}",
+        published_ts=published_ts,
+        game=game,
+        category=category,
+        summary=summary,
+        content=content,
+    )
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    index.add([
+        record("1", "[공지] 정기 점검 연장 안내", summary="점검이 연장되었습니다"),
+        record("2", "출석 이벤트 보상 지급", category="event", published_ts=1715731300),
+        record("3", "PvP 시즌 업데이트 안내", game="epic_seven", category="update",
+               published_ts=1715731400, content="시즌 종료 보상을 지급합니다"),
+    ])
+    yield index
+    index.close()
+
+
+def keys(hits):
+    return [hit.key for hit in hits]
+
+
+class TestTokens:
+    """bigram 토큰화 / 검색식 변환"""
+
+    def test_bigram_tokens(self):
+        assert bigram_tokens("점검이 연장 PvP 3차") == ["점검", "검이", "연장", "pvp", "3", "차"]
+        assert bigram_tokens("") == []
+
+    def test_build_match_query(self):
+        assert build_match_query("보상 | 점검 연장") == '("보상") OR ("점검" AND "연장")'
+        assert build_match_query("업데이트") == '("업데 데이 이트")'
+        assert build_match_query("점") == '("점"*)'
+        assert build_match_query("  !! ") is None
+
+
+class TestSearchIndex:
+    """검색 및 증분 갱신"""
+
+    def test_korean_particles_match(self, index):
+        assert keys(index.search("점검")) == ["lordnine:1"]
+        assert keys(index.search("업데이트")) == ["epic_seven:3"]
+        assert keys(index.search("pvp")) == ["epic_seven:3"]
+
+    def test_and_or(self, index):
+        assert keys(index.search("점검 연장")) == ["lordnine:1"]
+        assert keys(index.search("연장 보상")) == []
+        assert set(keys(index.search("보상 OR 점검 연장"))) == {"lordnine:1", "lordnine:2", "epic_seven:3"}
+
+    def test_title_ranks_above_content(self, index):
+        assert keys(index.search("보상")) == ["lordnine:2", "epic_seven:3"]
+
+    def test_filters(self, index):
+        assert keys(index.search("보상", game="epic_seven")) == ["epic_seven:3"]
+        assert keys(index.search("보상", category="event")) == ["lordnine:2"]
+        assert keys(index.search("보상", since_ts=1715731350)) == ["epic_seven:3"]
+        assert keys(index.search("보상", until_ts=1715731350)) == ["lordnine:2"]
+        assert len(index.search("보상 | 점검", limit=1)) == 1
+
+    def test_incremental_update(self, index):
+        assert index.add([record("1", "[공지] 정기 점검 연장 안내", summary="점검이 연장되었습니다")]) == 0
+
+        # 목록 레코드(본문 없음)로 갱신해도 색인된 본문은 유지
+        assert index.add([record("3", "PvP 시즌 업데이트 안내 (수정)", game="epic_seven", category="update",
+                                 published_ts=1715731400)]) == 1
+        assert keys(index.search("종료 보상")) == ["epic_seven:3"]
+        assert index.search("수정")[0].title == "PvP 시즌 업데이트 안내 (수정)"
+
+        index.remove("epic_seven:3")
+        assert keys(index.search("보상")) == ["lordnine:2"]
+        assert len(index) == 2
+
+    def test_same_article_in_two_categories(self, index):
+        # 공지사항 게시판에서 먼저 색인된 업데이트 공지를 업데이트 목록에서 다시 받음
+        assert index.add([record("1", "[공지] 정기 점검 연장 안내", category="update",
+                                 summary="점검이 연장되었습니다")]) == 1
+        assert index.add([record("1", "[공지] 정기 점검 연장 안내", category="update",
+                                 summary="점검이 연장되었습니다")]) == 0
+
+        (announcement,) = index.search("연장", category="announcement")
+        (update,) = index.search("연장", category="update")
+        assert (announcement.key, announcement.category) == ("lordnine:1", "announcement")
+        assert (update.key, update.category) == ("lordnine:1", "update")
+        assert index.categories("lordnine:1") == ["announcement", "update"]
+        assert len(index.search("연장")) == 1
+
+    def test_persistent_index_reloads(self, tmp_path):
+        path = str(tmp_path / "search.db")
+        first = SearchIndex(path)
+        first.add([record("1", "긴급 점검 안내")])
+        first.add([record("1", "긴급 점검 안내", category="update")])
+        first.close()
+
+        second = SearchIndex(path)
+        assert "lordnine:1" in second
+        assert second.add([record("1", "긴급 점검 안내", category="update")]) == 0
+        assert keys(second.search("긴급")) == ["lordnine:1"]
+        assert keys(second.search("긴급", category="update")) == ["lordnine:1"]
+        second.close()
+
+
+class TestServiceIngest:
+    """NewsService 수집 시 색인"""
+
+    @pytest.mark.asyncio
+    async def test_list_and_detail_are_indexed(self):
+        registry = ScraperRegistry()
+        registry.register("fake", "tests.test_news_service", "FakeScraper", "테스트")
+        service = NewsService(registry, cache_ttl=60, enable_cache=False, enable_search=True)
+
+        await service.get_news_list("fake", NewsType.EVENT)
+        await service.get_news_detail("fake", NewsType.EVENT, "https://page.onstove.com/l9/global/view/7")
+
+        assert {hit.key for hit in service.search("뉴스")} == {"lordnine:1", "lordnine:2", "lordnine:7"}
+        assert service.search("뉴스", category=NewsType.ANNOUNCEMENT) == []
+        assert service.status()["indexed_articles"] == 3
+
+    def test_disabled(self):
+        service = NewsService(ScraperRegistry(), enable_search=False)
+
+        assert service.search("점검") == []
+        assert service.status()["indexed_articles"] == 0
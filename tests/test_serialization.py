@@ -0,0 +1,103 @@
+"""일괄 직렬화 테스트"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.storage.records import ArticleRecord
+from src.utils.serialization import (
+    DETAIL_FIELDS,
+    dumps,
+    news_list_to_json,
+    news_list_to_python,
+    news_view,
+    news_views_to_json,
+    records_to_json,
+)
+from src.utils.validators import game_news_list_to_json, serialize_game_news_list
+
+
+def make_news(i: int) -> GameNews:
+    return GameNews(
+        id=str(i),
+        title=f"[공지] {i}차 점검 안내",
+        url=f"https://page.onstove.com/l9/global/view/{i}",
+        published_at=datetime(2024, 5, 12, 10, i % 60, tzinfo=timezone.utc),
+        game=GameType.LORDNINE,
+        category=NewsType.ANNOUNCEMENT,
+        content="본문",
+        summary="요약",
+        tags=["점검"],
+        view_count=i,
+    )
+
+
+@pytest.fixture
+def news_list():
+    return [make_news(i) for i in range(3)]
+
+
+class TestNewsListToJson:
+    """TypeAdapter 기반 일괄 직렬화"""
+
+    def test_matches_per_item_dump(self, news_list):
+        expected = [json.loads(news.model_dump_json()) for news in news_list]
+
+        assert json.loads(news_list_to_json(news_list)) == expected
+        assert json.loads(news_list_to_json(news_list, compact=True)) == expected
+
+    def test_compact_has_no_indentation(self, news_list):
+        compact = news_list_to_json(news_list, compact=True)
+
+        assert "\n" not in compact
+        assert "\n  {" in news_list_to_json(news_list)
+        assert "점검" in compact  # 한글 이스케이프 없음
+
+    def test_trusted_instances(self, news_list):
+        trusted = [ArticleRecord.from_game_news(news).to_game_news() for news in news_list]
+
+        assert news_list_to_json(trusted) == news_list_to_json(news_list)
+
+    def test_python_mode(self, news_list):
+        assert news_list_to_python(news_list) == [news.model_dump() for news in news_list]
+
+    def test_validators_delegate(self, news_list):
+        assert serialize_game_news_list(news_list) == news_list_to_python(news_list)
+        assert game_news_list_to_json(news_list, compact=True) == news_list_to_json(news_list, compact=True)
+
+    def test_empty(self):
+        assert news_list_to_json([]) == "[]"
+
+
+class TestViews:
+    """응답용 필드 선택 직렬화"""
+
+    def test_list_view_shape(self, news_list):
+        data = json.loads(news_views_to_json(news_list))
+
+        assert list(data[0]) == ["id", "title", "url", "published_date", "summary", "tags", "view_count"]
+        assert data[0]["url"] == "https://page.onstove.com/l9/global/view/0"
+        assert data[0]["published_date"] == news_list[0].published_at.isoformat()
+
+    def test_detail_view(self, news_list):
+        view = news_view(news_list[0], DETAIL_FIELDS)
+
+        assert view["category"] == "announcement"
+        assert view["content"] == "본문"
+        assert json.loads(dumps(view))["published_date"] == "2024-05-12T10:00:00+00:00"
+
+
+class TestRecordsToJson:
+    """캐시 레코드 직접 직렬화"""
+
+    def test_matches_model_output(self, news_list):
+        records = [ArticleRecord.from_game_news(news) for news in news_list]
+        from_models = json.loads(news_list_to_json(news_list))
+
+        assert json.loads(records_to_json(records, include_content=True)) == from_models
+
+        without_content = json.loads(records_to_json(iter(records), compact=True))
+        assert all("content" not in item for item in without_content)
+        assert without_content[0]["tags"] == ["점검"]
@@ -0,0 +1,76 @@
+"""since 커서 조회 테스트"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.scrapers.lordnine import LordnineScraper
+from src.utils.helpers import filter_news_since
+
+
+def make_news(news_id: str, published_at: datetime) -> GameNews:
+    """테스트용 뉴스 생성"""
+    return GameNews(
+        id=news_id,
+        title=f"테스트 뉴스 {news_id}",
+        url=f"https://page.onstove.com/l9/global/view/{news_id}",
+        published_at=published_at,
+        game=GameType.LORDNINE,
+        category=NewsType.ANNOUNCEMENT
+    )
+
+
+class TestFilterNewsSince:
+    """filter_news_since 테스트"""
+
+    @pytest.fixture
+    def news_list(self):
+        """최신순 뉴스 목록 (첫 항목은 오래된 상단 고정글)"""
+        now = datetime.now()
+        return [
+            make_news("100", now - timedelta(days=30)),
+            make_news("105", now - timedelta(hours=1)),
+            make_news("104", now - timedelta(hours=2)),
+            make_news("103", now - timedelta(hours=3)),
+        ]
+
+    def test_no_cursor_returns_all(self, news_list):
+        assert len(filter_news_since(news_list)) == 4
+
+    def test_since_id(self, news_list):
+        result = filter_news_since(news_list, since_id="104")
+        assert [news.id for news in result] == ["105"]
+
+    def test_since_id_latest_returns_nothing(self, news_list):
+        assert filter_news_since(news_list, since_id="105") == []
+
+    def test_since_timestamp(self, news_list):
+        since = (datetime.now() - timedelta(hours=2, minutes=30)).astimezone().isoformat()
+        result = filter_news_since(news_list, since=since)
+        assert [news.id for news in result] == ["105", "104"]
+
+
+class TestScraperSinceId:
+    """스크래퍼 조기 중단 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stops_at_known_article(self):
+        base = int(datetime.now().timestamp() * 1000)
+        articles = [
+            {"article_id": 100, "title": "고정 공지", "create_datetime": base - 10**9, "fixed_yn": "Y"},
+            {"article_id": 105, "title": "새 공지", "create_datetime": base - 1000},
+            {"article_id": 104, "title": "받은 공지", "create_datetime": base - 2000},
+            {"article_id": 103, "title": "이전 공지", "create_datetime": base - 3000},
+        ]
+        scraper = LordnineScraper()
+
+        with patch.object(scraper, 'make_request') as mock_request:
+            mock_response = MagicMock()
+            mock_response.json.return_value = {"value": {"list": articles}}
+            mock_request.return_value = mock_response
+
+            news_list = await scraper.get_announcements(since_id="104")
+
+        assert [news.id for news in news_list] == ["100", "105", "104"]
+        assert [news.id for news in filter_news_since(news_list, since_id="104")] == ["105"]
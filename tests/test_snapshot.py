@@ -0,0 +1,123 @@
+"""캐시 스냅샷 저장/복원 테스트"""
+
+import gzip
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+from src.storage.cache import TTLCache
+from src.storage.records import ArticleRecord
+from src.storage.snapshot import collect_entries, read_snapshot, restore_entries, write_snapshot
+
+
+def record(article_id: str, content: str = None) -> ArticleRecord:
+    return ArticleRecord(
+        id=article_id,
+        title=f"[공지] {article_id}번 공지",
+        url=f"https://page.onstove.com/l9/global/view/{article_id}",
+        published_ts=1715731200 + int(article_id),
+        game="lordnine",
+        category="announcement",
+        summary="요약",
+        content=content,
+        tags=("공지",),
+    )
+
+
+class TestSnapshotFile:
+    """파일 형식 / 만료 처리"""
+
+    def test_round_trip_keeps_stored_at(self, tmp_path):
+        path = str(tmp_path / "snapshot.json.gz")
+        lists, details = TTLCache(300), TTLCache(300)
+        lists.set(("lordnine", "announcement"), (record("2"), record("1")), stored_at=1000.0)
+        details.set(("lordnine", "announcement", record("1").url), record("1", content="본문"))
+
+        assert write_snapshot(path, collect_entries({"lists": lists, "details": details})) == 2
+
+        entries = read_snapshot(path, max_age=time.time())
+        restored_lists, restored_details = TTLCache(300), TTLCache(300)
+        assert restore_entries({"lists": restored_lists, "details": restored_details}, entries) == 2
+        assert restored_lists.stored_at(("lordnine", "announcement")) == 1000.0
+        # 저장 시각이 오래되어 만료 상태로 복원됨 (장애 시 응답용)
+        assert restored_lists.get(("lordnine", "announcement")) is None
+        assert [r.id for r in restored_lists.get_stale(("lordnine", "announcement"))] == ["2", "1"]
+        assert restored_details.get(("lordnine", "announcement", record("1").url)).content == "본문"
+
+    def test_max_age_drops_old_entries(self, tmp_path):
+        path = str(tmp_path / "snapshot.json.gz")
+        lists = TTLCache(300)
+        lists.set(("lordnine", "event"), (record("1"),), stored_at=time.time() - 7200)
+        lists.set(("lordnine", "announcement"), (record("2"),))
+        write_snapshot(path, collect_entries({"lists": lists}))
+
+        entries = read_snapshot(path, max_age=3600)
+
+        assert [key for key, _, _ in entries["lists"]] == [("lordnine", "announcement")]
+
+    def test_newer_entry_is_not_overwritten(self):
+        cache = TTLCache(300)
+        cache.set("key", "new", stored_at=2000.0)
+
+        assert restore_entries({"lists": cache}, {"lists": [("key", 1000.0, "old")]}) == 0
+        assert cache.get_stale("key") == "new"
+
+    def test_missing_and_corrupt_files(self, tmp_path):
+        assert read_snapshot(str(tmp_path / "none.json.gz"), max_age=60) == {}
+
+        corrupt = tmp_path / "corrupt.json.gz"
+        corrupt.write_bytes(gzip.compress(b"{")[:-4])
+        with pytest.raises(ValueError):
+            read_snapshot(str(corrupt), max_age=60)
+
+    def test_atomic_replace_leaves_no_temp_files(self, tmp_path):
+        path = str(tmp_path / "nested" / "snapshot.json.gz")
+        write_snapshot(path, {"lists": []})
+        write_snapshot(path, {"lists": []})
+
+        assert os.listdir(tmp_path / "nested") == ["snapshot.json.gz"]
+
+
+class CountingScraper:
+    """호출 횟수를 세는 테스트용 스크래퍼"""
+
+    calls = 0
+
+    def __init__(self, timeout: int = 30):
+        self.timeout = timeout
+
+    async def get_announcements(self, since_id=None):
+        CountingScraper.calls += 1
+        return [GameNews(
+            id="1", title="[공지] 정기 점검", url="https://page.onstove.com/l9/global/view/1",
+            published_at=datetime(2024, 5, 15), game=GameType.LORDNINE,
+            category=NewsType.ANNOUNCEMENT, tags=["점검"],
+        )]
+
+
+@pytest.mark.asyncio
+async def test_service_restart_comes_back_warm(tmp_path):
+    path = str(tmp_path / "snapshot.json.gz")
+    registry = ScraperRegistry()
+    registry.register("lordnine", "tests.test_snapshot", "CountingScraper", "테스트")
+    CountingScraper.calls = 0
+
+    first = NewsService(registry, enable_search=False, snapshot_path=path)
+    await first.get_news_list("lordnine", NewsType.ANNOUNCEMENT)
+    assert await first.save_snapshot() is True
+    assert await first.save_snapshot() is False  # 바뀐 것이 없으면 건너뜀
+    first.close()
+
+    second = NewsService(registry, enable_search=False, snapshot_path=path)
+    assert second.restore_snapshot() == 1
+    news_list = await second.get_news_list("lordnine", NewsType.ANNOUNCEMENT)
+
+    assert [news.id for news in news_list] == ["1"]
+    assert CountingScraper.calls == 1
+    assert [r.id for r in second.tag_index.query(["점검"])] == ["1"]
+    assert second.time_index.covers("lordnine", "announcement", 1715731200, int(time.time()), slack=60)
@@ -0,0 +1,94 @@
+"""태그 역색인 테스트"""
+
+import pytest
+
+from src.models.game_news import NewsType
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+from src.storage.records import ArticleRecord
+from src.storage.tag_index import TagIndex
+
+
+def record(article_id: str, tags, game: str = "lordnine", published_ts: int = 1715731200) -> ArticleRecord:
+    return ArticleRecord(
+        id=article_id,
+        title=f"게시글 {article_id}",
+        url=f"https://page.onstove.com/l9/global/view/{article_id}",
+        published_ts=published_ts,
+        game=game,
+        category="announcement",
+        tags=tuple(tags),
+    )
+
+
+@pytest.fixture
+def index():
+    index = TagIndex()
+    index.add([
+        record("1", ["공지", "점검"], published_ts=100),
+        record("2", ["이벤트"], published_ts=200),
+        record("3", ["점검", "업데이트"], game="epic_seven", published_ts=300),
+        record("4", ["PvP", "업데이트"], game="epic_seven", published_ts=400),
+    ])
+    return index
+
+
+def keys(records):
+    return [record.key for record in records]
+
+
+class TestTagIndex:
+    """태그 질의"""
+
+    def test_or(self, index):
+        assert keys(index.query(["점검", "이벤트"])) == ["epic_seven:3", "lordnine:2", "lordnine:1"]
+
+    def test_and(self, index):
+        assert keys(index.query(["점검", "업데이트"], mode="and")) == ["epic_seven:3"]
+        assert index.query(["점검", "이벤트"], mode="and") == []
+
+    def test_game_filter_and_limit(self, index):
+        assert keys(index.query(["점검"], game="lordnine")) == ["lordnine:1"]
+        assert keys(index.query(["업데이트", "점검"], limit=2)) == ["epic_seven:4", "epic_seven:3"]
+
+    def test_case_insensitive(self, index):
+        assert keys(index.query(["pvp"])) == ["epic_seven:4"]
+
+    def test_unknown_tag_and_mode(self, index):
+        assert index.query(["없는태그"]) == []
+        assert index.query([]) == []
+        with pytest.raises(ValueError):
+            index.query(["점검"], mode="xor")
+
+    def test_retag_moves_postings(self, index):
+        index.add([record("1", ["공지", "이벤트"], published_ts=100)])
+
+        assert keys(index.query(["점검"])) == ["epic_seven:3"]
+        assert keys(index.query(["이벤트"])) == ["lordnine:2", "lordnine:1"]
+        assert len(index) == 4
+
+    def test_remove_and_counts(self, index):
+        index.remove("epic_seven:4")
+
+        assert "epic_seven:4" not in index
+        assert index.tag_counts() == {"점검": 2, "공지": 1, "이벤트": 1, "업데이트": 1}
+        assert index.tag_counts(game="epic_seven") == {"점검": 1, "업데이트": 1}
+
+
+class TestServiceTagQuery:
+    """NewsService 수집 시 태그 색인"""
+
+    @pytest.mark.asyncio
+    async def test_ingested_tags_are_queryable(self):
+        registry = ScraperRegistry()
+        registry.register("fake", "tests.test_news_service", "FakeScraper", "테스트")
+        service = NewsService(registry, cache_ttl=60, enable_cache=False, enable_search=False)
+        service.tag_index.add([record("9", ["점검"])])
+
+        await service.get_news_list("fake", NewsType.ANNOUNCEMENT)
+        result = service.find_by_tags(["점검"])
+
+        assert [news.id for news in result] == ["9"]
+        assert "lordnine:1" in service.tag_index and "lordnine:2" in service.tag_index
+        assert service.registry.get("fake").list_calls == 1
+        assert service.status()["indexed_tags"] == 1
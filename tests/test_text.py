@@ -0,0 +1,58 @@
+"""텍스트 정규화 테스트"""
+
+from html import unescape
+
+import pytest
+
+from src.utils.helpers import clean_text
+from src.utils.text import normalize_text
+from src.utils.validators import normalize_game_news_data, sanitize_html
+
+
+class TestNormalizeText:
+    """normalize_text 테스트"""
+
+    def test_plain_text_fast_path(self):
+        assert normalize_text("  [공지]   정기   점검\t안내 \n") == "[공지] 정기 점검 안내"
+        assert normalize_text("") == ""
+        assert normalize_text(None) == ""
+
+    def test_strips_tags(self):
+        assert normalize_text("<p>로드<b>나인</b></p>  <br>입니다") == "로드나인 입니다"
+
+    @pytest.mark.parametrize("text", [
+        "&amp;lt;b&amp;gt;",
+        "&lt;필독&gt; &quot;이벤트&quot; &#39;보상&#39;",
+        "&copy; 2024 &hellip; &#x27;q&#x27; &#039;",
+        "&amp;amp; &amp;nbsp;",
+        "a&b &ltx &amp",
+    ])
+    def test_entities_decoded_once(self, text):
+        assert normalize_text(text) == " ".join(unescape(text).split())
+
+    def test_decoded_entities_are_not_tags(self):
+        assert normalize_text("&lt;b&gt;강조&lt;/b&gt; <i>기울임</i>") == "<b>강조</b> 기울임"
+
+    def test_nbsp_is_whitespace(self):
+        assert normalize_text("점검&nbsp;&nbsp;안내") == "점검 안내"
+
+    def test_keep_newlines(self):
+        text = " 첫 줄  \n\n  둘째&nbsp;줄 \r\n <b>셋째</b> "
+
+        assert normalize_text(text, keep_newlines=True) == "첫 줄\n둘째 줄\n셋째"
+
+    def test_legacy_wrappers_delegate(self):
+        text = "<p>&amp;lt; 안내 &gt;</p>"
+
+        assert clean_text(text) == sanitize_html(text) == normalize_text(text) == "&lt; 안내 >"
+
+    def test_normalize_game_news_data(self):
+        data = normalize_game_news_data({
+            "title": "<b>[공지]</b> 점검&nbsp;안내",
+            "content": "<p>1줄</p>\n<p>2줄</p>",
+            "summary": "요약 &amp; 정리",
+        })
+
+        assert data["title"] == "[공지] 점검 안내"
+        assert data["content"] == "1줄\n2줄"
+        assert data["summary"] == "요약 & 정리"
@@ -0,0 +1,163 @@
+"""발행 시각 범위 색인 테스트"""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+from src.storage.records import ArticleRecord
+from src.storage.time_index import TimeIndex
+
+
+def record(article_id: str, published_ts: int, category: str = "announcement") -> ArticleRecord:
+    return ArticleRecord(
+        id=article_id,
+        title=f"게시글 {article_id}",
+        url=f"https://page.onstove.com/l9/global/view/{article_id}",
+        published_ts=published_ts,
+        game="lordnine",
+        category=category,
+    )
+
+
+@pytest.fixture
+def index():
+    index = TimeIndex()
+    index.add([record(str(ts), ts) for ts in (300, 100, 500, 200, 400)])
+    index.add([record("e", 250, category="event")])
+    return index
+
+
+def ids(records):
+    return [record.id for record in records]
+
+
+class TestTimeIndex:
+    """범위 조회 / 확인 구간"""
+
+    def test_range_newest_first(self, index):
+        assert ids(index.range("lordnine", "announcement", 200, 400)) == ["400", "300", "200"]
+        assert ids(index.range("lordnine", "announcement", start_ts=350)) == ["500", "400"]
+        assert ids(index.range("lordnine", "announcement", end_ts=150)) == ["100"]
+        assert ids(index.range("lordnine", "announcement", limit=2)) == ["500", "400"]
+        assert ids(index.range("lordnine", "event")) == ["e"]
+        assert index.range("epic_seven", "announcement") == []
+
+    def test_update_moves_entry(self, index):
+        index.add([record("300", 600)])
+
+        assert ids(index.range("lordnine", "announcement", 250, 350)) == []
+        assert ids(index.range("lordnine", "announcement", limit=1)) == ["300"]
+        assert len(index) == 6
+
+        index.remove("lordnine:300")
+        assert "lordnine:300" not in index
+        assert ids(index.range("lordnine", "announcement", limit=1)) == ["500"]
+
+    def test_same_article_in_two_categories(self, index):
+        index.add([record("300", 300, category="update")])
+
+        assert ids(index.range("lordnine", "announcement", 250, 350)) == ["300"]
+        assert ids(index.range("lordnine", "update")) == ["300"]
+
+        # 마지막에 들어온 레코드와 관계없이 요청한 카테고리로 반환
+        index.add([record("300", 700)])
+        (update,) = index.range("lordnine", "update")
+        assert (update.id, update.category) == ("300", "update")
+        (latest,) = index.range("lordnine", "announcement", limit=1)
+        assert (latest.id, latest.category) == ("300", "announcement")
+        assert ids(index.range("lordnine", "announcement", limit=1)) == ["300"]
+        assert ids(index.range("lordnine", "announcement", 250, 350)) == []
+
+        index.remove("lordnine:300")
+        assert index.range("lordnine", "update") == []
+
+    def test_coverage_merge(self, index):
+        index.mark_covered("lordnine", "announcement", 100, 200)
+        index.mark_covered("lordnine", "announcement", 300, 400)
+        assert not index.covers("lordnine", "announcement", 150, 350)
+
+        index.mark_covered("lordnine", "announcement", 180, 320)
+        assert index.coverage("lordnine", "announcement") == [(100, 400)]
+        assert index.covers("lordnine", "announcement", 150, 350)
+        assert not index.covers("lordnine", "announcement", 50, 350)
+        assert index.covers("lordnine", "announcement", 150, 450, slack=60)
+        assert not index.covers("lordnine", "event", 150, 350)
+
+
+class RangeScraper:
+    """최근 3일치 목록을 반환하는 테스트용 스크래퍼"""
+
+    def __init__(self, timeout: int = 30):
+        self.timeout = timeout
+        self.list_calls = 0
+
+    def _listing(self, category: NewsType):
+        self.list_calls += 1
+        now = datetime.now()
+        return [
+            GameNews(
+                id=str(days),
+                title=f"{days}일 전 공지",
+                url=f"https://page.onstove.com/l9/global/view/{days}",
+                published_at=now - timedelta(days=days),
+                game=GameType.LORDNINE,
+                category=category,
+            )
+            for days in (0, 1, 2)
+        ]
+
+    async def get_announcements(self, since_id=None):
+        return self._listing(NewsType.ANNOUNCEMENT)
+
+    async def get_updates(self, since_id=None):
+        # 같은 글이 업데이트 게시판에도 올라온 경우
+        return self._listing(NewsType.UPDATE)
+
+
+class TestServiceRange:
+    """NewsService 범위 조회"""
+
+    @pytest.fixture
+    def service(self):
+        registry = ScraperRegistry()
+        # 색인은 레코드의 게임 이름을 키로 쓰므로 실제 게임 이름으로 등록
+        registry.register("lordnine", "tests.test_time_index", "RangeScraper", "테스트")
+        return NewsService(registry, cache_ttl=60, enable_cache=False, enable_search=False)
+
+    @pytest.mark.asyncio
+    async def test_covered_range_answered_from_index(self, service):
+        now = int(time.time())
+
+        first = await service.get_news_range("lordnine", NewsType.ANNOUNCEMENT, now - 86400 * 3 // 2, None)
+        second = await service.get_news_range("lordnine", NewsType.ANNOUNCEMENT, now - 86400 * 3 // 2, now)
+
+        assert [news.id for news in first] == ["0", "1"]
+        assert [news.id for news in second] == ["0", "1"]
+        assert service.registry.get("lordnine").list_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_uncovered_range_fetches_upstream(self, service):
+        now = int(time.time())
+        await service.get_news_range("lordnine", NewsType.ANNOUNCEMENT, now - 86400, None)
+
+        # 목록 마지막 글(2일 전)보다 오래된 범위는 확인하지 못한 구간
+        older = await service.get_news_range("lordnine", NewsType.ANNOUNCEMENT, now - 86400 * 10, now - 86400 * 3 // 2)
+
+        assert [news.id for news in older] == ["2"]
+        assert service.registry.get("lordnine").list_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_range_reports_requested_category(self, service):
+        start = int(time.time()) - 86400 * 3 // 2
+        await service.get_news_range("lordnine", NewsType.ANNOUNCEMENT, start)
+        await service.get_news_range("lordnine", NewsType.UPDATE, start)
+        # 공지사항 범위는 색인으로 답하며, 마지막에 업데이트로 들어온 레코드도 공지사항으로 표시
+        announcements = await service.get_news_range("lordnine", NewsType.ANNOUNCEMENT, start)
+
+        assert service.registry.get("lordnine").list_calls == 2
+        assert {news.category for news in announcements} == {NewsType.ANNOUNCEMENT}
+        assert service.other_categories(announcements[0]) == ["update"]
@@ -0,0 +1,94 @@
+"""타임스탬프 파싱 테스트"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.utils.timestamps import KST, detected_formats, parse_timestamp
+
+UTC = timezone.utc
+
+
+class TestParseTimestamp:
+    """parse_timestamp 테스트"""
+
+    @pytest.mark.parametrize("value, expected", [
+        (1715731200000, datetime(2024, 5, 15, tzinfo=UTC)),
+        (1715731200, datetime(2024, 5, 15, tzinfo=UTC)),
+        ("1715731200000", datetime(2024, 5, 15, tzinfo=UTC)),
+        (1715731200.5, datetime(2024, 5, 15, 0, 0, 0, 500000, tzinfo=UTC)),
+    ])
+    def test_epoch(self, value, expected):
+        assert parse_timestamp(value) == expected
+
+    def test_iso(self):
+        assert parse_timestamp("2024-05-12T10:30:00Z") == datetime(2024, 5, 12, 10, 30, tzinfo=UTC)
+        assert parse_timestamp("2024-05-12T19:30:00+09:00") == datetime(2024, 5, 12, 10, 30, tzinfo=UTC)
+
+    @pytest.mark.parametrize("text, expected", [
+        ("2024.05.12", datetime(2024, 5, 12)),
+        ("2024. 5. 2.", datetime(2024, 5, 2)),
+        ("2024.05.12 18:30", datetime(2024, 5, 12, 18, 30)),
+        ("2024/05/12", datetime(2024, 5, 12)),
+        ("등록일 2024.05.12", datetime(2024, 5, 12)),
+        ("2024년 5월 12일", datetime(2024, 5, 12)),
+        ("2024년 05월 12일 (일) 오후 3:20", datetime(2024, 5, 12, 15, 20)),
+        ("2024년 5월 12일 오전 12:05", datetime(2024, 5, 12, 0, 5)),
+        ("2024년 5월 12일 15시 20분", datetime(2024, 5, 12, 15, 20)),
+    ])
+    def test_board_dates_in_kst(self, text, expected):
+        result = parse_timestamp(text, default_tz=KST)
+
+        assert result.tzinfo == UTC
+        assert result == expected.replace(tzinfo=KST)
+
+    def test_naive_values_default_to_utc(self):
+        assert parse_timestamp("2024-05-12 10:30") == datetime(2024, 5, 12, 10, 30, tzinfo=UTC)
+        assert parse_timestamp(datetime(2024, 5, 12)) == datetime(2024, 5, 12, tzinfo=UTC)
+
+    def test_aware_datetime_normalized_to_utc(self):
+        value = datetime(2024, 5, 12, 9, 0, tzinfo=KST)
+
+        assert parse_timestamp(value).tzinfo == UTC
+        assert parse_timestamp(value) == value
+
+    def test_format_remembered_per_source(self):
+        parse_timestamp("2023.01.02", source="test.board")
+        assert detected_formats()["test.board"] == "dotted"
+
+        # 같은 출처에서 형식이 바뀌어도 다시 판별
+        assert parse_timestamp("2023-01-02T00:00:00", source="test.board") == datetime(2023, 1, 2, tzinfo=UTC)
+        assert detected_formats()["test.board"] == "iso"
+
+    @pytest.mark.parametrize("value", ["", "어제", "2024.13.40", True, None])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_timestamp(value)
+
+
+class TestAwarePublishedAt:
+    """timezone-aware 발행 일시 검증"""
+
+    def test_aware_published_at_is_accepted(self):
+        news = GameNews(
+            id="1",
+            title="공지",
+            url="https://page.onstove.com/l9/global/view/1",
+            published_at=parse_timestamp("2024.05.12", default_tz=KST),
+            game=GameType.LORDNINE,
+            category=NewsType.ANNOUNCEMENT,
+        )
+
+        assert news.published_at == datetime(2024, 5, 11, 15, tzinfo=UTC)
+
+    def test_future_aware_published_at_is_rejected(self):
+        with pytest.raises(ValueError):
+            GameNews(
+                id="1",
+                title="공지",
+                url="https://page.onstove.com/l9/global/view/1",
+                published_at=datetime.now(UTC) + timedelta(days=1),
+                game=GameType.LORDNINE,
+                category=NewsType.ANNOUNCEMENT,
+            )
@@ -5,6 +5,7 @@ import asyncio
 from unittest.mock import AsyncMock, patch
 from datetime import datetime
 
+from src.models.exceptions import InvalidUrlException
 from src.models.game_news import GameNews, NewsType, GameType
 from src.scrapers.epic_seven import EpicSevenScraper
 from src.scrapers.lordnine import LordnineScraper
@@ -31,6 +32,37 @@ class TestBasicFunctionality:
         assert news.category == NewsType.ANNOUNCEMENT
         assert isinstance(news.published_at, datetime)
     
+    def test_trusted_game_news_matches_validated(self):
+        """검증 없이 생성한 GameNews가 검증 생성 결과와 같은지 테스트"""
+        fields = dict(
+            id="test-1",
+            title="테스트 뉴스",
+            url="https://example.com/news/1",
+            published_at=datetime.now(),
+            game=GameType.EPIC_SEVEN,
+            category=NewsType.ANNOUNCEMENT,
+            tags=["공지"]
+        )
+        
+        trusted = GameNews.from_trusted(**fields)
+        validated = GameNews(**fields)
+        
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.model_dump_json() == validated.model_dump_json()
+        assert trusted.game == GameType.EPIC_SEVEN
+    
+    @pytest.mark.parametrize("trusted_ingest", [True, False])
+    def test_create_game_news_validates_url(self, trusted_ingest):
+        """신뢰 모드에서도 create_game_news가 URL을 검증하는지 테스트"""
+        scraper = EpicSevenScraper()
+        scraper.trusted_ingest = trusted_ingest
+        
+        with pytest.raises(InvalidUrlException):
+            scraper.create_game_news(
+                id="1", title="공지", url="not a url",
+                published_at=datetime.now(), category=NewsType.ANNOUNCEMENT
+            )
+    
     def test_epic_seven_scraper_init(self):
         """에픽세븐 스크래퍼 초기화 테스트"""
         scraper = EpicSevenScraper()
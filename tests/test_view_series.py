@@ -0,0 +1,103 @@
+"""조회수 시계열 / 인기 급상승 테스트"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.models.game_news import GameNews, GameType, NewsType
+from src.scrapers.registry import ScraperRegistry
+from src.services.news_service import NewsService
+from src.storage.records import ArticleRecord
+from src.storage.view_series import ViewSeriesStore
+
+PUBLISHED = 1715731200
+
+
+def record(article_id: str, views: int, game: str = "lordnine", published_ts: int = PUBLISHED) -> ArticleRecord:
+    return ArticleRecord(
+        id=article_id,
+        title=f"{article_id}번 게시글",
+        url=f"https://page.onstove.com/l9/global/view/{article_id}",
+        published_ts=published_ts,
+        game=game,
+        category="announcement",
+        view_count=views,
+    )
+
+
+class TestViewSeriesStore:
+    """표본 저장 / 증가량"""
+
+    def test_velocity_over_window(self):
+        store = ViewSeriesStore(window=3600)
+        old = PUBLISHED - 86400  # 구간 밖에서 올라온 글
+        store.observe(record("1", 1000, published_ts=old), now=PUBLISHED)
+        store.observe(record("1", 1500, published_ts=old), now=PUBLISHED + 1800)
+        store.observe(record("1", 2000, published_ts=old), now=PUBLISHED + 3600)
+
+        (entry,) = store.trending(now=PUBLISHED + 3600)
+        assert entry.velocity == pytest.approx(1000.0)
+        assert entry.views == 2000
+
+    def test_new_article_counts_from_publish(self):
+        store = ViewSeriesStore(window=3600)
+        store.observe(record("1", 600), now=PUBLISHED + 1800)
+
+        assert store.trending(now=PUBLISHED + 1800)[0].velocity == pytest.approx(1200.0)
+
+    def test_single_old_sample_has_no_velocity(self):
+        store = ViewSeriesStore(window=3600)
+        store.observe(record("1", 600, published_ts=PUBLISHED - 86400), now=PUBLISHED)
+
+        assert store.trending(now=PUBLISHED) == []
+
+    def test_close_samples_overwrite_and_out_of_order_ignored(self):
+        store = ViewSeriesStore(min_interval=60)
+        store.observe(record("1", 10), now=PUBLISHED + 100)
+        store.observe(record("1", 12), now=PUBLISHED + 130)
+        store.observe(record("1", 5), now=PUBLISHED + 50)
+
+        assert store.samples("lordnine:1") == [(PUBLISHED + 130, 12)]
+
+    def test_downsampling_keeps_bounded_history(self):
+        store = ViewSeriesStore(max_samples=8, min_interval=0)
+        for i in range(100):
+            store.observe(record("1", i * 10), now=PUBLISHED + i * 60)
+
+        samples = store.samples("lordnine:1")
+        assert len(samples) <= 8
+        assert samples[-1] == (PUBLISHED + 99 * 60, 990)
+        assert samples == sorted(samples)
+
+    def test_ranking_filter_and_stale_entries(self):
+        store = ViewSeriesStore(window=3600)
+        store.observe(record("1", 100), now=PUBLISHED + 3600)
+        store.observe(record("2", 900), now=PUBLISHED + 3600)
+        store.observe(record("3", 500, game="epic_seven"), now=PUBLISHED + 3600)
+
+        assert [e.record.id for e in store.trending(now=PUBLISHED + 3600)] == ["2", "3", "1"]
+        assert [e.record.id for e in store.trending(now=PUBLISHED + 3600, game="epic_seven")] == ["3"]
+        assert store.trending(now=PUBLISHED + 3 * 3600) == []
+
+    def test_max_articles_evicts_least_recent(self):
+        store = ViewSeriesStore(max_articles=2)
+        for article_id in ("1", "2", "1", "3"):
+            store.observe(record(article_id, 10), now=PUBLISHED)
+
+        assert "lordnine:1" in store and "lordnine:3" in store and "lordnine:2" not in store
+
+
+def test_service_ingest_tracks_views():
+    service = NewsService(ScraperRegistry(), enable_search=False)
+    now = datetime.now(timezone.utc).timestamp()
+    news = GameNews(
+        id="1", title="[이벤트] 출석 체크", url="https://page.onstove.com/l9/global/view/1",
+        published_at=datetime.fromtimestamp(now - 1800, tz=timezone.utc),
+        game=GameType.LORDNINE, category=NewsType.EVENT, view_count=300,
+    )
+    service._ingest((ArticleRecord.from_game_news(news),), now=now)
+
+    ((result, entry),) = service.trending()
+    assert result.id == "1"
+    assert entry.velocity == pytest.approx(600.0, rel=0.01)
+    assert service.status()["tracked_view_series"] == 1